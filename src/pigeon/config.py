@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
@@ -14,6 +14,31 @@ class Config:
     poll_interval: int
     inbox_dir: str
     google_profile: str
+    state_save_interval: int = 10
+    max_parallel_downloads: int = 2
+    drive_cache_dir: str = "~/.cache/pigeon/drive"
+    drive_cache_max_mb: int = 512
+
+    # Resolved paths, computed once at construction
+    _inbox_dir_resolved: Path = field(init=False, repr=False, compare=False)
+    _profile_dir: Path = field(init=False, repr=False, compare=False)
+    _state_file: Path = field(init=False, repr=False, compare=False)
+    _drive_cache_dir: Path = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Resolve filesystem paths once so accessors are attribute reads."""
+        self._inbox_dir_resolved = Path(self.inbox_dir).expanduser().resolve()
+        self._profile_dir = (
+            Path.home()
+            / ".config"
+            / "google-personal-mcp"
+            / "profiles"
+            / self.google_profile
+        )
+        self._state_file = (
+            Path(__file__).parent.parent.parent / "tmp" / "pigeon-state.jsonl"
+        )
+        self._drive_cache_dir = Path(self.drive_cache_dir).expanduser()
 
     @classmethod
     def from_env(cls) -> "Config":
@@ -36,6 +61,10 @@ class Config:
         poll_interval = int(os.getenv("PIGEON_POLL_INTERVAL", "30"))
         inbox_dir = os.getenv("PIGEON_INBOX_DIR", "../../dev_notes/inbox")
         google_profile = os.getenv("PIGEON_GOOGLE_PROFILE", "default")
+        state_save_interval = int(os.getenv("PIGEON_STATE_SAVE_INTERVAL", "10"))
+        max_parallel_downloads = int(os.getenv("PIGEON_MAX_PARALLEL_DOWNLOADS", "2"))
+        drive_cache_dir = os.getenv("PIGEON_DRIVE_CACHE_DIR", "~/.cache/pigeon/drive")
+        drive_cache_max_mb = int(os.getenv("PIGEON_DRIVE_CACHE_MAX_MB", "512"))
 
         # Validate
         config = cls(
@@ -43,6 +72,10 @@ class Config:
             poll_interval=poll_interval,
             inbox_dir=inbox_dir,
             google_profile=google_profile,
+            state_save_interval=state_save_interval,
+            max_parallel_downloads=max_parallel_downloads,
+            drive_cache_dir=drive_cache_dir,
+            drive_cache_max_mb=drive_cache_max_mb,
         )
         config.validate()
         return config
@@ -56,21 +89,30 @@ class Config:
         if self.poll_interval <= 0:
             raise ValueError(f"poll_interval must be positive, got {self.poll_interval}")
 
+        if self.state_save_interval < 0:
+            raise ValueError(
+                f"state_save_interval must be non-negative, got {self.state_save_interval}"
+            )
+
+        if self.max_parallel_downloads <= 0:
+            raise ValueError(
+                f"max_parallel_downloads must be positive, got {self.max_parallel_downloads}"
+            )
+
+        if self.drive_cache_max_mb < 0:
+            raise ValueError(
+                f"drive_cache_max_mb must be non-negative, got {self.drive_cache_max_mb}"
+            )
+
         # Ensure inbox directory exists or can be created
-        inbox_path = Path(self.inbox_dir).expanduser().resolve()
+        inbox_path = self._inbox_dir_resolved
         try:
             inbox_path.mkdir(parents=True, exist_ok=True)
         except OSError as e:
             raise ValueError(f"Cannot access inbox directory {self.inbox_dir}: {e}")
 
         # Validate google profile directory exists
-        profile_dir = (
-            Path.home()
-            / ".config"
-            / "google-personal-mcp"
-            / "profiles"
-            / self.google_profile
-        )
+        profile_dir = self._profile_dir
         if not profile_dir.exists():
             raise ValueError(
                 f"Google profile directory not found: {profile_dir}. "
@@ -83,13 +125,7 @@ class Config:
         Returns:
             Path: Path to the Google profile directory.
         """
-        return (
-            Path.home()
-            / ".config"
-            / "google-personal-mcp"
-            / "profiles"
-            / self.google_profile
-        )
+        return self._profile_dir
 
     def get_inbox_dir(self) -> Path:
         """Get the absolute path to the inbox directory.
@@ -97,12 +133,28 @@ class Config:
         Returns:
             Path: Absolute path to the inbox directory.
         """
-        return Path(self.inbox_dir).expanduser().resolve()
+        return self._inbox_dir_resolved
+
+    def get_drive_cache_dir(self) -> Path:
+        """Get the local cache directory for downloaded Drive files.
+        
+        Returns:
+            Path: Path to the Drive download cache.
+        """
+        return self._drive_cache_dir
 
     def get_state_file(self) -> Path:
         """Get the state file path.
         
         Returns:
-            Path: Path to the pigeon state file.
+            Path: Path to the pigeon state log (JSON Lines).
+        """
+        return self._state_file
+
+    def get_folder_cache_file(self) -> Path:
+        """Get the folder ID cache file path.
+        
+        Returns:
+            Path: Path to the persisted Drive folder ID cache.
         """
-        return Path(__file__).parent.parent.parent / "tmp" / "pigeon-state.json"
+        return Path(__file__).parent.parent.parent / "tmp" / "pigeon-folder-cache.json"
@@ -2,22 +2,56 @@
 
 import os
 import json
-import re
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
-from google.auth.transport.requests import Request
+from typing import Dict, List, Optional, Tuple
+from google.auth.transport.requests import AuthorizedSession, Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.exceptions import RefreshError
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
-import io
+from googleapiclient.errors import HttpError
+import httplib2
+from requests.adapters import HTTPAdapter
 
 from .config import Config
 
 logger = logging.getLogger(__name__)
 
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+
+# Bytes read from a download response per local write
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+
+# Files larger than this are fetched as parallel byte ranges, split into
+# at most this many concurrent range requests after the first
+PARALLEL_DOWNLOAD_THRESHOLD = 8 * 1024 * 1024
+PARALLEL_DOWNLOAD_PARTS = 8
+
+# Endpoint for direct media downloads over the pooled session
+DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
+
+# Folders combined into one files.list query, keeping the query string short
+MAX_QUERY_PARENTS = 50
+
+# Seconds a files.get metadata lookup is reused, and the most entries kept
+METADATA_TTL = 60
+METADATA_CACHE_SIZE = 1024
+
+# Changes fetched per changes.list page; small pages keep each request well
+# under the API timeout on busy drives
+CHANGES_PAGE_SIZE = 100
+
+# Filename sanitization in a single C-level pass: spaces become hyphens and
+# characters unsafe in filenames are dropped
+_SANITIZE_TABLE = str.maketrans({" ": "-", **dict.fromkeys('<>:"/\\|?*()')})
+
 # Google Drive API scopes
 SCOPES = [
     "https://www.googleapis.com/auth/drive.readonly",
@@ -25,28 +59,48 @@ SCOPES = [
 ]
 
 
-def sanitize_filename(original: str) -> str:
-    """Sanitize filename by removing spaces and special characters.
+@lru_cache(maxsize=1024)
+def _sanitize_parts(original: str) -> Tuple[str, str]:
+    """Sanitize a filename, returning its stem and extension separately.
     
     Args:
         original: Original filename.
         
     Returns:
-        Sanitized filename with extension preserved.
+        Tuple of (sanitized stem, extension including the dot).
     """
     # Split filename and extension
     name, ext = os.path.splitext(original)
     
-    # Replace spaces with hyphens
-    name = name.replace(" ", "-")
-    
-    # Remove or replace special characters
-    # Keep only alphanumeric, hyphens, underscores, and dots
-    name = re.sub(r'[<>:"/\\|?*()]', '', name)
+    # Replace spaces with hyphens and remove special characters
+    return name.translate(_SANITIZE_TABLE), ext
+
+
+def sanitize_filename(original: str) -> str:
+    """Sanitize filename by removing spaces and special characters.
     
+    Args:
+        original: Original filename.
+        
+    Returns:
+        Sanitized filename with extension preserved.
+    """
+    name, ext = _sanitize_parts(original)
     return name + ext
 
 
+def _escape_query(value: str) -> str:
+    """Escape a string literal for use in a Drive query.
+
+    Args:
+        value: Raw string value.
+
+    Returns:
+        Value with backslashes and single quotes escaped.
+    """
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
 def create_timestamped_filename(original: str) -> str:
     """Create a timestamped filename.
     
@@ -56,13 +110,12 @@ def create_timestamped_filename(original: str) -> str:
     Returns:
         Timestamped and sanitized filename.
     """
-    from datetime import datetime
-    
-    sanitized = sanitize_filename(original)
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    
-    # Split filename and extension
-    name, ext = os.path.splitext(sanitized)
+    name, ext = _sanitize_parts(original)
+    now = datetime.now()
+    timestamp = (
+        f"{now.year:04d}-{now.month:02d}-{now.day:02d}_"
+        f"{now.hour:02d}-{now.minute:02d}-{now.second:02d}"
+    )
     
     return f"{timestamp}_{name}{ext}"
 
@@ -81,8 +134,15 @@ class DriveClient:
         """
         self.config = config
         self.service = None
+        self._credentials = None
+        self._session: Optional[AuthorizedSession] = None
+        self._thread_local = threading.local()
         self._folder_id_cache: Dict[str, str] = {}
+        # file ID -> (expiry on the monotonic clock, metadata)
+        self._metadata_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._metadata_lock = threading.Lock()
         self._authenticate()
+        self._folder_id_cache = self._load_folder_cache()
 
     def _authenticate(self) -> None:
         """Authenticate with Google Drive API.
@@ -127,17 +187,67 @@ class DriveClient:
             with open(token_path, "w") as token_file:
                 token_file.write(creds.to_json())
 
-        self.service = build("drive", "v3", credentials=creds)
+        self._credentials = creds
+        self._session = self._build_session(creds)
+        # Use the discovery document bundled with google-api-python-client
+        # so startup never fetches it over the network
+        self.service = build(
+            "drive",
+            "v3",
+            credentials=creds,
+            static_discovery=True,
+            cache_discovery=False,
+        )
         logger.info("Successfully authenticated with Google Drive")
 
-    def list_folder_files(self, folder_path: str) -> List[Dict]:
+    def list_folder_files(
+        self, folder_path: str, since: Optional[str] = None
+    ) -> List[Dict]:
         """List files in a Google Drive folder.
         
         Args:
             folder_path: Path to folder (e.g., "/Voice Recordings").
+            since: Optional RFC 3339 timestamp; only files modified at or
+                after it are returned.
             
         Returns:
-            List of file metadata dicts with keys: id, name, mimeType, modifiedTime.
+            List of file metadata dicts with keys: id, name, mimeType,
+            modifiedTime, size.
+        """
+        return self._list_folder(
+            folder_path, "id, name, mimeType, modifiedTime, size", since
+        )
+
+    def list_folder_file_ids(
+        self, folder_path: str, since: Optional[str] = None
+    ) -> List[str]:
+        """List only the IDs of files in a Google Drive folder.
+
+        Much smaller responses than list_folder_files; fetch metadata with
+        get_file_metadata for the IDs that turn out to be new.
+
+        Args:
+            folder_path: Path to folder (e.g., "/Voice Recordings").
+            since: Optional RFC 3339 timestamp; only files modified at or
+                after it are returned.
+
+        Returns:
+            List of file IDs.
+        """
+        return [f["id"] for f in self._list_folder(folder_path, "id", since)]
+
+    def _list_folder(
+        self, folder_path: str, file_fields: str, since: Optional[str]
+    ) -> List[Dict]:
+        """List files in a folder, requesting only the given fields.
+
+        Args:
+            folder_path: Path to folder (e.g., "/Voice Recordings").
+            file_fields: Comma-separated file fields to return.
+            since: Optional RFC 3339 modifiedTime lower bound (inclusive).
+
+        Returns:
+            List of partial file metadata dicts.
         """
         if not self.service:
             raise ValueError("Not authenticated with Google Drive")
@@ -148,22 +258,146 @@ class DriveClient:
             logger.warning(f"Folder not found: {folder_path}")
             return []
 
+        query = f"'{folder_id}' in parents and trashed=false"
+        if since:
+            # Inclusive so files sharing the newest known timestamp aren't lost
+            query += f" and modifiedTime >= '{_escape_query(since)}'"
+
         # List files in folder
+        files: List[Dict] = []
+        page_token = None
         try:
-            results = self.service.files().list(
-                q=f"'{folder_id}' in parents and trashed=false",
-                spaces="drive",
-                fields="files(id, name, mimeType, modifiedTime)",
-                pageSize=1000,
-            ).execute()
+            while True:
+                results = self.service.files().list(
+                    q=query,
+                    spaces="drive",
+                    fields=f"nextPageToken, files({file_fields})",
+                    pageSize=1000,
+                    pageToken=page_token,
+                ).execute()
+                files.extend(results.get("files", []))
+                page_token = results.get("nextPageToken")
+                if not page_token:
+                    break
             
-            files = results.get("files", [])
             logger.info(f"Found {len(files)} files in {folder_path}")
             return files
+        except HttpError as e:
+            if e.resp.status == 404:
+                # Cached folder ID is stale (folder deleted or moved)
+                self._invalidate_folder_id(folder_path)
+            logger.error(f"Error listing files in {folder_path}: {e}")
+            return []
         except Exception as e:
             logger.error(f"Error listing files in {folder_path}: {e}")
             return []
 
+    def batch_list_folders(
+        self, folder_paths: List[str], since: Optional[Dict[str, str]] = None
+    ) -> Dict[str, List[Dict]]:
+        """List files in several folders with a single combined query.
+
+        Up to MAX_QUERY_PARENTS folders are OR'd into one files.list query
+        and the results are bucketed by parent, so polling N folders costs
+        one paginated request instead of N.
+
+        Args:
+            folder_paths: Paths to folders (e.g., ["/Voice Recordings"]).
+            since: Optional RFC 3339 timestamps keyed by folder path; only
+                files in that folder modified at or after it are returned.
+
+        Returns:
+            Dict mapping each folder path to its file metadata dicts with
+            keys: id, name, mimeType, modifiedTime, size, md5Checksum,
+            parents. Folders that could not be resolved or listed map to an
+            empty list.
+        """
+        if not self.service:
+            raise ValueError("Not authenticated with Google Drive")
+
+        results: Dict[str, List[Dict]] = {path: [] for path in folder_paths}
+
+        paths_by_id: Dict[str, str] = {}
+        for folder_path in results:
+            folder_id = self._get_folder_id(folder_path)
+            if folder_id:
+                paths_by_id[folder_id] = folder_path
+            else:
+                logger.warning(f"Folder not found: {folder_path}")
+
+        folder_ids = list(paths_by_id)
+        for i in range(0, len(folder_ids), MAX_QUERY_PARENTS):
+            group = folder_ids[i:i + MAX_QUERY_PARENTS]
+            parents = " or ".join(
+                self._parent_clause(folder_id, (since or {}).get(paths_by_id[folder_id]))
+                for folder_id in group
+            )
+            query = f"({parents}) and trashed=false"
+
+            page_token = None
+            try:
+                while True:
+                    response = self.service.files().list(
+                        q=query,
+                        spaces="drive",
+                        fields=(
+                            "nextPageToken, files(id, name, mimeType, "
+                            "modifiedTime, size, md5Checksum, parents)"
+                        ),
+                        pageSize=1000,
+                        pageToken=page_token,
+                    ).execute()
+                    for file_info in response.get("files", []):
+                        for parent in file_info.get("parents", []):
+                            if parent in paths_by_id:
+                                results[paths_by_id[parent]].append(file_info)
+                    page_token = response.get("nextPageToken")
+                    if not page_token:
+                        break
+            except HttpError as e:
+                group_paths = [paths_by_id[folder_id] for folder_id in group]
+                if e.resp.status == 404:
+                    # A cached folder ID is stale (folder deleted or moved);
+                    # re-resolve the whole group on the next call
+                    for folder_path in group_paths:
+                        self._invalidate_folder_id(folder_path)
+                logger.error(f"Error listing files in {group_paths}: {e}")
+            except Exception as e:
+                logger.error(f"Error listing folders {folder_paths}: {e}")
+
+        logger.info(
+            f"Found {sum(len(files) for files in results.values())} files "
+            f"in {len(results)} folders"
+        )
+        return results
+
+    @staticmethod
+    def _parent_clause(folder_id: str, since: Optional[str]) -> str:
+        """Build the query clause selecting files in one folder.
+
+        Args:
+            folder_id: Drive folder ID.
+            since: Optional RFC 3339 modifiedTime lower bound (inclusive).
+
+        Returns:
+            Query clause for use in a files.list q parameter.
+        """
+        if not since:
+            return f"'{folder_id}' in parents"
+        # Inclusive so files sharing the newest known timestamp aren't lost
+        return f"('{folder_id}' in parents and modifiedTime >= '{_escape_query(since)}')"
+
+    def get_folder_id(self, folder_path: str) -> Optional[str]:
+        """Resolve a folder path to its Drive folder ID, using the cache.
+
+        Args:
+            folder_path: Path to folder (e.g., "/Voice Recordings").
+
+        Returns:
+            Folder ID or None if not found.
+        """
+        return self._get_folder_id(folder_path)
+
     def _get_folder_id(self, folder_path: str) -> Optional[str]:
         """Resolve folder path to folder ID.
         
@@ -182,44 +416,291 @@ class DriveClient:
 
         # Split path into parts
         parts = [p for p in folder_path.split("/") if p]
-        
+        if not parts:
+            return "root"
+
+        # Start from the deepest already-resolved ancestor
+        prefixes = ["/" + "/".join(parts[: i + 1]) for i in range(len(parts))]
         parent_id = "root"
         current_path = ""
+        unresolved = parts
 
-        for part in parts:
-            current_path += "/" + part
-            
-            # Check if we've already resolved this part
-            if current_path in self._folder_id_cache:
-                parent_id = self._folder_id_cache[current_path]
-                continue
+        for depth in range(len(prefixes) - 1, -1, -1):
+            cached_id = self._folder_id_cache.get(prefixes[depth])
+            if cached_id is not None:
+                parent_id = cached_id
+                current_path = prefixes[depth]
+                unresolved = parts[depth + 1:]
+                break
 
-            # Query for folder
-            try:
-                query = f"name='{part}' and '{parent_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
+        if unresolved:
+            # Fetch every candidate folder in one query and walk the
+            # parent chain locally instead of one round-trip per level
+            if parent_id == "root":
+                # Parent lists hold the real root ID, not the alias
+                parent_id = self._get_root_id()
+                if not parent_id:
+                    return None
+
+            candidates = self._list_folders_named(unresolved)
+            if candidates is None:
+                return None
+
+            for part in unresolved:
+                current_path += "/" + part
+                match = next(
+                    (
+                        f for f in candidates
+                        if f["name"] == part and parent_id in f.get("parents", [])
+                    ),
+                    None,
+                )
+                if match is None:
+                    logger.warning(f"Folder not found: {current_path}")
+                    return None
+                parent_id = match["id"]
+                self._folder_id_cache[current_path] = parent_id
+
+        self._folder_id_cache[folder_path] = parent_id
+        if unresolved:
+            self._save_folder_cache()
+        return parent_id
+
+    def _load_folder_cache(self) -> Dict[str, str]:
+        """Load the persisted folder ID cache.
+
+        Returns:
+            Dict mapping folder paths to folder IDs, or empty dict if none.
+        """
+        cache_file = self.config.get_folder_cache_file()
+
+        if not cache_file.exists():
+            return {}
+
+        try:
+            with open(cache_file, "r") as f:
+                cache = json.load(f)
+            logger.debug(f"Loaded {len(cache)} cached folder IDs")
+            return cache
+        except Exception as e:
+            logger.warning(f"Failed to load folder cache: {e}. Starting fresh.")
+            return {}
+
+    def _save_folder_cache(self) -> None:
+        """Save the folder ID cache to disk atomically."""
+        cache_file = self.config.get_folder_cache_file()
+        temp_file = cache_file.with_suffix(".json.tmp")
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, "w") as f:
+                json.dump(self._folder_id_cache, f)
+            temp_file.replace(cache_file)
+        except Exception as e:
+            logger.warning(f"Failed to save folder cache: {e}")
+
+    def _invalidate_folder_id(self, folder_path: str) -> None:
+        """Drop a stale folder path (and any paths beneath it) from the cache.
+
+        Args:
+            folder_path: Path to folder (e.g., "/Voice Recordings").
+        """
+        prefix = folder_path.rstrip("/") + "/"
+        stale = [
+            path for path in self._folder_id_cache
+            if path == folder_path or path.startswith(prefix)
+        ]
+        for path in stale:
+            del self._folder_id_cache[path]
+
+        if stale:
+            logger.info(f"Invalidated cached folder ID for {folder_path}")
+            self._save_folder_cache()
+
+    def _get_root_id(self) -> Optional[str]:
+        """Resolve the ID of the Drive root folder.
+
+        Returns:
+            Root folder ID or None if the lookup failed.
+        """
+        if "/" in self._folder_id_cache:
+            return self._folder_id_cache["/"]
+
+        try:
+            root = self.service.files().get(fileId="root", fields="id").execute()
+        except Exception as e:
+            logger.error(f"Error resolving root folder: {e}")
+            return None
+
+        self._folder_id_cache["/"] = root["id"]
+        return root["id"]
+
+    def _list_folders_named(self, names: List[str]) -> Optional[List[Dict]]:
+        """List all folders matching any of the given names.
+
+        Args:
+            names: Folder names to look up.
+
+        Returns:
+            List of folder metadata dicts with keys: id, name, parents,
+            or None if the query failed.
+        """
+        name_clause = " or ".join(f"name='{_escape_query(n)}'" for n in dict.fromkeys(names))
+        query = (
+            f"({name_clause}) and mimeType='{FOLDER_MIME_TYPE}' and trashed=false"
+        )
+
+        folders: List[Dict] = []
+        page_token = None
+        try:
+            while True:
                 results = self.service.files().list(
                     q=query,
                     spaces="drive",
-                    fields="files(id, name)",
-                    pageSize=1,
+                    fields="nextPageToken, files(id, name, parents)",
+                    pageSize=1000,
+                    pageToken=page_token,
                 ).execute()
-                
-                files = results.get("files", [])
-                if files:
-                    parent_id = files[0]["id"]
-                    self._folder_id_cache[current_path] = parent_id
-                else:
-                    logger.warning(f"Folder not found: {current_path}")
-                    return None
-            except Exception as e:
-                logger.error(f"Error resolving folder {current_path}: {e}")
+                folders.extend(results.get("files", []))
+                page_token = results.get("nextPageToken")
+                if not page_token:
+                    return folders
+        except Exception as e:
+            logger.error(f"Error resolving folders {names}: {e}")
+            return None
+
+    def get_start_page_token(self) -> Optional[str]:
+        """Get the current start page token for the Drive changes feed.
+
+        Returns:
+            Page token marking "now" in the changes feed, or None on failure.
+        """
+        if not self.service:
+            return None
+
+        try:
+            response = self.service.changes().getStartPageToken().execute()
+            return response.get("startPageToken")
+        except Exception as e:
+            logger.error(f"Error getting start page token: {e}")
+            return None
+
+    def list_changes(
+        self, page_token: str, page_size: int = CHANGES_PAGE_SIZE
+    ) -> Optional[Tuple[List[Dict], str]]:
+        """List files changed since a page token.
+
+        Args:
+            page_token: Token from get_start_page_token or a previous call.
+            page_size: Changes requested per changes.list page.
+
+        Returns:
+            Tuple of (changed file metadata dicts, next page token), or None
+            if the token is no longer valid and a full re-list is required.
+            Removed and trashed files are omitted.
+        """
+        if not self.service:
+            raise ValueError("Not authenticated with Google Drive")
+
+        files: List[Dict] = []
+        next_token = page_token
+        try:
+            while True:
+                response = self.service.changes().list(
+                    pageToken=next_token,
+                    spaces="drive",
+                    fields=(
+                        "nextPageToken, newStartPageToken, changes(fileId, removed, "
+                        "file(id, name, mimeType, modifiedTime, parents, trashed))"
+                    ),
+                    pageSize=page_size,
+                ).execute()
+
+                for change in response.get("changes", []):
+                    file = change.get("file")
+                    if change.get("removed") or not file or file.get("trashed"):
+                        continue
+                    files.append(file)
+
+                if "newStartPageToken" in response:
+                    return files, response["newStartPageToken"]
+                next_token = response["nextPageToken"]
+        except HttpError as e:
+            if e.resp.status in (400, 410):
+                logger.warning(
+                    f"Changes page token rejected ({e.resp.status}); full re-list needed"
+                )
                 return None
+            logger.error(f"Error listing changes: {e}")
+        except Exception as e:
+            logger.error(f"Error listing changes: {e}")
 
-        self._folder_id_cache[folder_path] = parent_id
-        return parent_id
+        # Transient failure: keep the original token so the changes are retried
+        return [], page_token
+
+    def list_folder_changes(
+        self, folder_path: str, page_token: str
+    ) -> Optional[Tuple[List[Dict], str]]:
+        """List files added or modified in a folder since a page token.
+
+        Args:
+            folder_path: Path to folder (e.g., "/Voice Recordings").
+            page_token: Token from get_start_page_token or a previous call.
+
+        Returns:
+            Tuple of (file metadata dicts in the folder, next page token), or
+            None if the token is no longer valid.
+        """
+        folder_id = self._get_folder_id(folder_path)
+        if not folder_id:
+            logger.warning(f"Folder not found: {folder_path}")
+            return [], page_token
+
+        changes = self.list_changes(page_token)
+        if changes is None:
+            return None
+
+        files, next_token = changes
+        return [f for f in files if folder_id in f.get("parents", [])], next_token
+
+    @staticmethod
+    def _build_session(creds: Credentials) -> AuthorizedSession:
+        """Build a pooled, authorized HTTP session for media downloads.
+
+        Args:
+            creds: Google OAuth credentials.
+
+        Returns:
+            AuthorizedSession whose connections are reused across downloads.
+        """
+        session = AuthorizedSession(creds)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        session.mount("https://", adapter)
+        return session
+
+    def _thread_http(self) -> AuthorizedHttp:
+        """Get an authorized HTTP transport owned by the calling thread.
+
+        httplib2 connections are not thread-safe, so concurrent downloads
+        each need their own transport rather than the shared service one.
+
+        Returns:
+            AuthorizedHttp bound to this thread.
+        """
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = AuthorizedHttp(self._credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
 
     def download_file(self, file_id: str, destination: str) -> None:
         """Download a file from Google Drive.
+
+        Uses the pooled session, so keep-alive connections are reused across
+        files. The first PARALLEL_DOWNLOAD_THRESHOLD bytes are requested as a
+        byte range; if the file is larger, the remainder is fetched as up to
+        PARALLEL_DOWNLOAD_PARTS concurrent ranges written straight into place.
+        Safe to call from multiple threads concurrently.
         
         Args:
             file_id: Google Drive file ID.
@@ -228,26 +709,129 @@ class DriveClient:
         Raises:
             Exception: If download fails.
         """
-        if not self.service:
+        if not self._session:
             raise ValueError("Not authenticated with Google Drive")
 
         try:
-            request = self.service.files().get_media(fileId=file_id)
-            fh = io.FileIO(destination, "wb")
-            downloader = MediaIoBaseDownload(fh, request)
-            done = False
-            
-            while not done:
-                status, done = downloader.next_chunk()
-            
-            fh.close()
+            self._download_ranges(file_id, destination)
+            self.invalidate_file_metadata(file_id)
             logger.info(f"Downloaded file {file_id} to {destination}")
         except Exception as e:
             logger.error(f"Error downloading file {file_id}: {e}")
             raise
 
+    def _download_ranges(self, file_id: str, destination: str) -> None:
+        """Download a file as byte ranges, in parallel when it is large.
+
+        Args:
+            file_id: Google Drive file ID.
+            destination: Local file path to save to.
+
+        Raises:
+            Exception: If any range fails or comes back incomplete.
+        """
+        url = f"{DRIVE_FILES_URL}/{file_id}"
+        fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            with self._session.get(
+                url,
+                params={"alt": "media"},
+                headers={"Range": f"bytes=0-{PARALLEL_DOWNLOAD_THRESHOLD - 1}"},
+                stream=True,
+            ) as response:
+                if response.status_code == 416:
+                    # No byte of an empty file satisfies the range; the
+                    # destination is already truncated
+                    return
+                response.raise_for_status()
+                # "bytes 0-N/TOTAL"; a plain 200 means the whole body follows
+                total = None
+                unknown_total = False
+                if response.status_code == 206:
+                    size = response.headers.get("Content-Range", "").rpartition("/")[2]
+                    if size.isdigit():
+                        total = int(size)
+                        os.ftruncate(fd, total)
+                    else:
+                        unknown_total = True
+                offset = 0 if unknown_total else self._write_body(response, fd, 0)
+
+            if unknown_total:
+                # "bytes 0-N/*": ranges cannot be planned without a total, so
+                # fetch the whole file in one stream instead
+                self._fetch_whole(url, fd)
+                return
+            if total is None or offset >= total:
+                return
+
+            part = -(-(total - offset) // PARALLEL_DOWNLOAD_PARTS)
+            ranges = [(start, min(start + part, total) - 1) for start in range(offset, total, part)]
+            with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+                list(pool.map(lambda r: self._fetch_range(url, fd, *r), ranges))
+        finally:
+            os.close(fd)
+
+    def _fetch_whole(self, url: str, fd: int) -> None:
+        """Fetch a file in one streamed request, replacing the fd's contents.
+
+        Args:
+            url: Media URL of the file.
+            fd: Open destination file descriptor.
+        """
+        with self._session.get(url, params={"alt": "media"}, stream=True) as response:
+            response.raise_for_status()
+            os.ftruncate(fd, 0)
+            self._write_body(response, fd, 0)
+
+    def _fetch_range(self, url: str, fd: int, start: int, end: int) -> None:
+        """Fetch one inclusive byte range and write it at its offset.
+
+        Args:
+            url: Media URL of the file.
+            fd: Open destination file descriptor.
+            start: First byte of the range.
+            end: Last byte of the range.
+
+        Raises:
+            IOError: If the server ignored the range or sent too few bytes.
+        """
+        with self._session.get(
+            url,
+            params={"alt": "media"},
+            headers={"Range": f"bytes={start}-{end}"},
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise IOError(f"Range {start}-{end} not honoured ({response.status_code})")
+            if self._write_body(response, fd, start) != end + 1:
+                raise IOError(f"Incomplete range {start}-{end}")
+
+    @staticmethod
+    def _write_body(response, fd: int, offset: int) -> int:
+        """Write a streamed response body into a file at an offset.
+
+        Args:
+            response: Streaming requests response.
+            fd: Open destination file descriptor.
+            offset: File offset for the first byte.
+
+        Returns:
+            Offset just past the last byte written.
+        """
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_BUFFER_SIZE):
+            view = memoryview(chunk)
+            while view:
+                written = os.pwrite(fd, view, offset)
+                view = view[written:]
+                offset += written
+        return offset
+
     def get_file_metadata(self, file_id: str) -> Optional[Dict]:
         """Get metadata for a file.
+
+        Lookups are reused for METADATA_TTL seconds; failed lookups are not
+        cached. Safe to call from multiple threads concurrently.
         
         Args:
             file_id: Google Drive file ID.
@@ -258,12 +842,36 @@ class DriveClient:
         if not self.service:
             return None
 
+        now = time.monotonic()
+        with self._metadata_lock:
+            cached = self._metadata_cache.get(file_id)
+        if cached and cached[0] > now:
+            return cached[1]
+
         try:
             file = self.service.files().get(
                 fileId=file_id,
                 fields="id, name, mimeType, modifiedTime, size",
-            ).execute()
-            return file
+            ).execute(http=self._thread_http())
         except Exception as e:
             logger.error(f"Error getting metadata for file {file_id}: {e}")
             return None
+
+        with self._metadata_lock:
+            if len(self._metadata_cache) >= METADATA_CACHE_SIZE:
+                # Drop expired entries, then the oldest if still full
+                for key in [k for k, (expiry, _) in self._metadata_cache.items() if expiry <= now]:
+                    del self._metadata_cache[key]
+                if len(self._metadata_cache) >= METADATA_CACHE_SIZE:
+                    del self._metadata_cache[next(iter(self._metadata_cache))]
+            self._metadata_cache[file_id] = (now + METADATA_TTL, file)
+        return file
+
+    def invalidate_file_metadata(self, file_id: str) -> None:
+        """Forget cached metadata for a file.
+
+        Args:
+            file_id: Google Drive file ID.
+        """
+        with self._metadata_lock:
+            self._metadata_cache.pop(file_id, None)
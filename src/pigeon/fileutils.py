@@ -0,0 +1,151 @@
+"""Filesystem helpers shared across Pigeon components."""
+
+import errno
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Counter suffixes tried before falling back to a random unique name
+MAX_COUNTER_ATTEMPTS = 100
+
+# Buffer size for user-space copies when in-kernel copying is unavailable
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Buffer size for writing generated text files in as few syscalls as possible
+WRITE_BUFFER_SIZE = 128 * 1024
+
+
+def unique_path(directory: Path, stem: str, suffix: str) -> Path:
+    """Atomically reserve a new, uniquely named file in a directory.
+
+    Tries ``{stem}{suffix}``, then ``{stem}_1{suffix}``, ``{stem}_2{suffix}``...
+    creating each candidate with O_EXCL so concurrent callers can never
+    receive the same path. After the first collision the directory is listed
+    once and names already present are skipped without a syscall each. After
+    MAX_COUNTER_ATTEMPTS collisions a random name is created with mkstemp
+    instead.
+
+    Args:
+        directory: Directory to create the file in.
+        stem: Desired filename without suffix.
+        suffix: Filename suffix including the dot (e.g. ".md").
+
+    Returns:
+        Path to the newly created, empty file.
+    """
+    directory = Path(directory)
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY
+
+    existing = None
+    for counter in range(MAX_COUNTER_ATTEMPTS):
+        name = f"{stem}{suffix}" if counter == 0 else f"{stem}_{counter}{suffix}"
+        if existing is not None and name in existing:
+            continue
+        candidate = directory / name
+        try:
+            fd = os.open(candidate, flags, 0o644)
+        except FileExistsError:
+            if existing is None:
+                existing = set(os.listdir(directory))
+            continue
+        os.close(fd)
+        return candidate
+
+    logger.debug(f"Too many collisions for {stem}{suffix}; using a random name")
+    fd, name = tempfile.mkstemp(prefix=f"{stem}_", suffix=suffix, dir=directory)
+    os.close(fd)
+    return Path(name)
+
+
+def read_first_line(path: Path, limit: int = 256) -> str:
+    """Read the first line of a file, looking at no more than ``limit`` bytes.
+
+    Args:
+        path: File to read.
+        limit: Maximum number of bytes to read.
+
+    Returns:
+        First line, decoded as UTF-8 (invalid bytes replaced) and stripped.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        header = os.read(fd, limit)
+    finally:
+        os.close(fd)
+    return header.split(b"\n", 1)[0].decode("utf-8", "replace").strip()
+
+
+def fast_copy(src: Path, dst: Path) -> None:
+    """Copy file contents and metadata, in-kernel where possible.
+
+    Uses os.copy_file_range (which lets the filesystem reflink or copy
+    without a user-space round trip), then os.sendfile (still in-kernel, and
+    works across filesystems on kernels whose copy_file_range does not), and
+    falls back to a 1 MiB buffered copy when neither is supported.
+
+    Args:
+        src: Source file.
+        dst: Destination file (created or truncated).
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except (AttributeError, OSError):
+            # Offsets track what was already copied, so just continue
+            try:
+                while remaining > 0:
+                    copied = os.sendfile(fdst.fileno(), fsrc.fileno(), None, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            except (AttributeError, OSError):
+                shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+    shutil.copystat(src, dst)
+
+
+def move_file(src: Path, dst: Path) -> None:
+    """Move a file, using a single rename when on the same filesystem.
+
+    Args:
+        src: Source file.
+        dst: Destination path (replaced if it exists).
+    """
+    try:
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink a file into place, copying when linking is not possible.
+
+    The link is made under a temporary name and renamed over ``dst``, so an
+    existing (e.g. reserved) destination is replaced atomically.
+
+    Args:
+        src: Source file.
+        dst: Destination path (replaced if it exists).
+    """
+    dst = Path(dst)
+    temp = dst.with_name(f".{dst.name}.link")
+    try:
+        os.link(src, temp)
+        os.replace(temp, dst)
+    except OSError:
+        # Cross-device or unsupported filesystem
+        Path(temp).unlink(missing_ok=True)
+        fast_copy(src, dst)
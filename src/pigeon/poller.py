@@ -2,17 +2,67 @@
 
 import json
 import logging
+import os
 import signal
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Set, Optional
+from typing import Dict, List, Set, Optional
 
 from .config import Config
-from .drive_client import DriveClient, create_timestamped_filename
+from .drive_client import FOLDER_MIME_TYPE, DriveClient, create_timestamped_filename
+from .fileutils import unique_path
 
 logger = logging.getLogger(__name__)
 
+# State key holding the Drive changes feed page token
+PAGE_TOKEN_KEY = "_page_token"
+
+# State key holding the newest modifiedTime covered by a fully downloaded
+# poll; full listings only ask for files modified since then
+WATERMARK_KEY = "_watermark"
+
+# Maximum number of concurrent file downloads
+DOWNLOAD_WORKERS = 4
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_record(key: str, value) -> bytes:
+    """Serialize a single state record as one JSON line.
+
+    Args:
+        key: State key.
+        value: Value stored under the key.
+
+    Returns:
+        UTF-8 encoded JSON object followed by a newline.
+    """
+    if orjson is not None:
+        return orjson.dumps({key: value}) + b"\n"
+    return (json.dumps({key: value}) + "\n").encode("utf-8")
+
+
+def _load_json(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed.
+
+    Args:
+        data: UTF-8 encoded JSON document.
+
+    Returns:
+        Parsed object.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class Poller:
     """Main polling service for Google Drive folder."""
@@ -27,138 +77,338 @@ class Poller:
         self.config = config
         self.drive_client = drive_client
         self.running = False
+        self._stop_event = threading.Event()
+        self._inbox_dir = Path(config.get_inbox_dir())
+        self._state_lines = 0
         self.state = self._load_state()
+        self._state_lock = threading.RLock()
+        # Download workers; created by start() and shut down by stop()
+        self._executor: Optional[ThreadPoolExecutor] = None
         
         # Register signal handlers
         signal.signal(signal.SIGINT, self._handle_signal)
         signal.signal(signal.SIGTERM, self._handle_signal)
 
     def start(self) -> None:
-        """Start the polling loop."""
+        """Start the polling loop.
+
+        Blocks until stop() is called or a termination signal arrives; the
+        poller can be started again afterwards.
+        """
         logger.info("Starting Pigeon poller")
         self.running = True
+        self._stop_event.clear()
+        self._executor = ThreadPoolExecutor(
+            max_workers=DOWNLOAD_WORKERS, thread_name_prefix="pigeon-download"
+        )
         
         try:
-            while self.running:
+            polls_since_save = 0
+            while not self._stop_event.is_set():
                 self._poll_once()
-                time.sleep(self.config.poll_interval)
+
+                # Periodically compact the state log (0 disables)
+                polls_since_save += 1
+                if (
+                    self.config.state_save_interval
+                    and polls_since_save >= self.config.state_save_interval
+                ):
+                    with self._state_lock:
+                        self._save_state()
+                    polls_since_save = 0
+
+                # Returns as soon as stop() is called
+                self._stop_event.wait(self.config.poll_interval)
         except Exception as e:
             logger.error(f"Polling error: {e}", exc_info=True)
         finally:
             self.stop()
 
     def stop(self) -> None:
-        """Stop the polling loop and save state."""
+        """Stop the polling loop and save state.
+
+        Safe to call more than once; only the first call after start() waits
+        for downloads and saves.
+        """
+        self._stop_event.set()
+        if not self.running:
+            return
+
         logger.info("Stopping Pigeon poller")
         self.running = False
-        self._save_state()
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._state_lock:
+            self._save_state()
 
     def _poll_once(self) -> None:
         """Execute a single poll cycle.
-        
-        Lists files in the configured folder, compares against state,
-        downloads new files, and updates state.
+
+        Fetches files changed since the last poll via the Drive changes feed
+        (falling back to a full folder listing on first run or when the page
+        token has expired), downloads new files, and updates state.
         """
         try:
-            # List files in folder
-            files = self.drive_client.list_folder_files(self.config.drive_folder)
-            
-            # Get set of already downloaded files
-            downloaded_ids = set(self.state.keys())
-            
-            # Find new files
-            new_files = [f for f in files if f["id"] not in downloaded_ids]
-            
-            if new_files:
-                logger.info(f"Found {len(new_files)} new file(s)")
-            
-            # Download new files
-            for file_info in new_files:
-                self._download_file(file_info)
+            files = None
+            page_token = self.state.get(PAGE_TOKEN_KEY)
+
+            if page_token:
+                changes = self.drive_client.list_folder_changes(
+                    self.config.drive_folder, page_token
+                )
+                if changes is not None:
+                    files, next_token = changes
+
+            if files is None:
+                # Take the token before listing so nothing added while the
+                # listing runs is missed on the next poll
+                next_token = self.drive_client.get_start_page_token()
+                with self._state_lock:
+                    since = self.state.get(WATERMARK_KEY)
+                file_ids = self.drive_client.list_folder_file_ids(
+                    self.config.drive_folder, since=since
+                )
+
+                # Fetch metadata and download each new file as one task, so
+                # one file's metadata request overlaps another's download
+                new_ids = [fid for fid in file_ids if fid not in self.state]
+                if new_ids:
+                    logger.info(f"Found {len(new_ids)} new file(s)")
+                results = list(self._executor.map(self._fetch_and_download, new_ids))
+            else:
+                new_files = [f for f in files if f["id"] not in self.state]
+                new_ids = [f["id"] for f in new_files]
+                if new_files:
+                    logger.info(f"Found {len(new_files)} new file(s)")
+                results = list(self._executor.map(self._download_file, new_files))
+
+            # Only advance past these changes once every file is downloaded,
+            # otherwise failed files would never be seen again
+            if not all(results):
+                return
+            with self._state_lock:
+                if next_token and next_token != page_token:
+                    self.state[PAGE_TOKEN_KEY] = next_token
+                    self._append_state(PAGE_TOKEN_KEY, next_token)
+                watermark = self._newest_modified_time(new_ids)
+                if watermark > self.state.get(WATERMARK_KEY, ""):
+                    self.state[WATERMARK_KEY] = watermark
+                    self._append_state(WATERMARK_KEY, watermark)
         except Exception as e:
             logger.error(f"Error in poll cycle: {e}", exc_info=True)
 
-    def _download_file(self, file_info: Dict) -> None:
+    def _newest_modified_time(self, file_ids: List[str]) -> str:
+        """Get the newest Drive modifiedTime among the given tracked files.
+
+        Callers must hold ``self._state_lock``.
+
+        Args:
+            file_ids: Google Drive file IDs downloaded this poll.
+
+        Returns:
+            RFC 3339 timestamp, or "" if none of the files records one.
+        """
+        return max(
+            (
+                self.state[file_id].get("modifiedTime", "")
+                for file_id in file_ids
+                if isinstance(self.state.get(file_id), dict)
+            ),
+            default="",
+        )
+
+    def _fetch_and_download(self, file_id: str) -> bool:
+        """Fetch a file's metadata and download it.
+
+        Args:
+            file_id: Google Drive file ID.
+
+        Returns:
+            True if the file was downloaded, False otherwise.
+        """
+        file_info = self.drive_client.get_file_metadata(file_id)
+        if file_info is None:
+            return False
+        return self._download_file(file_info)
+
+    def _download_file(self, file_info: Dict) -> bool:
         """Download a file from Google Drive.
-        
+
         Args:
             file_info: File metadata from Google Drive API.
+
+        Returns:
+            True if the file was downloaded, False otherwise.
         """
         file_id = file_info["id"]
         original_name = file_info["name"]
+        destination = None
+
+        # Subfolders have no content to download
+        if file_info.get("mimeType") == FOLDER_MIME_TYPE:
+            return True
         
         try:
             # Generate timestamped filename
             timestamped_name = create_timestamped_filename(original_name)
-            destination = self.config.get_inbox_dir() / timestamped_name
-            
-            # Ensure uniqueness
-            counter = 1
-            original_dest = destination
-            while destination.exists():
-                name, ext = original_dest.name.rsplit(".", 1) if "." in original_dest.name else (original_dest.name, "")
-                if ext:
-                    destination = original_dest.parent / f"{name}_{counter}.{ext}"
-                else:
-                    destination = original_dest.parent / f"{name}_{counter}"
-                counter += 1
+            # Reserved exclusively so concurrent downloads never share a name
+            stem, ext = os.path.splitext(timestamped_name)
+            destination = os.fspath(unique_path(self._inbox_dir, stem, ext))
             
             # Download file
-            self.drive_client.download_file(file_id, str(destination))
+            self.drive_client.download_file(file_id, destination)
             
             # Update state
-            self.state[file_id] = {
+            entry = {
                 "original_name": original_name,
                 "downloaded_at": datetime.now().isoformat(),
             }
+            if "modifiedTime" in file_info:
+                entry["modifiedTime"] = file_info["modifiedTime"]
+            with self._state_lock:
+                self.state[file_id] = entry
+                self._append_state(file_id, entry)
             
             logger.info(
                 f"Successfully downloaded '{original_name}' "
-                f"to '{destination.name}'"
+                f"to '{os.path.basename(destination)}'"
             )
+            return True
         except Exception as e:
             logger.error(f"Failed to download file {file_id} ({original_name}): {e}")
+            # Release the claimed name so a retry doesn't leave a stub behind
+            if destination is not None:
+                try:
+                    os.unlink(destination)
+                except FileNotFoundError:
+                    pass
+            return False
 
     def _load_state(self) -> Dict:
-        """Load state from file.
+        """Load state from the append-only state log.
+
+        Each line holds a single ``{key: value}`` record; later lines win.
+        A legacy single-document JSON state file is migrated on first load.
         
         Returns:
             State dictionary mapping file_id to download info.
         """
         state_file = self.config.get_state_file()
+        legacy_file = state_file.with_suffix(".json")
         
         if not state_file.exists():
+            if legacy_file.exists():
+                return self._migrate_legacy_state(legacy_file)
             return {}
         
+        state: Dict = {}
+        lines = 0
+        corrupt = False
         try:
-            with open(state_file, "r") as f:
-                state = json.load(f)
+            with open(state_file, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        state.update(_load_json(line))
+                    except json.JSONDecodeError:
+                        # A torn final line from a crash mid-append
+                        logger.warning(f"Skipping corrupt state line {lines + 1}")
+                        corrupt = True
+                    lines += 1
             logger.info(f"Loaded state with {len(state)} tracked files")
+            self._state_lines = lines
+            if corrupt:
+                # Rewrite the log so later appends don't land on the torn line
+                self.state = state
+                self._save_state()
             return state
         except Exception as e:
             logger.warning(f"Failed to load state file: {e}. Starting fresh.")
             return {}
 
-    def _save_state(self) -> None:
-        """Save state to file atomically."""
+    def _migrate_legacy_state(self, legacy_file: Path) -> Dict:
+        """Convert a legacy JSON state file into the state log.
+
+        Args:
+            legacy_file: Path to the old pigeon-state.json file.
+
+        Returns:
+            State dictionary loaded from the legacy file.
+        """
+        try:
+            state = _load_json(legacy_file.read_bytes())
+        except Exception as e:
+            logger.warning(f"Failed to load legacy state file: {e}. Starting fresh.")
+            return {}
+
+        self.state = state
+        if self._save_state():
+            legacy_file.unlink()
+            logger.info(f"Migrated {len(state)} tracked files from {legacy_file.name}")
+        return state
+
+    def _append_state(self, key: str, value) -> None:
+        """Durably append a single state record to the state log.
+
+        Callers must hold ``self._state_lock``.
+
+        Args:
+            key: State key (a file ID or reserved key).
+            value: Value stored under the key.
+        """
+        state_file = self.config.get_state_file()
+        
+        try:
+            state_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(state_file, "ab") as f:
+                f.write(_dump_record(key, value))
+                f.flush()
+                os.fsync(f.fileno())
+            self._state_lines += 1
+        except Exception as e:
+            logger.error(f"Failed to append state: {e}")
+            return
+
+        # Compact once superseded records dominate the log
+        if self._state_lines > 2 * len(self.state):
+            self._save_state()
+
+    def _save_state(self) -> bool:
+        """Compact the state log by rewriting it atomically.
+
+        Returns:
+            True if the state was written, False otherwise.
+        """
         state_file = self.config.get_state_file()
         state_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Write to temporary file first
-        temp_file = state_file.with_suffix(".json.tmp")
+        temp_file = state_file.with_suffix(".jsonl.tmp")
         
         try:
-            with open(temp_file, "w") as f:
-                json.dump(self.state, f, indent=2)
+            with open(temp_file, "wb") as f:
+                f.writelines(_dump_record(key, value) for key, value in self.state.items())
+                f.flush()
+                os.fsync(f.fileno())
             
-            # Atomic rename
+            # Atomic rename, then fsync the directory so the rename is durable
             temp_file.replace(state_file)
+            dir_fd = os.open(state_file.parent, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+            self._state_lines = len(self.state)
             logger.info(f"Saved state with {len(self.state)} tracked files")
+            return True
         except Exception as e:
             logger.error(f"Failed to save state: {e}")
             # Clean up temp file if it exists
             if temp_file.exists():
                 temp_file.unlink()
+            return False
 
     def _handle_signal(self, signum, frame) -> None:
         """Handle termination signals.
@@ -168,4 +418,5 @@ class Poller:
             frame: Current stack frame.
         """
         logger.info(f"Received signal {signum}, shutting down gracefully")
-        self.stop()
+        # The polling loop wakes up and calls stop() itself
+        self._stop_event.set()
@@ -4,16 +4,57 @@ This module contains processors for STT, text professionalization,
 routing, and other data transformations.
 """
 
-from .base import Processor
-from .stt import STTProcessor
-from .professionalize import ProfessionalizerProcessor
-from .routing import RoutingProcessor
-from .pipeline import ProcessingPipeline
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .base import ProcessedSpec, Processor
+
+if TYPE_CHECKING:
+    from .stt import STTProcessor
+    from .professionalize import ProfessionalizerProcessor
+    from .routing import RoutingProcessor
+    from .pipeline import ProcessingPipeline
+
+# Processors are imported on first access so importing the package stays
+# cheap for callers that never touch them
+_LAZY_IMPORTS = {
+    "STTProcessor": ".stt",
+    "ProfessionalizerProcessor": ".professionalize",
+    "RoutingProcessor": ".routing",
+    "ProcessingPipeline": ".pipeline",
+}
 
 __all__ = [
+    "ProcessedSpec",
     "Processor",
     "STTProcessor",
     "ProfessionalizerProcessor",
     "RoutingProcessor",
     "ProcessingPipeline",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import processor classes lazily (PEP 562).
+
+    Args:
+        name: Attribute being accessed.
+
+    Returns:
+        The requested class.
+
+    Raises:
+        AttributeError: If the name is not exported by this package.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """List the package's public names, including lazy ones."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,12 +1,26 @@
 """Base processor class for the Pigeon processing pipeline."""
 
 import logging
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 logger = logging.getLogger(__name__)
 
+# Threads used for IO-bound per-file work within a batch
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+@dataclass
+class ProcessedSpec:
+    """A processed spec file plus metadata already known in memory."""
+
+    path: Path
+    first_line: str  # First line of the spec, stripped and truncated to 100 chars
+
 
 class Processor(ABC):
     """Abstract base class for processors in the Pigeon pipeline."""
@@ -32,6 +46,25 @@ class Processor(ABC):
         """
         pass
 
+    def process_batch(self, file_paths: List[Path]) -> List[Optional[Path]]:
+        """Process several files through this processor.
+
+        Processors with a fixed per-call cost (e.g. LLM requests) override
+        this to amortize it across the batch; the default processes files
+        concurrently on a thread pool, since per-file work is IO-bound.
+
+        Args:
+            file_paths: Paths to files to process.
+
+        Returns:
+            Processed file path (or None on failure) for each input, in order.
+        """
+        if len(file_paths) <= 1:
+            return [self.process(file_path) for file_path in file_paths]
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(file_paths))) as executor:
+            return list(executor.map(self.process, file_paths))
+
     def get_metadata(self) -> Dict[str, Any]:
         """Get processor metadata.
 
@@ -1,34 +1,78 @@
 """Processing pipeline for coordinating multiple processors."""
 
+import hashlib
 import logging
+import os
+import threading
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
 from .base import Processor
-from .stt import STTProcessor
-from .professionalize import ProfessionalizerProcessor
 
 logger = logging.getLogger(__name__)
 
+# Read size used when hashing input files
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Most (input path, content, stages) results remembered; least recently
+# used are forgotten first
+RESULT_CACHE_SIZE = 1024
+
+# Result cache key: (input path, content hash, stage names)
+_CacheKey = Tuple[str, str, Tuple[str, ...]]
+
+
+def _hash_file(file_path: Path) -> str:
+    """Compute a content hash of a file, streaming it in chunks.
+
+    Args:
+        file_path: Path to file to hash.
+
+    Returns:
+        Hex digest of the file contents.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
 class ProcessingPipeline:
     """Coordinates multiple processors in sequence."""
 
-    def __init__(self, enable_stt: bool = True, enable_professionalize: bool = True):
+    def __init__(
+        self,
+        enable_stt: bool = True,
+        enable_professionalize: bool = True,
+        history_limit: int = 1024,
+    ):
         """Initialize processing pipeline.
 
         Args:
             enable_stt: Whether to enable STT processing.
             enable_professionalize: Whether to enable text professionalization.
+            history_limit: Maximum number of history records kept; older
+                records are discarded first.
         """
         self.processors: List[Processor] = []
-        self.history: List[Dict[str, Any]] = []
+        self.history: deque = deque(maxlen=history_limit)
+        self._result_cache: "OrderedDict[_CacheKey, Path]" = OrderedDict()
+        # Guards history and the result cache when files are processed
+        # from several threads
+        self._lock = threading.Lock()
 
+        # Import stages on demand so disabled ones are never loaded
         if enable_stt:
+            from .stt import STTProcessor
+
             self.processors.append(STTProcessor())
 
         if enable_professionalize:
+            from .professionalize import ProfessionalizerProcessor
+
             self.processors.append(ProfessionalizerProcessor())
 
         logger.info(
@@ -44,24 +88,80 @@ class ProcessingPipeline:
 
         Returns:
             Path to final processed file, or None if any stage failed.
+            Reprocessing the same path with unchanged content through the
+            same stages returns the earlier output without re-running them.
         """
-        if not file_path.exists():
-            logger.error(f"File not found: {file_path}")
-            return None
-
-        current_file = file_path
-        entry = {
-            "input": str(file_path),
-            "stages": [],
-            "timestamp": datetime.now().isoformat(),
-            "status": "pending",
-        }
-
-        try:
-            for processor in self.processors:
-                logger.debug(f"Processing {current_file} with {processor.name}")
-
-                result = processor.process(current_file)
+        return self.process_batch([file_path])[0]
+
+    def process_batch(self, file_paths: List[Path]) -> List[Optional[Path]]:
+        """Process several files through the pipeline, stage by stage.
+
+        Each stage receives every file still in flight in a single
+        process_batch call, so stages with per-call overhead can batch.
+
+        Args:
+            file_paths: Paths to files to process.
+
+        Returns:
+            Path to final processed file (or None if any stage failed) for
+            each input, in order.
+        """
+        stage_names = tuple(p.name for p in self.processors)
+        results: List[Optional[Path]] = [None] * len(file_paths)
+        # Files still in flight: (index, current file, history entry, cache key)
+        pending: List[Tuple[int, Path, Dict[str, Any], _CacheKey]] = []
+
+        for i, file_path in enumerate(file_paths):
+            if not file_path.exists():
+                logger.error(f"File not found: {file_path}")
+                continue
+
+            entry = {
+                "input": str(file_path),
+                "stages": [],
+                "timestamp": datetime.now().isoformat(),
+                "status": "pending",
+            }
+
+            try:
+                # Keyed by path as well as content: a different file with the
+                # same bytes still has to run through (and be routed by) the
+                # stages itself
+                cache_key = (os.fspath(file_path), _hash_file(file_path), stage_names)
+            except Exception as e:
+                self._record_error(entry, file_path, e)
+                continue
+
+            with self._lock:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+            if cached is not None and cached.exists():
+                entry["status"] = "cached"
+                entry["output"] = str(cached)
+                self._append_history(entry)
+                logger.info(f"Skipping unchanged {file_path}; reusing {cached}")
+                results[i] = cached
+                continue
+
+            pending.append((i, file_path, entry, cache_key))
+
+        for processor in self.processors:
+            if not pending:
+                break
+
+            logger.debug(f"Processing {len(pending)} file(s) with {processor.name}")
+
+            try:
+                outputs = processor.process_batch([current for _, current, _, _ in pending])
+            except Exception as e:
+                for i, _, entry, _ in pending:
+                    self._record_error(entry, file_paths[i], e)
+                pending = []
+                break
+
+            still_pending = []
+            for (i, current_file, entry, cache_key), result in zip(pending, outputs):
                 entry["stages"].append(
                     {
                         "processor": processor.name,
@@ -73,29 +173,66 @@ class ProcessingPipeline:
 
                 if result is None:
                     entry["status"] = "failed"
-                    self.history.append(entry)
-                    logger.warning(f"Pipeline failed at {processor.name} for {file_path}")
-                    return None
+                    self._append_history(entry)
+                    logger.warning(f"Pipeline failed at {processor.name} for {file_paths[i]}")
+                    continue
 
-                current_file = result
+                still_pending.append((i, result, entry, cache_key))
+            pending = still_pending
 
+        for i, current_file, entry, cache_key in pending:
             entry["status"] = "success"
             entry["output"] = str(current_file)
-            self.history.append(entry)
-            logger.info(f"Successfully processed {file_path} -> {current_file}")
-            return current_file
+            with self._lock:
+                self._result_cache[cache_key] = current_file
+                self._result_cache.move_to_end(cache_key)
+                if len(self._result_cache) > RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+            self._append_history(entry)
+            logger.info(f"Successfully processed {file_paths[i]} -> {current_file}")
+            results[i] = current_file
+
+        return results
+
+    def _record_error(self, entry: Dict[str, Any], file_path: Path, error: Exception) -> None:
+        """Record a pipeline error for a file in history.
+
+        Args:
+            entry: History entry for the file.
+            file_path: Path to the file being processed.
+            error: Exception that aborted processing.
+        """
+        entry["status"] = "error"
+        entry["error"] = str(error)
+        self._append_history(entry)
+        logger.error(f"Pipeline error processing {file_path}: {error}", exc_info=True)
 
-        except Exception as e:
-            entry["status"] = "error"
-            entry["error"] = str(e)
+    def _append_history(self, entry: Dict[str, Any]) -> None:
+        """Add a record to the bounded processing history.
+
+        Args:
+            entry: History entry for a file.
+        """
+        with self._lock:
             self.history.append(entry)
-            logger.error(f"Pipeline error processing {file_path}: {e}", exc_info=True)
-            return None
+
+    def reset_history(self) -> None:
+        """Forget all processed files.
+
+        Clears the history and the cache of outputs for unchanged content,
+        so the next run of any file goes through every stage again.
+        """
+        with self._lock:
+            self.history.clear()
+            self._result_cache.clear()
 
     def get_history(self) -> List[Dict[str, Any]]:
         """Get processing history.
 
+        Safe to call while other threads are processing files.
+
         Returns:
-            List of processing records.
+            List of the most recent processing records, oldest first.
         """
-        return self.history
+        with self._lock:
+            return list(self.history)
@@ -1,11 +1,13 @@
 """Text professionalization processor using LLM."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
-from .base import Processor
+from ..fileutils import unique_path
+from .base import MAX_WORKERS, ProcessedSpec, Processor
 
 logger = logging.getLogger(__name__)
 
@@ -28,19 +30,30 @@ Keep the technical content and intent exactly - just clean up the presentation."
     def __init__(self):
         """Initialize professionalization processor."""
         super().__init__("professionalize")
-        # Note: In production, would initialize Mellona client here
         self.mellona_available = False
+        self._provider = None
         self._check_mellona()
 
     def _check_mellona(self) -> None:
-        """Check if Mellona is available for LLM processing."""
+        """Check if Mellona is available and create the provider once."""
         try:
             import mellona
-            self.mellona_available = True
-            self.logger.info("Mellona LLM available for professionalization")
         except ImportError:
             self.logger.warning("Mellona not available - using basic professionalization")
             self.mellona_available = False
+            return
+
+        try:
+            self._provider = mellona.get_provider("worker")
+        except Exception as e:
+            self.logger.warning(
+                f"Mellona provider unavailable: {e} - using basic professionalization"
+            )
+            self.mellona_available = False
+            return
+
+        self.mellona_available = True
+        self.logger.info("Mellona LLM available for professionalization")
 
     def process(self, file_path: Path) -> Optional[Path]:
         """Professionalize text from transcription.
@@ -51,58 +64,161 @@ Keep the technical content and intent exactly - just clean up the presentation."
         Returns:
             Path to professionalized text file.
         """
-        if not file_path.exists():
-            self.logger.error(f"File not found: {file_path}")
-            return None
+        return self.process_batch([file_path])[0]
 
-        try:
-            # Read input text
-            with open(file_path, "r") as f:
-                raw_text = f.read()
+    def process_with_meta(self, file_path: Path) -> Optional[ProcessedSpec]:
+        """Professionalize text and return the spec with its first line.
+
+        Lets routing build the bead description without re-reading the
+        spec it was just handed.
+
+        Args:
+            file_path: Path to text file to professionalize.
+
+        Returns:
+            Processed spec, or None if processing failed.
+        """
+        return self.process_batch_with_meta([file_path])[0]
+
+    def process_batch(self, file_paths: List[Path]) -> List[Optional[Path]]:
+        """Professionalize several transcriptions with one batched LLM call.
+
+        Args:
+            file_paths: Paths to text files to professionalize.
+
+        Returns:
+            Path to professionalized text file (or None on failure) for each
+            input, in order.
+        """
+        return [
+            spec.path if spec else None for spec in self.process_batch_with_meta(file_paths)
+        ]
+
+    def process_batch_with_meta(self, file_paths: List[Path]) -> List[Optional[ProcessedSpec]]:
+        """Professionalize several transcriptions, keeping spec metadata.
+
+        Args:
+            file_paths: Paths to text files to professionalize.
+
+        Returns:
+            Processed spec (or None on failure) for each input, in order.
+        """
+        results: List[Optional[ProcessedSpec]] = [None] * len(file_paths)
+        indices: List[int] = []
+        texts: List[str] = []
+
+        for i, file_path in enumerate(file_paths):
+            if not file_path.exists():
+                self.logger.error(f"File not found: {file_path}")
+                continue
+
+            try:
+                # Read input text
+                with open(file_path, "r") as f:
+                    raw_text = f.read()
+            except Exception as e:
+                self.logger.error(f"Failed to professionalize {file_path}: {e}", exc_info=True)
+                continue
 
             if not raw_text.strip():
                 self.logger.warning(f"Empty file: {file_path}")
-                return None
+                continue
 
-            # Process text through Mellona if available, else basic processing
-            if self.mellona_available:
-                professionalized = self._professionalize_with_mellona(raw_text)
-            else:
-                professionalized = self._professionalize_basic(raw_text)
-
-            # Generate output filename
-            stem = file_path.stem
-            # Remove timestamp prefix for clean output names
-            if "_" in stem:
-                # Keep timestamp but clean up
-                parts = stem.split("_", 2)
-                if len(parts) == 3:
-                    timestamp, time_part, name = parts
-                    output_stem = f"{timestamp}_{time_part}_{name}"
-                else:
-                    output_stem = stem
+            indices.append(i)
+            texts.append(raw_text)
+
+        if not texts:
+            return results
+
+        # Process text through Mellona if available, else basic processing
+        if self.mellona_available:
+            professionalized = self._professionalize_batch_with_mellona(texts)
+        else:
+            professionalized = [self._professionalize_basic(text) for text in texts]
+
+        for i, text in zip(indices, professionalized):
+            file_path = file_paths[i]
+            try:
+                output_file = self._write_output(file_path, text)
+                results[i] = ProcessedSpec(
+                    path=output_file,
+                    first_line=text.split("\n", 1)[0].strip()[:100],
+                )
+            except Exception as e:
+                self.logger.error(f"Failed to professionalize {file_path}: {e}", exc_info=True)
+
+        return results
+
+    def _write_output(self, file_path: Path, professionalized: str) -> Path:
+        """Write professionalized text next to its source file.
+
+        Args:
+            file_path: Path to the source text file.
+            professionalized: Professionalized text to write.
+
+        Returns:
+            Path to the written spec file.
+        """
+        # Generate output filename
+        stem = file_path.stem
+        # Remove timestamp prefix for clean output names
+        if "_" in stem:
+            # Keep timestamp but clean up
+            parts = stem.split("_", 2)
+            if len(parts) == 3:
+                timestamp, time_part, name = parts
+                output_stem = f"{timestamp}_{time_part}_{name}"
             else:
                 output_stem = stem
+        else:
+            output_stem = stem
 
-            output_file = file_path.parent / f"{output_stem}-spec.md"
+        output_file = unique_path(file_path.parent, f"{output_stem}-spec", ".md")
 
-            # Ensure uniqueness
-            counter = 1
-            original_output = output_file
-            while output_file.exists():
-                output_file = original_output.parent / f"{original_output.stem}_{counter}.md"
-                counter += 1
+        # Write professionalized text, encoded once rather than through the
+        # text layer's incremental encoder
+        with open(output_file, "wb") as f:
+            f.write(professionalized.encode("utf-8"))
 
-            # Write professionalized text
-            with open(output_file, "w") as f:
-                f.write(professionalized)
+        self.logger.info(f"Professionalized: {output_file}")
+        return output_file
 
-            self.logger.info(f"Professionalized: {output_file}")
-            return output_file
+    def _professionalize_batch_with_mellona(self, texts: List[str]) -> List[str]:
+        """Use Mellona to professionalize several texts at once.
 
-        except Exception as e:
-            self.logger.error(f"Failed to professionalize {file_path}: {e}", exc_info=True)
-            return None
+        Uses the provider's batch interface when it has one so the fixed
+        per-request overhead is paid once per batch. If there is none, or
+        the batch call fails or returns the wrong number of results, each
+        text is sent on its own, concurrently.
+
+        Args:
+            texts: Raw texts to professionalize.
+
+        Returns:
+            Professionalized text for each input, in order.
+        """
+        if hasattr(self._provider, "call_batch"):
+            try:
+                results = list(
+                    self._provider.call_batch(
+                        system_prompt=self.SYSTEM_PROMPT,
+                        user_inputs=texts,
+                    )
+                )
+                if len(results) != len(texts):
+                    raise ValueError(f"got {len(results)} results for {len(texts)} texts")
+                return [result.text for result in results]
+            except Exception as e:
+                self.logger.warning(
+                    f"Mellona batch professionalization failed: {e}. Using per-text calls."
+                )
+
+        # Per-text calls fall back to the basic method on their own failures
+        if len(texts) == 1:
+            return [self._professionalize_with_mellona(texts[0])]
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(texts))) as executor:
+            return list(executor.map(self._professionalize_with_mellona, texts))
 
     def _professionalize_with_mellona(self, text: str) -> str:
         """Use Mellona to professionalize text.
@@ -114,10 +230,7 @@ Keep the technical content and intent exactly - just clean up the presentation."
             Professionalized text.
         """
         try:
-            from mellona import get_provider
-
-            provider = get_provider("worker")
-            result = provider.call(
+            result = self._provider.call(
                 system_prompt=self.SYSTEM_PROMPT,
                 user_input=text,
             )
@@ -135,19 +248,10 @@ Keep the technical content and intent exactly - just clean up the presentation."
         Returns:
             Lightly professionalized text.
         """
-        lines = []
-        lines.append("# Specification")
-        lines.append(f"**Date:** {datetime.now().strftime('%Y-%m-%d')}")
-        lines.append("")
-        lines.append("## Content")
-        lines.append("")
+        header = f"# Specification\n**Date:** {datetime.now():%Y-%m-%d}\n\n## Content\n"
 
         # Basic cleaning: remove excessive whitespace
-        paragraphs = text.split("\n\n")
-        for para in paragraphs:
-            cleaned = para.strip()
-            if cleaned and not cleaned.startswith("["):
-                lines.append(cleaned)
-                lines.append("")
-
-        return "\n".join(lines)
+        paragraphs = (para.strip() for para in text.split("\n\n"))
+        return header + "".join(
+            f"\n{para}\n" for para in paragraphs if para and not para.startswith("[")
+        )
@@ -1,11 +1,13 @@
 """Routing processor for directing specs to target projects and creating beads."""
 
 import logging
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Union
 
+from ..fileutils import link_or_copy, move_file, read_first_line, unique_path
 from ..routing import ProjectRouter, BeadCreator
+from .base import MAX_WORKERS, ProcessedSpec
 
 logger = logging.getLogger(__name__)
 
@@ -35,70 +37,58 @@ class RoutingProcessor:
 
     def process(
         self,
-        spec_file: Path,
+        spec_file: Union[Path, ProcessedSpec],
         source: str = "unknown",
     ) -> Optional[Path]:
         """Route a processed spec to its target project.
 
         Args:
-            spec_file: Path to processed spec file (in hentown/dev_notes/inbox/).
+            spec_file: Path to processed spec file (in hentown/dev_notes/inbox/),
+                or a ProcessedSpec whose first line is reused for the bead
+                description instead of re-reading the file.
             source: Source of the spec (gdrive, slack, etc.).
 
         Returns:
             Path to the routed spec file in target project inbox, or None if failed.
         """
+        first_line = None
+        if isinstance(spec_file, ProcessedSpec):
+            first_line = spec_file.first_line
+            spec_file = spec_file.path
+
         if not spec_file.exists():
             logger.error(f"Spec file not found: {spec_file}")
             return None
 
         try:
-            # Detect target project
-            project_name = self.router.detect_project(spec_file)
+            # Detect target project and its directories
+            route = self.router.route(spec_file)
+            project_name = route.project_name
             logger.info(f"Routing {spec_file.name} -> project: {project_name or 'hentown'}")
 
-            # Get target project paths
-            if project_name and project_name in self.router.cache:
-                target_project = self.router.cache[project_name]
-            else:
-                target_project = self.hentown_root
-
-            target_inbox = self.router.get_inbox_path(project_name)
-            target_archive = self.router.get_archive_path(project_name)
-
             # Copy spec to target inbox
-            target_spec_path = target_inbox / spec_file.name
-            if target_spec_path.exists():
-                # Avoid overwriting, add counter if needed
-                counter = 1
-                stem = spec_file.stem
-                suffix = spec_file.suffix
-                while target_spec_path.exists():
-                    target_spec_path = target_inbox / f"{stem}_{counter}{suffix}"
-                    counter += 1
-
-            shutil.copy2(spec_file, target_spec_path)
+            # Avoid overwriting, add counter if needed
+            target_spec_path = unique_path(route.inbox_path, spec_file.stem, spec_file.suffix)
+
+            # Same filesystem: the routed copy is a hardlink, and the archive
+            # move below is a rename, so no file data is copied
+            link_or_copy(spec_file, target_spec_path)
             logger.info(f"Copied spec to {target_spec_path}")
 
             # Archive original in hentown
             hentown_archive = self.router.get_archive_path(None)
-            archived_path = hentown_archive / spec_file.name
-            if archived_path.exists():
-                counter = 1
-                stem = spec_file.stem
-                suffix = spec_file.suffix
-                while archived_path.exists():
-                    archived_path = hentown_archive / f"{stem}_{counter}{suffix}"
-                    counter += 1
-
-            shutil.move(str(spec_file), str(archived_path))
+            archived_path = unique_path(hentown_archive, spec_file.stem, spec_file.suffix)
+
+            move_file(spec_file, archived_path)
             logger.info(f"Archived original to {archived_path}")
 
             # Create bead in target project
             bead_id = self._create_bead_for_spec(
-                target_project,
+                route.project_path,
                 target_spec_path,
                 source,
                 project_name,
+                first_line,
             )
 
             if bead_id:
@@ -110,12 +100,36 @@ class RoutingProcessor:
             logger.error(f"Failed to route spec {spec_file}: {e}", exc_info=True)
             return None
 
+    def process_batch(
+        self,
+        spec_files: List[Union[Path, ProcessedSpec]],
+        source: str = "unknown",
+    ) -> List[Optional[Path]]:
+        """Route several processed specs concurrently.
+
+        Routing is dominated by file copies and bd subprocesses, so specs are
+        handled on a thread pool.
+
+        Args:
+            spec_files: Paths to processed spec files, or ProcessedSpecs.
+            source: Source of the specs (gdrive, slack, etc.).
+
+        Returns:
+            Routed spec path (or None on failure) for each input, in order.
+        """
+        if len(spec_files) <= 1:
+            return [self.process(spec_file, source) for spec_file in spec_files]
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(spec_files))) as executor:
+            return list(executor.map(lambda spec_file: self.process(spec_file, source), spec_files))
+
     def _create_bead_for_spec(
         self,
         project_path: Path,
         spec_file: Path,
         source: str,
         project_name: Optional[str],
+        first_line: Optional[str] = None,
     ) -> Optional[str]:
         """Create a bead issue for the routed spec.
 
@@ -124,6 +138,8 @@ class RoutingProcessor:
             spec_file: Path to spec file in target inbox.
             source: Source (gdrive, slack, etc.).
             project_name: Target project name.
+            first_line: First line of the spec if already known; read from
+                spec_file otherwise.
 
         Returns:
             Bead issue ID, or None if creation failed or skipped.
@@ -137,8 +153,8 @@ class RoutingProcessor:
 
         # Generate description from first line of spec
         try:
-            with open(spec_file, "r") as f:
-                first_line = f.readline().strip()
+            if first_line is None:
+                first_line = read_first_line(spec_file)
             description = first_line[:100] if first_line else f"Auto-generated from pigeon ({source})"
         except Exception:
             description = f"Auto-generated from pigeon ({source})"
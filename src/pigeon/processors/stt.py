@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
+from ..fileutils import WRITE_BUFFER_SIZE
 from .base import Processor
 
 logger = logging.getLogger(__name__)
@@ -44,12 +45,15 @@ class STTProcessor(Processor):
 
             # For MVP: create placeholder transcription
             # In production: call actual STT service
-            with open(text_file, "w") as f:
-                f.write(f"[STT Transcription Placeholder]\n")
-                f.write(f"Source: {file_path.name}\n")
-                f.write(f"Timestamp: {datetime.now().isoformat()}\n")
-                f.write(f"\nTranscription would be generated from audio file.\n")
-                f.write(f"This is a placeholder for MVP implementation.\n")
+            timestamp = datetime.now().isoformat(timespec="seconds")
+            with open(text_file, "w", buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(
+                    f"[STT Transcription Placeholder]\n"
+                    f"Source: {file_path.name}\n"
+                    f"Timestamp: {timestamp}\n"
+                    f"\nTranscription would be generated from audio file.\n"
+                    f"This is a placeholder for MVP implementation.\n"
+                )
 
             self.logger.info(f"Created transcription: {text_file}")
             return text_file
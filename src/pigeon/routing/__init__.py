@@ -4,12 +4,13 @@ This module contains logic for routing processed items to target projects
 and creating Bead issues for tracking work.
 """
 
-from .router import ProjectRouter
+from .router import ProjectRouter, RouteDecision
 from .bead_creator import BeadCreator
 from .submodules import SubmoduleDiscoverer
 
 __all__ = [
     "ProjectRouter",
+    "RouteDecision",
     "BeadCreator",
     "SubmoduleDiscoverer",
 ]
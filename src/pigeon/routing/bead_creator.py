@@ -1,13 +1,62 @@
 """Creates bead issues for processed specs."""
 
 import logging
+import re
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 from datetime import datetime
 
+from ..fileutils import read_first_line
+
 logger = logging.getLogger(__name__)
 
+# Bead IDs as printed by "bd create"
+_BEAD_ID_RE = re.compile(r"\b((?:hentown|pigeon)-[a-z0-9\-]+)\b")
+
+# Projects known to have a .beads directory (only positives are cached,
+# so a project that gains beads later is still picked up)
+_projects_with_beads: Set[Path] = set()
+
+
+@lru_cache(maxsize=1)
+def _beads_cli_available() -> bool:
+    """Check once per process whether the beads CLI is available.
+
+    Returns:
+        True if ``bd --version`` runs successfully.
+    """
+    try:
+        subprocess.run(
+            ["bd", "--version"],
+            capture_output=True,
+            check=True,
+            timeout=5,
+        )
+        logger.info("Beads CLI available")
+        return True
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+        logger.warning("Beads CLI not available - bead creation will be skipped")
+        return False
+
+
+def _project_has_beads(project_path: Path) -> bool:
+    """Check whether a project has a .beads directory.
+
+    Args:
+        project_path: Path to project.
+
+    Returns:
+        True if the project supports beads.
+    """
+    if project_path in _projects_with_beads:
+        return True
+    if (project_path / ".beads").exists():
+        _projects_with_beads.add(project_path)
+        return True
+    return False
+
 
 class BeadCreator:
     """Creates bead issues in target projects."""
@@ -19,22 +68,7 @@ class BeadCreator:
             hentown_root: Path to hentown repository root.
         """
         self.hentown_root = hentown_root
-        self._check_beads_available()
-
-    def _check_beads_available(self) -> bool:
-        """Check if beads CLI is available."""
-        try:
-            subprocess.run(
-                ["bd", "--version"],
-                capture_output=True,
-                check=True,
-                timeout=5,
-            )
-            logger.info("Beads CLI available")
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            logger.warning("Beads CLI not available - bead creation will be skipped")
-            return False
+        self.beads_available = _beads_cli_available()
 
     def create(
         self,
@@ -54,7 +88,12 @@ class BeadCreator:
         Returns:
             Bead issue ID if successful, None otherwise.
         """
-        if not (project_path / ".beads").exists():
+        if not self.beads_available:
+            # Don't fork a process per spec just to learn bd is missing
+            logger.debug("Beads CLI not available - skipping bead creation")
+            return None
+
+        if not _project_has_beads(project_path):
             logger.debug(f"Project {project_path.name} has no .beads directory - skipping bead creation")
             return None
 
@@ -79,30 +118,26 @@ class BeadCreator:
             # Change to project directory for bead creation
             result = subprocess.run(
                 cmd,
-                cwd=str(project_path),
-                capture_output=True,
+                cwd=project_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
                 timeout=10,
             )
 
             if result.returncode == 0:
                 # Extract bead ID from output (format: "✓ Created issue: XXXXX")
-                output = result.stdout + result.stderr
-                lines = output.split("\n")
-                for line in lines:
-                    if "Created issue" in line or "✓" in line:
-                        # Try to extract bead ID
-                        parts = line.split()
-                        for part in parts:
-                            if part.startswith("hentown-") or part.startswith("pigeon-"):
-                                logger.info(f"Created bead: {part}")
-                                return part
+                match = _BEAD_ID_RE.search(result.stdout)
+                if match:
+                    bead_id = match.group(1)
+                    logger.info(f"Created bead: {bead_id}")
+                    return bead_id
 
                 logger.info(f"Bead created in {project_path.name} (exact ID unknown)")
                 return "created"
 
             else:
-                logger.error(f"Failed to create bead: {result.stderr}")
+                logger.error(f"Failed to create bead: {result.stdout}")
                 return None
 
         except subprocess.TimeoutExpired:
@@ -131,8 +166,7 @@ class BeadCreator:
 
         # Read first line of spec as description
         try:
-            with open(spec_file, "r") as f:
-                first_line = f.readline().strip()
+            first_line = read_first_line(spec_file)
             description = first_line[:100] if first_line else "Auto-generated from pigeon"
         except Exception:
             description = "Auto-generated from pigeon"
@@ -1,14 +1,44 @@
 """Project detection and routing logic for Pigeon."""
 
 import logging
+import os
 import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Set, Tuple
 
 from .submodules import SubmoduleDiscoverer
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# "Project: name" tag (group 1) or "@name" mention (group 2), in one pass;
+# the tag is case-folded with character classes rather than a case-insensitive
+# group, which keeps the regex engine on its literal fast path
+_PROJECT_RE = re.compile(r"[Pp][Rr][Oo][Jj][Ee][Cc][Tt]:\s*([a-z0-9\-]+)|@([a-z0-9\-]+)")
+
+# Leading bytes of a spec searched for "Project:" tags and "@" mentions
+DETECT_HEAD_BYTES = 512
+
+# Most content detections remembered; the least recently used go first
+DETECT_CACHE_SIZE = 256
+
+
+@dataclass
+class RouteDecision:
+    """Where a spec should be routed, resolved in one router call."""
+
+    project_name: Optional[str]  # None when the spec belongs to hentown
+    project_path: Path
+    inbox_path: Path
+    archive_path: Path
+
 
 class ProjectRouter:
     """Routes processed specs to target projects based on content."""
@@ -22,6 +52,12 @@ class ProjectRouter:
         self.hentown_root = Path(hentown_root)
         self.modules_dir = self.hentown_root / "modules"
         self.cache: Dict[str, Path] = {}
+        # (inbox, archive) per project name, with None for hentown itself
+        self._dirs: Dict[Optional[str], Tuple[Path, Path]] = {}
+        self._name_matcher = None
+        self._detect_cache: "OrderedDict[Tuple[str, int, int], Optional[str]]" = OrderedDict()
+        self._ensured: Set[Path] = set()
+        self._lock = threading.Lock()
         self._discoverer = SubmoduleDiscoverer(self.hentown_root)
         self._discover_projects()
 
@@ -29,7 +65,7 @@ class ProjectRouter:
         """Discover available projects with beads support.
 
         Uses git submodule discovery to find projects.
-        Falls back to directory scanning if submodule discovery fails.
+        Falls back to directory scanning if no submodules are initialized.
         """
         # First try submodule discovery
         submodules = self._discoverer.get_submodules(with_beads=True)
@@ -39,24 +75,134 @@ class ProjectRouter:
                 self.cache[submodule['name']] = project_path
                 logger.debug(f"Discovered project from submodule: {submodule['name']}")
 
-        # Fallback: also check modules directory directly (for non-submodule projects)
-        if self.modules_dir.exists():
-            for subdir in self.modules_dir.iterdir():
-                if subdir.is_dir() and (subdir / ".beads").exists():
-                    project_name = subdir.name
-                    if project_name not in self.cache:  # Don't override submodule discovery
-                        self.cache[project_name] = subdir
-                        logger.debug(f"Discovered project from modules dir: {project_name}")
+        # Fallback: scan the modules directory only when there are no
+        # initialized submodules, since .gitmodules is the source of truth
+        if not self._discoverer.get_submodules(with_beads=False):
+            try:
+                with os.scandir(self.modules_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir() and os.path.isdir(
+                            os.path.join(entry.path, ".beads")
+                        ):
+                            project_name = entry.name
+                            if project_name not in self.cache:  # Don't override submodule discovery
+                                self.cache[project_name] = Path(entry.path)
+                                logger.debug(f"Discovered project from modules dir: {project_name}")
+            except FileNotFoundError:
+                pass  # No modules dir; nothing to scan
 
         logger.info(f"Discovered {len(self.cache)} projects with beads support")
+        self._name_matcher = self._build_name_matcher()
+        self._dirs = {
+            name: self._project_dirs(path)
+            for name, path in [(None, self.hentown_root), *self.cache.items()]
+        }
+
+    @staticmethod
+    def _project_dirs(project_path: Path) -> Tuple[Path, Path]:
+        """Build a project's inbox and archive directory paths.
+
+        Args:
+            project_path: Root of the project.
+
+        Returns:
+            Tuple of (inbox path, archive path).
+        """
+        dev_notes = project_path / "dev_notes"
+        return dev_notes / "inbox", dev_notes / "inbox-archive"
+
+    def _build_name_matcher(self):
+        """Build an Aho-Corasick automaton over all project names.
+
+        Lets filename matching find every contained project name in a
+        single scan instead of one substring search per project.
+
+        Returns:
+            Automaton keyed by project name, or None if pyahocorasick is not
+            installed or there are no projects.
+        """
+        if ahocorasick is None or not self.cache:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for order, name in enumerate(self.cache):
+            automaton.add_word(name, (order, name))
+        automaton.make_automaton()
+        return automaton
+
+    def _match_filename(self, filename: str) -> Optional[str]:
+        """Find the first discovered project whose name occurs in a filename.
+
+        Args:
+            filename: Filename to search.
+
+        Returns:
+            Project name, or None if no project name occurs in it.
+        """
+        if self._name_matcher is not None:
+            # Same winner as the linear scan: earliest in discovery order
+            matches = [value for _, value in self._name_matcher.iter(filename)]
+            return min(matches)[1] if matches else None
+
+        for proj_name in self.cache.keys():
+            if proj_name in filename:
+                return proj_name
+        return None
+
+    def _detect_from_content(self, content: str) -> Optional[str]:
+        """Detect a project from "Project:" tags and "@" mentions.
+
+        Args:
+            content: Leading text of a spec file.
+
+        Returns:
+            Project name if a known tag or mention is found, None otherwise.
+        """
+        # Both forms need a literal ':' or '@'; without either there is
+        # nothing for the regex to find
+        if ":" not in content and "@" not in content:
+            return None
+
+        # Single scan for the first "Project: name" tag and the first
+        # "@project-name" mention
+        tag = None
+        mention = None
+        for match in _PROJECT_RE.finditer(content):
+            if match.group(1) is not None:
+                if tag is None:
+                    tag = match.group(1)
+                    if tag in self.cache:
+                        break  # A known tag wins outright
+            elif mention is None:
+                mention = match.group(2)
+            if tag is not None and mention is not None:
+                break
+
+        # Pattern 2: "Project: name"
+        if tag is not None:
+            if tag in self.cache:
+                logger.info(f"Detected project from 'Project:' tag: {tag}")
+                return tag
+            else:
+                logger.warning(f"Project not found: {tag}")
+
+        # Pattern 3: "@project-name"
+        if mention is not None and mention in self.cache:
+            logger.info(f"Detected project from '@' mention: {mention}")
+            return mention
+
+        return None
 
     def detect_project(self, file_path: Path) -> Optional[str]:
-        """Detect target project from spec file content.
+        """Detect target project from spec filename or content.
+
+        Checks, in order:
+        - A project name contained in the filename (no file read needed)
+        - "Project: project-name" in the first DETECT_HEAD_BYTES bytes
+        - "@project-name" in the first DETECT_HEAD_BYTES bytes
 
-        Looks for patterns like:
-        - "Project: project-name"
-        - "@project-name"
-        - First submodule mentioned in content
+        Content results are cached per path, mtime and size, so an unchanged
+        file is only read once.
 
         Args:
             file_path: Path to processed spec file.
@@ -64,45 +210,63 @@ class ProjectRouter:
         Returns:
             Project name if detected, None otherwise.
         """
-        if not file_path.exists():
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
             logger.warning(f"File not found: {file_path}")
             return None
+        except OSError as e:
+            logger.error(f"Error detecting project from {file_path}: {e}")
+            return None
+
+        # Pattern 1: file name contains a project name
+        proj_name = self._match_filename(file_path.name)
+        if proj_name is not None:
+            logger.info(f"Detected project from filename: {proj_name}")
+            return proj_name
+
+        cache_key = (os.fspath(file_path), st.st_mtime_ns, st.st_size)
+        with self._lock:
+            if cache_key in self._detect_cache:
+                self._detect_cache.move_to_end(cache_key)
+                return self._detect_cache[cache_key]
 
         try:
-            with open(file_path, "r") as f:
-                content = f.read(500)  # Read first 500 chars
-
-            # Pattern 1: "Project: name"
-            match = re.search(r"[Pp]roject:\s*([a-z0-9\-]+)", content)
-            if match:
-                project_name = match.group(1)
-                if project_name in self.cache:
-                    logger.info(f"Detected project from 'Project:' tag: {project_name}")
-                    return project_name
-                else:
-                    logger.warning(f"Project not found: {project_name}")
-
-            # Pattern 2: "@project-name"
-            match = re.search(r"@([a-z0-9\-]+)", content)
-            if match:
-                project_name = match.group(1)
-                if project_name in self.cache:
-                    logger.info(f"Detected project from '@' mention: {project_name}")
-                    return project_name
-
-            # Pattern 3: Check if file path contains project name
-            for proj_name in self.cache.keys():
-                if proj_name in file_path.name:
-                    logger.info(f"Detected project from filename: {proj_name}")
-                    return proj_name
-
-            logger.info(f"No project detected in {file_path.name}")
-            return None
+            # Unbuffered, so only the head is copied out of the page cache
+            # rather than a full read-ahead buffer
+            with open(file_path, "rb", buffering=0) as f:
+                content = f.read(DETECT_HEAD_BYTES).decode("utf-8", "replace")
+
+            project = self._detect_from_content(content)
+            if project is None:
+                logger.info(f"No project detected in {file_path.name}")
+
+            with self._lock:
+                self._detect_cache[cache_key] = project
+                if len(self._detect_cache) > DETECT_CACHE_SIZE:
+                    self._detect_cache.popitem(last=False)
+            return project
 
         except Exception as e:
             logger.error(f"Error detecting project from {file_path}: {e}")
             return None
 
+    def _ensure_dir(self, path: Path) -> Path:
+        """Create a directory once per router instead of on every lookup.
+
+        Args:
+            path: Directory to create if needed.
+
+        Returns:
+            The same path.
+        """
+        if path not in self._ensured:
+            with self._lock:
+                if path not in self._ensured:
+                    path.mkdir(parents=True, exist_ok=True)
+                    self._ensured.add(path)
+        return path
+
     def get_inbox_path(self, project_name: Optional[str]) -> Path:
         """Get inbox directory for a project.
 
@@ -112,14 +276,8 @@ class ProjectRouter:
         Returns:
             Path to project's inbox directory.
         """
-        if project_name and project_name in self.cache:
-            project_path = self.cache[project_name]
-        else:
-            project_path = self.hentown_root
-
-        inbox_path = project_path / "dev_notes" / "inbox"
-        inbox_path.mkdir(parents=True, exist_ok=True)
-        return inbox_path
+        inbox_path, _ = self._dirs.get(project_name) or self._dirs[None]
+        return self._ensure_dir(inbox_path)
 
     def get_archive_path(self, project_name: Optional[str]) -> Path:
         """Get archive directory for a project.
@@ -130,14 +288,31 @@ class ProjectRouter:
         Returns:
             Path to project's archive directory.
         """
-        if project_name and project_name in self.cache:
-            project_path = self.cache[project_name]
-        else:
-            project_path = self.hentown_root
-
-        archive_path = project_path / "dev_notes" / "inbox-archive"
-        archive_path.mkdir(parents=True, exist_ok=True)
-        return archive_path
+        _, archive_path = self._dirs.get(project_name) or self._dirs[None]
+        return self._ensure_dir(archive_path)
+
+    def route(self, file_path: Path) -> RouteDecision:
+        """Detect a spec's project and resolve its directories in one call.
+
+        Args:
+            file_path: Path to processed spec file.
+
+        Returns:
+            RouteDecision with the project's root, inbox and archive paths
+            (both created if needed). Specs with no detected project route
+            to hentown.
+        """
+        project_name = self.detect_project(file_path)
+        if project_name not in self.cache:
+            project_name = None
+
+        inbox_path, archive_path = self._dirs[project_name]
+        return RouteDecision(
+            project_name=project_name,
+            project_path=self.cache[project_name] if project_name else self.hentown_root,
+            inbox_path=self._ensure_dir(inbox_path),
+            archive_path=self._ensure_dir(archive_path),
+        )
 
     def list_projects(self) -> List[str]:
         """List all available projects.
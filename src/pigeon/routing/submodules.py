@@ -1,11 +1,11 @@
 """Git submodule discovery and enumeration for Pigeon routing."""
 
+import configparser
 import logging
 import os
-import re
 import subprocess
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -20,16 +20,20 @@ class SubmoduleDiscoverer:
             root_path: Path to git repository root (usually hentown).
         """
         self.root_path = Path(root_path)
+        # Parsed .gitmodules entries: name -> (relative path, url)
+        self._entries: Dict[str, Tuple[Path, Optional[str]]] = {}
+        # Probed metadata for initialized submodules, filled on demand
         self.cache: Dict[str, Dict] = {}
+        self._uninitialized: Set[str] = set()
+        # get_submodules results, built on first use: (all, with .beads)
+        self._listing: Optional[Tuple[List[Dict], List[Dict]]] = None
         self._discover()
 
     def _discover(self) -> None:
         """Discover all configured submodules from .gitmodules file.
 
-        Parses .gitmodules and checks which submodules have:
-        - Directory initialized
-        - .beads/ directory for bead support
-        - dev_notes/inbox/ directory for item routing
+        Only parses .gitmodules; the filesystem checks for each submodule
+        are deferred to _probe so unused submodules cost nothing.
         """
         gitmodules_path = self.root_path / ".gitmodules"
 
@@ -37,64 +41,137 @@ class SubmoduleDiscoverer:
             logger.warning(f"No .gitmodules file found at {gitmodules_path}")
             return
 
+        # .gitmodules is git-config (INI) syntax; strict=False tolerates
+        # repeated sections and interpolation=None keeps URLs with % intact
+        parser = configparser.ConfigParser(strict=False, interpolation=None)
         try:
-            with open(gitmodules_path, 'r') as f:
-                content = f.read()
-        except Exception as e:
+            parser.read(gitmodules_path, encoding="utf-8")
+        except (OSError, configparser.Error) as e:
             logger.error(f"Failed to read .gitmodules: {e}")
             return
 
-        # Parse each [submodule "name"] block, filtering comments
-        lines = []
-        for line in content.splitlines(keepends=True):
-            if not line.lstrip().startswith('#'):
-                lines.append(line)
-        clean_content = ''.join(lines)
+        for section in parser.sections():
+            if not section.startswith("submodule "):
+                continue
 
-        block_pattern = re.compile(
-            r'^\[submodule\s+"([^"]+)"\]\s*\n((?:[ \t]+\S.*\n?)*)',
-            re.MULTILINE
-        )
+            quoted = section.split('"', 2)
+            if len(quoted) < 3:
+                continue
+            submodule_name = quoted[1]
 
-        for match in block_pattern.finditer(clean_content):
-            submodule_name = match.group(1)
-            block_body = match.group(2)
+            path = parser.get(section, "path", fallback=None)
+            if not path:
+                continue
 
-            path_match = re.search(r'path\s*=\s*(.+)', block_body)
-            url_match = re.search(r'url\s*=\s*(.+)', block_body)
+            url = parser.get(section, "url", fallback=None)
+            self._entries[submodule_name] = (
+                Path(path.strip()),
+                url.strip() if url else None,
+            )
 
-            if not path_match:
-                continue
+        logger.info(f"Discovered {len(self._entries)} configured submodules")
 
-            submodule_path = Path(path_match.group(1).strip())
-            absolute_path = self.root_path / submodule_path
-            url = url_match.group(1).strip() if url_match else None
+    def _probe(self, submodule_name: str, present: bool = False) -> Optional[Dict]:
+        """Check a configured submodule on disk, memoizing the result.
 
-            # Check if submodule is initialized
-            if not absolute_path.is_dir():
-                logger.debug(f"Submodule '{submodule_name}' not initialized: {submodule_path}")
-                continue
+        Checks whether the submodule has:
+        - Directory initialized
+        - .beads/ directory for bead support
+        - dev_notes/inbox/ directory for item routing
 
-            # Check for .beads and dev_notes/inbox support
-            has_beads = (absolute_path / ".beads").is_dir()
-            has_inbox = (absolute_path / "dev_notes" / "inbox").is_dir()
-
-            metadata = {
-                'name': submodule_name,
-                'path': str(submodule_path),
-                'absolute_path': str(absolute_path),
-                'url': url,
-                'has_beads': has_beads,
-                'has_inbox': has_inbox,
-            }
-
-            self.cache[submodule_name] = metadata
-            logger.debug(
-                f"Discovered submodule: {submodule_name} "
-                f"(beads={has_beads}, inbox={has_inbox})"
-            )
+        Args:
+            submodule_name: Name of a configured submodule.
+            present: True if the submodule directory is already known to
+                exist, skipping that check.
+
+        Returns:
+            Submodule metadata dict, or None if not configured or not
+            initialized.
+        """
+        if submodule_name in self.cache:
+            return self.cache[submodule_name]
+        if submodule_name in self._uninitialized or submodule_name not in self._entries:
+            return None
+
+        submodule_path, url = self._entries[submodule_name]
+        absolute_path = self.root_path / submodule_path
+
+        # Check if submodule is initialized
+        if not present and not absolute_path.is_dir():
+            logger.debug(f"Submodule '{submodule_name}' not initialized: {submodule_path}")
+            self._uninitialized.add(submodule_name)
+            return None
+
+        # Check for .beads and dev_notes/inbox support
+        has_beads = (absolute_path / ".beads").is_dir()
+        has_inbox = (absolute_path / "dev_notes" / "inbox").is_dir()
+
+        metadata = {
+            'name': submodule_name,
+            'path': os.fspath(submodule_path),
+            'absolute_path': os.fspath(absolute_path),
+            'url': url,
+            'has_beads': has_beads,
+            'has_inbox': has_inbox,
+        }
+
+        self.cache[submodule_name] = metadata
+        logger.debug(
+            f"Discovered submodule: {submodule_name} "
+            f"(beads={has_beads}, inbox={has_inbox})"
+        )
+        return metadata
+
+    def _scan_present(self, names: List[str]) -> Set[str]:
+        """Find which submodules have a directory, one scandir per parent.
+
+        Submodules usually share a parent such as modules/, so listing each
+        parent once replaces a stat per submodule with a single directory
+        read whose entries carry their type.
 
-        logger.info(f"Discovered {len(self.cache)} submodules")
+        Args:
+            names: Configured submodule names to check.
+
+        Returns:
+            Names whose submodule directory exists.
+        """
+        by_parent: Dict[Path, Dict[str, str]] = {}
+        for name in names:
+            submodule_path = self.root_path / self._entries[name][0]
+            by_parent.setdefault(submodule_path.parent, {})[submodule_path.name] = name
+
+        present: Set[str] = set()
+        for parent, children in by_parent.items():
+            try:
+                with os.scandir(parent) as entries:
+                    for entry in entries:
+                        if entry.name in children and entry.is_dir():
+                            present.add(children[entry.name])
+            except OSError:
+                continue  # Missing parent: none of its submodules exist
+        return present
+
+    def _probe_all(self) -> List[Dict]:
+        """Probe every configured submodule.
+
+        Returns:
+            Metadata dicts for all initialized submodules, in .gitmodules order.
+        """
+        unprobed = [
+            name for name in self._entries
+            if name not in self.cache and name not in self._uninitialized
+        ]
+        if unprobed:
+            present = self._scan_present(unprobed)
+            for name in unprobed:
+                if name in present:
+                    self._probe(name, present=True)
+                else:
+                    logger.debug(f"Submodule '{name}' not initialized: {self._entries[name][0]}")
+                    self._uninitialized.add(name)
+
+        probed = (self._probe(name) for name in self._entries)
+        return [metadata for metadata in probed if metadata is not None]
 
     def get_submodules(self, with_beads: bool = True) -> List[Dict]:
         """Get list of discovered submodules.
@@ -105,10 +182,12 @@ class SubmoduleDiscoverer:
         Returns:
             List of submodule metadata dictionaries.
         """
-        if not with_beads:
-            return list(self.cache.values())
+        if self._listing is None:
+            submodules = self._probe_all()
+            self._listing = (submodules, [s for s in submodules if s['has_beads']])
 
-        return [s for s in self.cache.values() if s['has_beads']]
+        # Copy so callers cannot alter the memoized listing
+        return list(self._listing[1] if with_beads else self._listing[0])
 
     def find_submodule_for_project(self, project_name: str) -> Optional[Dict]:
         """Find submodule matching project name.
@@ -119,9 +198,7 @@ class SubmoduleDiscoverer:
         Returns:
             Submodule metadata dict, or None if not found.
         """
-        if project_name in self.cache:
-            return self.cache[project_name]
-        return None
+        return self._probe(project_name)
 
     def list_project_names(self, with_beads: bool = True) -> List[str]:
         """List all project names.
@@ -132,6 +209,4 @@ class SubmoduleDiscoverer:
         Returns:
             Sorted list of project names.
         """
-        if with_beads:
-            return sorted([s['name'] for s in self.cache.values() if s['has_beads']])
-        return sorted(self.cache.keys())
+        return sorted(s['name'] for s in self.get_submodules(with_beads=with_beads))
@@ -1,10 +1,50 @@
 """Base class for input sources."""
 
+import functools
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 from pathlib import Path
 
+# Seconds a successful availability probe is trusted before re-checking
+AVAILABILITY_TTL = 60
+
+
+def cache_success(seconds: float) -> Callable:
+    """Cache a truthy method result per instance for a number of seconds.
+
+    Meant for availability probes: a good result is reused until it
+    expires, while a failure is never cached so recovery is seen at once.
+
+    Args:
+        seconds: How long a truthy result stays valid.
+
+    Returns:
+        Decorator for a method taking only self.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        attr = f"_cached_{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(self):
+            now = time.monotonic()
+            cached = self.__dict__.get(attr)
+            if cached is not None and now - cached[0] < seconds:
+                return cached[1]
+
+            value = fn(self)
+            if value:
+                self.__dict__[attr] = (now, value)
+            else:
+                self.__dict__.pop(attr, None)
+            return value
+
+        return wrapper
+
+    return decorator
+
 
 @dataclass
 class SourceFile:
@@ -14,6 +54,7 @@ class SourceFile:
     source: str  # "gdrive" or "slack"
     timestamp: str  # ISO 8601 formatted timestamp
     metadata: dict  # Additional metadata from source
+    content: Optional[str] = None  # Text written to path, if the source built it in memory
 
 
 class InputSource(ABC):
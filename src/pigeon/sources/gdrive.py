@@ -1,19 +1,47 @@
 """Google Drive folder listener for input ingestion."""
 
 import os
+import json
+import asyncio
 import time
 import logging
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Dict, List, Set
+from typing import Deque, Iterable, Iterator, Optional, Dict, List, Tuple
 
 from pigeon.drive_client import DriveClient, create_timestamped_filename
 from pigeon.config import Config
-from .base import InputSource, SourceFile
+from pigeon.fileutils import link_or_copy, unique_path
+from .base import AVAILABILITY_TTL, InputSource, SourceFile, cache_success
 
 
 logger = logging.getLogger(__name__)
 
+# Longest wait between changes-feed checks while nothing is changing
+MAX_POLL_BACKOFF = 300
+
+# Most recently downloaded file IDs remembered; older ones are forgotten first
+MAX_PROCESSED_FILES = 100_000
+
+# Most new files downloaded per poll
+DOWNLOAD_BATCH_SIZE = 8
+
+# Sidecar in the inbox persisting the newest listed modifiedTime per folder,
+# with the IDs of the files at that time
+WATERMARK_FILE = ".gdrive-watermarks.json"
+
+
+def _now_iso() -> str:
+    """Return the current local time as a seconds-precision ISO string.
+
+    Formatted straight from time.localtime(), without a datetime object.
+    """
+    return "%04d-%02d-%02dT%02d:%02d:%02d" % time.localtime()[:6]
+
 
 class GoogleDriveSource(InputSource):
     """Google Drive folder listener for file ingestion.
@@ -40,12 +68,42 @@ class GoogleDriveSource(InputSource):
         self.folders = folders or [config.drive_folder]
         self.client = DriveClient(config)
         self._running = False
-        self._processed_files: Set[str] = set()  # Track downloaded file IDs
+        # Track downloaded file IDs, bounded LRU-style
+        self._processed_files: "OrderedDict[str, None]" = OrderedDict()
         self._last_poll_time: Dict[str, float] = {}  # Track last poll per folder
+        self._page_token: Optional[str] = None  # Drive changes feed position
+        self._folder_ids: Dict[str, str] = {}  # Resolved IDs of monitored folders
+        self._ready: Deque[SourceFile] = deque()  # Downloaded files not yet returned
+        # New files from the last listing not yet downloaded: (file info, folder)
+        self._listing: Optional[Iterator[Tuple[Dict, str]]] = None
+        # Next file taken from that listing; None once it is used up
+        self._lookahead: Optional[Tuple[Dict, str]] = None
+        self._listing_watermarks: Dict[str, str] = {}  # Newest modifiedTime in that listing
+        self._listing_watermark_ids: Dict[str, List[str]] = {}  # Files at that time
+        self._listing_failed = False  # Whether a download from that listing failed
+        # Files modified before these times (per folder) were already handled,
+        # as were the files listed at exactly that time
+        self._watermarks: Dict[str, str] = {}
+        self._watermark_ids: Dict[str, List[str]] = {}
+        self._load_watermarks()
+        for file_ids in self._watermark_ids.values():
+            # Listings include the watermark time itself; skip those files
+            self._processed_files.update(dict.fromkeys(file_ids))
+        self._lock = threading.Lock()  # Guards _processed_files across downloads
+        self._stop_event = threading.Event()  # Wakes the polling loop on stop()
+        self._pool = self._make_pool()
 
         # Verify connection on init
         self._verify_connection()
 
+        # Resolve folder paths to IDs once rather than on every poll
+        if self.client.service:
+            self._resolve_folder_ids()
+
+    def _make_pool(self) -> ThreadPoolExecutor:
+        """Create the download pool; its threads start on first use."""
+        return ThreadPoolExecutor(max_workers=self.config.max_parallel_downloads)
+
     def _verify_connection(self) -> None:
         """Verify Google Drive connection is working.
 
@@ -59,57 +117,288 @@ class GoogleDriveSource(InputSource):
     def poll(self) -> Optional[SourceFile]:
         """Poll folders for new files and download first available.
 
+        Files downloaded alongside the one returned are handed out by later
+        polls before the folders are listed again; see poll_many.
+
         Returns:
             SourceFile: Next new file downloaded, or None if no new files
         """
         if not self._running:
             return None
 
-        # Check each folder for new files
-        for folder_path in self.folders:
-            source_file = self._poll_folder(folder_path)
-            if source_file:
-                return source_file
+        if not self._ready:
+            self._ready.extend(self._download_batch())
+        return self._ready.popleft() if self._ready else None
 
-        return None
+    def poll_many(self) -> List[SourceFile]:
+        """Poll folders for new files and return every file downloaded.
+
+        All folders are listed in a single Drive query, and up to
+        DOWNLOAD_BATCH_SIZE new files are downloaded concurrently (at most
+        config.max_parallel_downloads at a time). Later batches are taken
+        from the same listing; folders are only listed again once it is
+        used up. Listings only include files modified at or after each
+        folder's watermark.
+
+        Returns:
+            Downloaded files in listing order; empty if there were none
+        """
+        if not self._running:
+            return []
+
+        if self._ready:
+            files = list(self._ready)
+            self._ready.clear()
+            return files
+
+        return self._download_batch()
+
+    async def poll_many_async(self) -> List[SourceFile]:
+        """Async variant of poll_many for use inside an event loop.
+
+        The blocking Drive calls run in worker threads, with at most
+        config.max_parallel_downloads downloads in flight, so the event
+        loop stays free while a batch is listed and downloaded.
+
+        Returns:
+            Downloaded files in listing order; empty if there were none
+        """
+        if not self._running:
+            return []
+
+        if self._ready:
+            files = list(self._ready)
+            self._ready.clear()
+            return files
+
+        pending = await asyncio.to_thread(self._take_pending)
+        semaphore = asyncio.Semaphore(self.config.max_parallel_downloads)
+
+        async def download(job: Tuple[Dict, str]) -> Optional[SourceFile]:
+            async with semaphore:
+                return await asyncio.to_thread(self._download_and_track, *job)
 
-    def _poll_folder(self, folder_path: str) -> Optional[SourceFile]:
-        """Poll a single folder for new files.
+        results = await asyncio.gather(*(download(job) for job in pending))
+        return self._collect(results)
+
+    def _download_batch(self) -> List[SourceFile]:
+        """Download the next batch of new files, listing folders if needed.
+
+        Returns:
+            Successfully downloaded files in listing order
+        """
+        pending = self._take_pending()
+        results = self._pool.map(lambda job: self._download_and_track(*job), pending)
+        return self._collect(results)
+
+    def _take_pending(self) -> List[Tuple[Dict, str]]:
+        """Take the next batch of new files, listing folders if needed.
+
+        Returns:
+            (file info, folder path) pairs to download; empty if none
+        """
+        pending = self._next_batch()
+        if not pending:
+            self._finish_listing()
+            try:
+                listings = self.client.batch_list_folders(
+                    self.folders, since=dict(self._watermarks)
+                )
+            except Exception as e:
+                logger.error(f"Error polling folders {self.folders}: {e}")
+                return []
+
+            self._start_listing(listings)
+            pending = self._next_batch()
+
+        if not pending:
+            self._finish_listing()
+        return pending
+
+    def _collect(self, results: Iterable[Optional[SourceFile]]) -> List[SourceFile]:
+        """Keep successful downloads, noting any failure in the listing.
 
         Args:
-            folder_path: Path to Google Drive folder (e.g., "/Voice Recordings")
+            results: Download results, None for each failed download
 
         Returns:
-            SourceFile: First new file found, or None
+            Successfully downloaded files in their original order
         """
+        files = []
+        for result in results:
+            if result is None:
+                self._listing_failed = True
+            else:
+                files.append(result)
+
+        if self._listing is not None and self._lookahead is None:
+            # That was the listing's last batch; settle watermarks now
+            # rather than on the next poll
+            self._finish_listing()
+        return files
+
+    def _start_listing(self, listings: Dict[str, List[Dict]]) -> None:
+        """Begin handing out new files from a fresh folder listing.
+
+        Args:
+            listings: File metadata dicts keyed by folder path
+        """
+        self._listing = self._iter_new_files(listings)
+        self._lookahead = None
+        self._listing_failed = False
+        self._listing_watermarks = {}
+        self._listing_watermark_ids = {}
+        for folder_path, files in listings.items():
+            times = [f["modifiedTime"] for f in files if f.get("modifiedTime")]
+            if times:
+                newest = max(times)
+                self._listing_watermarks[folder_path] = newest
+                self._listing_watermark_ids[folder_path] = [
+                    f["id"] for f in files if f.get("modifiedTime") == newest
+                ]
+
+    def _finish_listing(self) -> None:
+        """Retire a used-up listing, advancing watermarks if nothing failed.
+
+        Watermarks only move once every file in the listing was handled, so
+        a failed download is listed (and retried) again on the next poll.
+        """
+        if self._listing is None:
+            return
+        self._listing = None
+
+        if self._listing_failed:
+            return
+
+        changed = False
+        for folder_path, newest in self._listing_watermarks.items():
+            if newest < self._watermarks.get(folder_path, ""):
+                continue
+            file_ids = self._listing_watermark_ids[folder_path]
+            if (newest, file_ids) != (
+                self._watermarks.get(folder_path),
+                self._watermark_ids.get(folder_path),
+            ):
+                self._watermarks[folder_path] = newest
+                self._watermark_ids[folder_path] = file_ids
+                changed = True
+        if changed:
+            self._save_watermarks()
+
+    def _load_watermarks(self) -> None:
+        """Load persisted per-folder watermarks and the file IDs at each.
+
+        Older sidecars holding only a timestamp per folder are accepted.
+        """
+        watermark_file = self.inbox_dir / WATERMARK_FILE
+        if not watermark_file.exists():
+            return
+
+        try:
+            with open(watermark_file, "r") as f:
+                saved = json.load(f)
+            for folder_path, mark in saved.items():
+                if isinstance(mark, str):
+                    mark = {"modifiedTime": mark, "ids": []}
+                self._watermarks[folder_path] = mark["modifiedTime"]
+                self._watermark_ids[folder_path] = list(mark["ids"])
+        except Exception as e:
+            logger.warning(f"Failed to load Drive watermarks: {e}. Starting fresh.")
+            self._watermarks = {}
+            self._watermark_ids = {}
+
+    def _save_watermarks(self) -> None:
+        """Persist per-folder watermarks and file IDs atomically."""
+        watermark_file = self.inbox_dir / WATERMARK_FILE
+        temp_file = watermark_file.with_suffix(".json.tmp")
+        saved = {
+            folder_path: {"modifiedTime": mark, "ids": self._watermark_ids.get(folder_path, [])}
+            for folder_path, mark in self._watermarks.items()
+        }
+
         try:
-            # List files in folder
-            files = self.client.list_folder_files(folder_path)
+            with open(temp_file, "w") as f:
+                json.dump(saved, f)
+            temp_file.replace(watermark_file)
+        except Exception as e:
+            logger.warning(f"Failed to save Drive watermarks: {e}")
 
-            if not files:
-                logger.debug(f"No files found in {folder_path}")
-                return None
+    def _next_batch(self) -> List[Tuple[Dict, str]]:
+        """Take up to DOWNLOAD_BATCH_SIZE new files from the current listing.
 
-            # Find first unprocessed file
-            for file_info in files:
-                file_id = file_info["id"]
-                file_name = file_info["name"]
-                mime_type = file_info.get("mimeType", "")
+        One file more is read ahead, so the batch that uses up the listing
+        is known as such when its downloads are collected.
+        """
+        if self._listing is None:
+            return []
+        batch = [self._lookahead] if self._lookahead is not None else []
+        batch.extend(islice(self._listing, DOWNLOAD_BATCH_SIZE + 1 - len(batch)))
+        self._lookahead = batch.pop() if len(batch) > DOWNLOAD_BATCH_SIZE else None
+        return batch
 
-                # Skip folders and already processed files
-                if mime_type == "application/vnd.google-apps.folder":
-                    continue
+    def _iter_new_files(self, listings: Dict[str, List[Dict]]) -> Iterator[Tuple[Dict, str]]:
+        """Lazily yield new files across folders, in folder order.
 
-                if file_id in self._processed_files:
-                    continue
+        Files are checked against the processed set as they are reached, so
+        files downloaded since the listing was taken are skipped.
 
-                # Download the file
-                return self._download_and_track(file_info, folder_path)
+        Args:
+            listings: File metadata dicts keyed by folder path
 
-        except Exception as e:
-            logger.error(f"Error polling folder {folder_path}: {e}")
+        Yields:
+            (file info, folder path) for each file still needing download
+        """
+        for folder_path in self.folders:
+            for file_info in self._new_files(folder_path, listings.get(folder_path, [])):
+                if file_info["id"] not in self._processed_files:
+                    yield file_info, folder_path
 
-        return None
+    def _new_files(self, folder_path: str, files: List[Dict]) -> List[Dict]:
+        """Select files from a folder listing that still need downloading.
+
+        Args:
+            folder_path: Path to Google Drive folder (e.g., "/Voice Recordings")
+            files: File metadata dicts listed in the folder
+
+        Returns:
+            Unprocessed, non-folder entries in listing order
+        """
+        if not files:
+            logger.debug(f"No files found in {folder_path}")
+            return []
+
+        # Skip folders and already processed files
+        return [
+            file_info for file_info in files
+            if file_info.get("mimeType", "") != "application/vnd.google-apps.folder"
+            and file_info["id"] not in self._processed_files
+        ]
+
+    def _serve_from_cache(self, cache_path: Path, file_path: Path) -> bool:
+        """Place a cached download at a reserved inbox path.
+
+        Args:
+            cache_path: Cached copy of the file's content.
+            file_path: Reserved inbox path to place it at.
+
+        Returns:
+            True if the file was served; False if it could not be, in which
+            case ``file_path`` has been removed.
+        """
+        try:
+            link_or_copy(cache_path, file_path)
+        except OSError as e:
+            logger.warning(f"Failed to serve {file_path.name} from the download cache: {e}")
+            file_path.unlink(missing_ok=True)
+            return False
+
+        # Mark as recently used for eviction; the entry may already be evicted
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        logger.debug(f"Served {file_path.name} from the download cache")
+        return True
 
     def _download_and_track(self, file_info: Dict, folder_path: str) -> Optional[SourceFile]:
         """Download a file and track it as processed.
@@ -126,24 +415,47 @@ class GoogleDriveSource(InputSource):
         modified_time = file_info.get("modifiedTime", "")
 
         try:
-            # Create timestamped filename
+            # Create timestamped filename, reserved atomically so parallel
+            # downloads of same-named files never share a destination
             timestamped_name = create_timestamped_filename(original_name)
-            file_path = self.inbox_dir / timestamped_name
-
-            # Download file
-            self.client.download_file(file_id, str(file_path))
+            stem, ext = os.path.splitext(timestamped_name)
+            file_path = unique_path(self.inbox_dir, stem, ext)
+
+            # Serve from the local cache when this exact content was
+            # downloaded before; otherwise download and cache it
+            cache_path = self._cache_path(file_info)
+            served = False
+            if cache_path and cache_path.exists():
+                served = self._serve_from_cache(cache_path, file_path)
+                if not served:
+                    # The failed attempt released the name; reserve another
+                    file_path = unique_path(self.inbox_dir, stem, ext)
+            if not served:
+                try:
+                    self.client.download_file(file_id, str(file_path))
+                except Exception:
+                    file_path.unlink(missing_ok=True)
+                    raise
+                if cache_path:
+                    self._store_in_cache(file_path, cache_path)
 
             # Mark as processed
-            self._processed_files.add(file_id)
+            self._mark_processed(file_id)
 
-            # Parse modification time to ISO format
+            # Normalize modification time to a stdlib-parseable ISO 8601
+            # string (Drive uses a trailing "Z", which fromisoformat only
+            # accepts from Python 3.11)
             try:
-                # modifiedTime is already ISO 8601 from Google API
-                timestamp = modified_time if modified_time else datetime.now().isoformat()
-            except Exception:
-                timestamp = datetime.now().isoformat()
+                parsed = (
+                    datetime.fromisoformat(modified_time.replace("Z", "+00:00"))
+                    if modified_time
+                    else None
+                )
+                timestamp = parsed.isoformat() if parsed else _now_iso()
+            except ValueError:
+                timestamp = _now_iso()
 
-            logger.info(f"Downloaded {original_name} -> {timestamped_name}")
+            logger.info(f"Downloaded {original_name} -> {file_path.name}")
 
             # Create metadata
             metadata = {
@@ -166,18 +478,96 @@ class GoogleDriveSource(InputSource):
             logger.error(f"Failed to download {original_name}: {e}")
             return None
 
+    def _cache_path(self, file_info: Dict) -> Optional[Path]:
+        """Locate the download cache entry for a file's current content.
+
+        Args:
+            file_info: File metadata dict with id and md5Checksum
+
+        Returns:
+            Cache path keyed by file ID and checksum, or None if the cache is
+            disabled or Drive reported no checksum (e.g. Google Docs)
+        """
+        md5 = file_info.get("md5Checksum")
+        if not md5 or self.config.drive_cache_max_mb <= 0:
+            return None
+        return self.config.get_drive_cache_dir() / f"{file_info['id']}_{md5}"
+
+    def _store_in_cache(self, file_path: Path, cache_path: Path) -> None:
+        """Add a downloaded file to the cache and evict least recently used.
+
+        Failures are logged and otherwise ignored; the cache is best effort.
+
+        Args:
+            file_path: Freshly downloaded file in the inbox
+            cache_path: Cache entry to create
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            link_or_copy(file_path, cache_path)
+            self._evict_cache(cache_path.parent)
+        except OSError as e:
+            logger.warning(f"Failed to cache {file_path.name}: {e}")
+
+    def _evict_cache(self, cache_dir: Path) -> None:
+        """Remove least recently accessed cache entries beyond the size cap.
+
+        Args:
+            cache_dir: Download cache directory
+        """
+        limit = self.config.drive_cache_max_mb * 1024 * 1024
+        with os.scandir(cache_dir) as entries:
+            files = [(entry.stat(), entry.path) for entry in entries if entry.is_file()]
+
+        total = sum(st.st_size for st, _ in files)
+        for st, path in sorted(files, key=lambda item: item[0].st_atime):
+            if total <= limit:
+                break
+            try:
+                os.unlink(path)
+                total -= st.st_size
+            except OSError:
+                pass
+
+    def _mark_processed(self, file_id: str) -> None:
+        """Remember a downloaded file ID, evicting the oldest past the cap.
+
+        Args:
+            file_id: Google Drive file ID.
+        """
+        with self._lock:
+            self._processed_files[file_id] = None
+            self._processed_files.move_to_end(file_id)
+            if len(self._processed_files) > MAX_PROCESSED_FILES:
+                self._processed_files.popitem(last=False)
+
     def start(self) -> None:
         """Start the Google Drive polling loop.
 
-        Polls configured folders at specified interval.
+        Catches up on files already in the configured folders, then watches
+        the Drive changes feed and only lists folders when a change touches
+        one of them. Checks back off exponentially (up to MAX_POLL_BACKOFF
+        seconds) while nothing changes. A listing left unfinished by failed
+        downloads is retried every poll_interval regardless of changes.
         """
         self._running = True
+        self._stop_event.clear()
         logger.info(f"Starting Google Drive source (folders: {self.folders})")
 
         try:
+            self._page_token = self.client.get_start_page_token()
+            self._drain()
+
+            delay = self.config.poll_interval
             while self._running:
-                self.poll()
-                time.sleep(self.config.poll_interval)
+                if self._stop_event.wait(delay):
+                    break
+                changed = self._folders_changed()
+                if changed or self._listing_failed or self._listing is not None:
+                    self._drain()
+                    delay = self.config.poll_interval
+                else:
+                    delay = min(delay * 2, MAX_POLL_BACKOFF)
         except KeyboardInterrupt:
             logger.info("Google Drive source interrupted")
             self.stop()
@@ -185,9 +575,62 @@ class GoogleDriveSource(InputSource):
             logger.error(f"Google Drive source error: {e}")
             self._running = False
 
+    def _drain(self) -> None:
+        """Download new files until the monitored folders have none left."""
+        while self._running and self.poll():
+            pass
+
+    def _resolve_folder_ids(self) -> None:
+        """Resolve monitored folder paths to Drive folder IDs.
+
+        Folders that cannot be resolved yet are retried on the next call.
+        """
+        for folder_path in self.folders:
+            if folder_path not in self._folder_ids:
+                folder_id = self.client.get_folder_id(folder_path)
+                if folder_id:
+                    self._folder_ids[folder_path] = folder_id
+                else:
+                    logger.warning(f"Folder not found: {folder_path}")
+
+    def _folders_changed(self) -> bool:
+        """Check the Drive changes feed for changes in monitored folders.
+
+        Returns:
+            True if a monitored folder may have new files (including when the
+            changes feed is unavailable), False otherwise.
+        """
+        if self._page_token is None:
+            # No changes feed position; fall back to listing every time
+            self._page_token = self.client.get_start_page_token()
+            return True
+
+        changes = self.client.list_changes(self._page_token)
+        if changes is None:
+            # Token expired; restart the feed and re-list to catch up
+            self._page_token = self.client.get_start_page_token()
+            return True
+
+        files, self._page_token = changes
+        if not files:
+            return False
+
+        if len(self._folder_ids) < len(self.folders):
+            # Retry folders that did not exist when last resolved
+            self._resolve_folder_ids()
+
+        folder_ids = set(self._folder_ids.values())
+        return any(folder_ids.intersection(f.get("parents", [])) for f in files)
+
     def stop(self) -> None:
-        """Stop the Google Drive source."""
+        """Stop the Google Drive source.
+
+        Waits for in-flight downloads; the source can be started again.
+        """
         self._running = False
+        self._stop_event.set()
+        pool, self._pool = self._pool, self._make_pool()
+        pool.shutdown(wait=True)
         logger.info("Stopped Google Drive source")
 
     @property
@@ -196,12 +639,16 @@ class GoogleDriveSource(InputSource):
         return "gdrive"
 
     @property
+    @cache_success(AVAILABILITY_TTL)
     def is_available(self) -> bool:
-        """Check if the Google Drive source is available and authenticated."""
+        """Check if the Google Drive source is available and authenticated.
+
+        A successful result is reused for AVAILABILITY_TTL seconds.
+        """
         try:
             # Try to get root folder info as a simple connectivity test
             if self.client.service:
-                self.client.service.files().get(fileId="root").execute()
+                self.client.service.files().get(fileId="root", fields="id").execute()
                 return True
         except Exception as e:
             logger.warning(f"Google Drive source unavailable: {e}")
@@ -4,28 +4,194 @@ import os
 import json
 import time
 import logging
-from datetime import datetime
+import queue
+import re
+import ssl
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Set
+from typing import (
+    Any, Deque, Dict, FrozenSet, Hashable, Iterable, Iterator, Optional, List, Set, Tuple
+)
 from dataclasses import dataclass
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry import RateLimitErrorRetryHandler, default_retry_handlers
+from slack_sdk.socket_mode import SocketModeClient
+from slack_sdk.socket_mode.request import SocketModeRequest
+from slack_sdk.socket_mode.response import SocketModeResponse
 
-from .base import InputSource, SourceFile
+from .base import AVAILABILITY_TTL, InputSource, SourceFile, cache_success
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Maximum channels fetched concurrently per poll
+MAX_CHANNEL_WORKERS = 8
 
-@dataclass
+# conversations.history is a Tier 3 method: roughly 50 requests per minute
+HISTORY_REQUESTS_PER_MINUTE = 50
+
+# Messages per conversations.history page and channels per
+# conversations.list page; Slack recommends at most 200
+HISTORY_PAGE_SIZE = 200
+CHANNEL_LIST_PAGE_SIZE = 200
+
+# Public, private and direct-message channel IDs; channel names are lowercase
+_CHANNEL_ID_RE = re.compile(r"[CGD][A-Z0-9]+$")
+
+# Markdown written for each accepted message
+_MESSAGE_TEMPLATE = """# Slack Message
+
+**Date:** {timestamp}
+**Channel:** #{channel_name}
+**User:** {user_name} ({user_id})
+**Source:** slack
+
+---
+
+{text}
+"""
+
+# Sidecar in the inbox persisting the newest handed-out message ts per channel
+STATE_FILE = ".slack-state.json"
+
+# Whether message files can be created relative to an open inbox
+# directory descriptor, skipping the path walk to the inbox per file
+_DIR_FD_WRITES = hasattr(os, "O_DIRECTORY") and os.open in os.supports_dir_fd
+
+# Seconds before a Slack Web API request is abandoned
+SLACK_TIMEOUT = 10
+
+# Times a rate-limited (429) request is retried after its Retry-After delay
+RATE_LIMIT_RETRIES = 2
+
+# Seconds cached user and channel names stay valid, and most entries kept
+USER_CACHE_TTL = 3600
+USER_CACHE_SIZE = 10_000
+CHANNEL_CACHE_TTL = 3600
+CHANNEL_CACHE_SIZE = 1_000
+
+# Uncached authors at which one users.list pass beats a users.info call each
+BULK_USER_LOOKUP_MIN = 3
+
+# Runs of characters unsafe in filenames (including path separators) in
+# user names, replaced by a hyphen; compiled once rather than per message
+_FILENAME_SANITIZE_RE = re.compile(r"[^\w.-]+")
+
+
+class _TokenBucket:
+    """Thread-safe token bucket for client-side API rate limiting."""
+
+    def __init__(self, rate: float, capacity: int):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum tokens held (burst size).
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class _TTLCache:
+    """Thread-safe mapping whose entries expire and are evicted LRU-first.
+
+    Supports the dict operations the source uses (in, [], []=, get, len,
+    iteration), so tests can still substitute a plain dict.
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        """Initialize an empty cache.
+
+        Args:
+            ttl: Seconds an entry stays valid after it is stored.
+            max_size: Most entries kept; the least recently used go first.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a live entry, marking it recently used, or default."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def __getitem__(self, key: Hashable) -> Any:
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        missing = object()
+        return self.get(key, missing) is not missing
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._data))
+
+
+@dataclass(frozen=True, slots=True)
 class SlackConfig:
-    """Configuration for Slack source."""
+    """Configuration for Slack source.
+
+    Immutable and hashable; channels and authorized_user_ids are coerced to a
+    tuple and a frozenset so any iterable may be passed in.
+    """
 
     bot_token: str
-    channels: List[str]  # List of channel IDs or names to monitor
-    authorized_user_ids: Set[str]  # Set of authorized Slack user IDs
+    channels: Tuple[str, ...]  # Channel IDs or names to monitor
+    authorized_user_ids: FrozenSet[str]  # Set of authorized Slack user IDs
     poll_interval: int = 30  # Seconds between polls
+    app_token: Optional[str] = None  # App-level token (xapp-); enables Socket Mode
+
+    def __post_init__(self):
+        object.__setattr__(self, "channels", tuple(self.channels))
+        object.__setattr__(self, "authorized_user_ids", frozenset(self.authorized_user_ids))
 
 
 class SlackSource(InputSource):
@@ -44,14 +210,77 @@ class SlackSource(InputSource):
         """
         self.config = config
         self.inbox_dir = Path(inbox_dir)
-        self.client = WebClient(token=config.bot_token)
+        # slack_sdk opens a new urllib connection per call; sharing one SSL
+        # context avoids reloading the CA bundle for every request
+        self._ssl_context = ssl.create_default_context()
+        self.client = WebClient(
+            token=config.bot_token,
+            ssl=self._ssl_context,
+            timeout=SLACK_TIMEOUT,
+            user_agent_suffix="pigeon",
+            # A 429 backs off only the pool thread that hit it; other
+            # channels keep fetching meanwhile
+            retry_handlers=default_retry_handlers()
+            + [RateLimitErrorRetryHandler(max_retry_count=RATE_LIMIT_RETRIES)],
+        )
+        # Bot IDs can never be authorized, so drop them once here rather
+        # than checking every message
+        self._authorized_user_ids = frozenset(
+            user_id for user_id in config.authorized_user_ids if not user_id.startswith("B")
+        )
+        self._pool = self._make_pool()
         self._running = False
         self._last_message_ts = {}  # Track last message timestamp per channel
-        self._user_cache = {}  # Cache for user info lookups
+        # Timestamps saved by a previous run, applied as channels are resolved
+        self._restored_ts = self._load_state()
+        self._state_dirty = False
+        self._channels_resolved = False  # Set once configured channels are resolved
+        self._user_cache = _TTLCache(USER_CACHE_TTL, USER_CACHE_SIZE)  # User info lookups
+        self._channel_cache = _TTLCache(CHANNEL_CACHE_TTL, CHANNEL_CACHE_SIZE)  # Channel names
+        # users.info calls in progress, shared by concurrent lookups of a user
+        self._inflight_users: Dict[str, "Future[dict]"] = {}
+        self._inflight_lock = threading.Lock()
+        # Fetched messages not yet converted: (channel ID, message), oldest first
+        self._pending_messages: Deque[Tuple[str, dict]] = deque()
+        self._rate_limiter = _TokenBucket(
+            rate=HISTORY_REQUESTS_PER_MINUTE / 60,
+            capacity=HISTORY_REQUESTS_PER_MINUTE,
+        )
+        self._socket_client: Optional[SocketModeClient] = None
+        # Message files waiting for the background writer:
+        # (inbox directory, filename, content, completion)
+        self._write_queue: "queue.Queue[Tuple[str, str, bytes, Future]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._last_write: "Optional[Future[None]]" = None  # Set by _message_to_file
+        self._write_errors: List[OSError] = []  # Raised by the next flush()
+        # Handed-out messages whose ts waits on their file being written:
+        # (channel ID, ts, write or None when filtered out), oldest first
+        self._unconfirmed: Deque[Tuple[str, str, "Optional[Future[None]]"]] = deque()
+        # Channels with a failed write since the last fetch; their ts stays
+        # put so the message is fetched again
+        self._stalled_channels: Set[str] = set()
+        self._message_ready = threading.Event()  # Set when Socket Mode queues a message
 
         # Verify credentials on init
         self._verify_credentials()
 
+    def _make_pool(self) -> ThreadPoolExecutor:
+        """Create the channel fetch pool; its threads start on first use."""
+        return ThreadPoolExecutor(
+            max_workers=min(MAX_CHANNEL_WORKERS, max(1, len(self.config.channels)))
+        )
+
+    @property
+    def inbox_dir(self) -> Path:
+        """Directory message files are written to."""
+        return self._inbox_dir
+
+    @inbox_dir.setter
+    def inbox_dir(self, value: Path) -> None:
+        self._inbox_dir = Path(value)
+        # Plain string form for building per-message paths without pathlib
+        self._inbox_str = os.fspath(self._inbox_dir)
+
     def _verify_credentials(self) -> None:
         """Verify Slack bot credentials are valid.
 
@@ -65,6 +294,7 @@ class SlackSource(InputSource):
                     f"Slack authentication successful: {response['user_id']} "
                     f"in {response['team_id']}"
                 )
+                self._warm_user_cache()
             else:
                 raise SlackApiError(
                     message="Authentication failed",
@@ -74,18 +304,67 @@ class SlackSource(InputSource):
             logger.error(f"Failed to authenticate with Slack: {e.response['error']}")
             raise
 
+    def _warm_user_cache(self) -> None:
+        """Prefetch all workspace users into the user cache.
+
+        One paginated users.list call replaces a users.info round-trip per
+        distinct poster; _get_user_info falls back to the API on misses.
+        """
+        try:
+            for page in self.client.users_list(limit=1000):
+                for user in page.get("members", []):
+                    self._user_cache[user["id"]] = user
+            logger.debug(f"Prefetched {len(self._user_cache)} Slack users")
+        except SlackApiError as e:
+            logger.warning(f"Failed to prefetch Slack users: {e}")
+
     def _get_user_info(self, user_id: str) -> dict:
         """Get user information from cache or API.
 
+        Concurrent lookups of the same uncached user share one users.info
+        call: the first caller fetches and the others wait for its result.
+
         Args:
             user_id: Slack user ID
 
         Returns:
             dict: User information (name, display_name, etc.)
         """
-        if user_id in self._user_cache:
-            return self._user_cache[user_id]
+        user_info = self._user_cache.get(user_id)
+        if user_info is not None:
+            return user_info
+
+        with self._inflight_lock:
+            inflight = self._inflight_users.get(user_id)
+            if inflight is None:
+                inflight = self._inflight_users[user_id] = Future()
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            return inflight.result()
 
+        try:
+            user_info = self._fetch_user_info(user_id)
+            inflight.set_result(user_info)
+            return user_info
+        except BaseException as e:
+            inflight.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight_users[user_id]
+
+    def _fetch_user_info(self, user_id: str) -> dict:
+        """Fetch user information from the API, caching a successful result.
+
+        Args:
+            user_id: Slack user ID
+
+        Returns:
+            dict: User information, or a placeholder if the lookup failed
+        """
         try:
             response = self.client.users_info(user=user_id)
             if response["ok"]:
@@ -97,73 +376,169 @@ class SlackSource(InputSource):
 
         return {"name": user_id, "real_name": "Unknown User"}
 
+    def _prefetch_users(self, user_ids: Iterable[str]) -> None:
+        """Look up uncached authorized authors up front.
+
+        Authors missing from the prefetched user cache would otherwise be
+        looked up one users.info call at a time while messages are
+        converted. At least BULK_USER_LOOKUP_MIN misses (typically after
+        the cache expires) re-warm the whole cache with users.list; any
+        still missing are looked up with users.info in parallel.
+
+        Args:
+            user_ids: Authors of newly fetched messages
+        """
+        missing = {
+            user_id for user_id in user_ids
+            if self._is_authorized(user_id) and user_id not in self._user_cache
+        }
+        if len(missing) >= BULK_USER_LOOKUP_MIN:
+            self._warm_user_cache()
+            missing = {user_id for user_id in missing if user_id not in self._user_cache}
+        if missing:
+            list(self._pool.map(self._get_user_info, missing))
+
     def _resolve_channel_ids(self) -> List[str]:
         """Resolve channel names to IDs.
 
-        Handles both channel IDs (prefixed with C) and channel names.
+        Entries that are already channel IDs are used as-is. conversations.list
+        is only paged through when names need resolving, CHANNEL_LIST_PAGE_SIZE
+        channels at a time, and stops as soon as every name is found.
 
         Returns:
-            List[str]: List of resolved channel IDs
+            List[str]: List of resolved channel IDs, or an empty list if the
+            channel list could not be fetched
         """
-        resolved_ids = []
+        names = {c for c in self.config.channels if not _CHANNEL_ID_RE.match(c)}
+        channels_by_name = {}
 
         try:
-            # Get list of all channels the bot is a member of
-            response = self.client.conversations_list(types="public_channel,private_channel")
-            if not response["ok"]:
-                logger.error(f"Failed to list channels: {response}")
-                return resolved_ids
-
-            channels_by_name = {ch["name"]: ch["id"] for ch in response["channels"]}
-
-            for channel in self.config.channels:
-                if channel.startswith("C"):  # Already a channel ID
-                    resolved_ids.append(channel)
-                elif channel in channels_by_name:
-                    resolved_ids.append(channels_by_name[channel])
-                else:
-                    logger.warning(f"Channel not found: {channel}")
+            cursor = None
+            while not names.issubset(channels_by_name):
+                # Only channels the bot can see, a page at a time
+                response = self.client.conversations_list(
+                    types="public_channel,private_channel",
+                    limit=CHANNEL_LIST_PAGE_SIZE,
+                    cursor=cursor,
+                )
+                if not response["ok"]:
+                    logger.error(f"Failed to list channels: {response}")
+                    return []
+
+                for ch in response["channels"]:
+                    channels_by_name[ch["name"]] = ch["id"]
+                    self._channel_cache[ch["id"]] = ch["name"]
+
+                cursor = (response.get("response_metadata") or {}).get("next_cursor")
+                if not cursor:
+                    break
 
         except SlackApiError as e:
             logger.error(f"Failed to resolve channel IDs: {e}")
+            return []
+
+        resolved_ids = []
+        for channel in self.config.channels:
+            if channel not in names:  # Already a channel ID
+                resolved_ids.append(channel)
+            elif channel in channels_by_name:
+                resolved_ids.append(channels_by_name[channel])
+            else:
+                logger.warning(f"Channel not found: {channel}")
 
         return resolved_ids
 
+    def refresh_channels(self) -> None:
+        """Resolve the configured channels and start tracking any new ones.
+
+        Called automatically on the first poll; call again to pick up
+        channels created or renamed since. Resolution is retried on later
+        polls until at least one channel is found.
+        """
+        channel_ids = self._resolve_channel_ids()
+        for channel_id in channel_ids:
+            self._last_message_ts.setdefault(channel_id, self._restored_ts.get(channel_id, "0"))
+        self._channels_resolved = bool(channel_ids)
+
     def _get_channel_messages(self, channel_id: str) -> List[dict]:
         """Get new messages from a channel since last poll.
 
+        Follows the pagination cursor in HISTORY_PAGE_SIZE pages, so a
+        backlog is drained in one poll. The channel's timestamp is not
+        advanced here but as poll hands each message out.
+
         Args:
             channel_id: Slack channel ID
 
         Returns:
-            List[dict]: List of message objects
+            List[dict]: List of message objects, newest first
         """
         messages = []
 
         try:
             # Get last timestamp we've seen in this channel
             oldest = self._last_message_ts.get(channel_id, "0")
+            cursor = None
+
+            while True:
+                self._rate_limiter.acquire()
+                response = self.client.conversations_history(
+                    channel=channel_id,
+                    oldest=oldest,
+                    limit=HISTORY_PAGE_SIZE,
+                    cursor=cursor,
+                )
+                if not response["ok"]:
+                    return []
 
-            response = self.client.conversations_history(
-                channel=channel_id,
-                oldest=oldest,
-                limit=100  # Get up to 100 messages per poll
-            )
-
-            if response["ok"]:
-                messages = response["messages"]
+                messages.extend(response["messages"])
+                cursor = (response.get("response_metadata") or {}).get("next_cursor")
+                if not response.get("has_more") or not cursor:
+                    break
 
-                # Update last message timestamp
-                if messages:
-                    # Most recent message is at the start of the list
-                    self._last_message_ts[channel_id] = messages[0]["ts"]
-                    logger.debug(f"Found {len(messages)} new messages in {channel_id}")
+            if messages:
+                logger.debug(f"Found {len(messages)} new messages in {channel_id}")
 
         except SlackApiError as e:
             logger.error(f"Failed to get messages from {channel_id}: {e}")
+            return []
 
         return messages
 
+    def _load_state(self) -> dict:
+        """Load per-channel message timestamps saved by a previous run.
+
+        Returns:
+            dict: Channel ID to newest fetched message ts, or empty dict
+        """
+        state_file = self.inbox_dir / STATE_FILE
+        if not state_file.exists():
+            return {}
+
+        try:
+            data = state_file.read_bytes()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except Exception as e:
+            logger.warning(f"Failed to load Slack state: {e}. Starting fresh.")
+            return {}
+
+    def _save_state(self) -> None:
+        """Persist per-channel message timestamps atomically."""
+        state_file = self.inbox_dir / STATE_FILE
+        temp_file = state_file.with_suffix(".json.tmp")
+        self._state_dirty = False
+
+        if orjson is not None:
+            data = orjson.dumps(self._last_message_ts)
+        else:
+            data = json.dumps(self._last_message_ts).encode("utf-8")
+
+        try:
+            temp_file.write_bytes(data)
+            temp_file.replace(state_file)
+        except Exception as e:
+            logger.warning(f"Failed to save Slack state: {e}")
+
     def _is_authorized(self, user_id: str) -> bool:
         """Check if a user is authorized to submit messages.
 
@@ -173,11 +548,7 @@ class SlackSource(InputSource):
         Returns:
             bool: True if user is authorized
         """
-        # Bot messages and special messages should be filtered
-        if user_id.startswith("B"):  # Bot user ID
-            return False
-
-        return user_id in self.config.authorized_user_ids
+        return user_id in self._authorized_user_ids
 
     def _message_to_file(
         self,
@@ -188,6 +559,8 @@ class SlackSource(InputSource):
         """Convert a Slack message to a file.
 
         Filters messages and converts authorized ones to markdown files.
+        The file is written by a background thread; call flush() before
+        reading it.
 
         Args:
             message: Slack message object
@@ -217,37 +590,33 @@ class SlackSource(InputSource):
         user_info = self._get_user_info(user_id)
         user_name = user_info.get("real_name", user_info.get("name", "Unknown"))
 
-        # Parse message timestamp
-        ts = float(message.get("ts", "0"))
-        timestamp = datetime.fromtimestamp(ts).isoformat()
+        # Break the message timestamp down once for both the header and the
+        # filename, without building a datetime; ts is "<epoch>.<micros>" and
+        # only whole seconds are shown
+        epoch_seconds = message.get("ts", "0").partition(".")[0]
+        message_time = time.localtime(int(epoch_seconds or 0))
+        timestamp = "%04d-%02d-%02dT%02d:%02d:%02d" % message_time[:6]
 
         # Create markdown content with metadata
-        content = f"""# Slack Message
-
-**Date:** {timestamp}
-**Channel:** #{channel_name}
-**User:** {user_name} ({user_id})
-**Source:** slack
-
----
-
-{text}
-"""
+        content = _MESSAGE_TEMPLATE.format_map(
+            {
+                "timestamp": timestamp,
+                "channel_name": channel_name,
+                "user_name": user_name,
+                "user_id": user_id,
+                "text": text,
+            }
+        )
 
         # Create filename with timestamp
-        safe_timestamp = datetime.fromtimestamp(ts).strftime("%Y%m%d-%H%M%S")
-        sanitized_user = user_name.replace(" ", "-").lower()
+        safe_timestamp = time.strftime("%Y%m%d-%H%M%S", message_time)
+        sanitized_user = _FILENAME_SANITIZE_RE.sub("-", user_name.lower())
         filename = f"{safe_timestamp}-slack-{sanitized_user}.md"
 
-        file_path = self.inbox_dir / filename
-
-        # Write file
-        try:
-            file_path.write_text(content, encoding="utf-8")
-            logger.info(f"Created message file: {filename}")
-        except OSError as e:
-            logger.error(f"Failed to write message file {filename}: {e}")
-            return None
+        # Hand the write to the background writer so disk latency overlaps
+        # with fetching and converting the next message
+        self._last_write = self._enqueue_write(filename, content.encode("utf-8"))
+        file_path = Path(os.path.join(self._inbox_str, filename))
 
         # Create metadata
         metadata = {
@@ -264,39 +633,182 @@ class SlackSource(InputSource):
             path=file_path,
             source="slack",
             timestamp=timestamp,
-            metadata=metadata
+            metadata=metadata,
+            content=content,
         )
 
+    def _enqueue_write(self, filename: str, data: bytes) -> "Future[None]":
+        """Queue a message file in the inbox for the background writer thread.
+
+        Args:
+            filename: Name of the file within the inbox directory
+            data: Encoded file content
+
+        Returns:
+            Future: Completed once the file is written, or with the OSError
+            that stopped it
+        """
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="slack-writer", daemon=True
+            )
+            self._writer.start()
+        written: "Future[None]" = Future()
+        self._write_queue.put((self._inbox_str, filename, data, written))
+        return written
+
+    def _writer_loop(self) -> None:
+        """Write queued message files to disk, one at a time.
+
+        Where supported, the inbox directory is kept open and files are
+        created relative to it; it is reopened when the inbox changes.
+        """
+        dir_path = None
+        dir_fd = None
+        while True:
+            inbox, filename, data, written = self._write_queue.get()
+            try:
+                if not _DIR_FD_WRITES:
+                    target, target_dir_fd = os.path.join(inbox, filename), None
+                else:
+                    if inbox != dir_path:
+                        if dir_fd is not None:
+                            os.close(dir_fd)
+                        dir_path = dir_fd = None
+                        dir_fd = os.open(inbox, os.O_RDONLY | os.O_DIRECTORY)
+                        dir_path = inbox
+                    target, target_dir_fd = filename, dir_fd
+
+                # Raw descriptor writes: the payload is already encoded, so
+                # no buffered file object or text layer is needed
+                fd = os.open(
+                    target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=target_dir_fd
+                )
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+                logger.info(f"Created message file: {filename}")
+                written.set_result(None)
+            except OSError as e:
+                logger.error(f"Failed to write message file {filename}: {e}")
+                self._write_errors.append(e)
+                written.set_exception(e)
+            finally:
+                self._write_queue.task_done()
+
+    def flush(self) -> None:
+        """Block until every queued message file has been written.
+
+        Raises:
+            OSError: If any message file queued since the last flush could
+                not be written
+        """
+        self._write_queue.join()
+        errors, self._write_errors = self._write_errors, []
+        if errors:
+            raise OSError(f"Failed to write {len(errors)} Slack message file(s)") from errors[0]
+
     def poll(self) -> Optional[SourceFile]:
         """Poll for new messages from configured channels.
 
+        Channels are fetched concurrently; messages not returned by this
+        call are queued and returned by later polls before fetching again.
+        In Socket Mode nothing is fetched: poll only drains messages queued
+        by incoming events.
+
         Returns:
-            SourceFile: Next new message converted to file, or None
+            SourceFile: Next new message converted to file (written in the
+            background; see flush()), or None
         """
         if not self._running:
             return None
 
-        # Resolve channel IDs on first poll
-        if not self._last_message_ts:
-            channel_ids = self._resolve_channel_ids()
-            for channel_id in channel_ids:
-                self._last_message_ts[channel_id] = "0"
-
-        # Check each channel for new messages
-        for channel_id in self._last_message_ts.keys():
-            messages = self._get_channel_messages(channel_id)
-
-            # Process messages in reverse order (oldest first)
-            for message in reversed(messages):
-                source_file = self._message_to_file(
-                    message,
-                    channel_id,
-                    self._get_channel_name(channel_id)
+        self._confirm_progress()
+
+        # Resolve channel IDs once, on the first poll
+        if not self._channels_resolved:
+            self.refresh_channels()
+
+        if self._socket_client is None and not self._pending_messages:
+            # Settle every handed-out message first, so a channel whose
+            # write failed is fetched again from its last written message
+            self._write_queue.join()
+            self._confirm_progress()
+            self._stalled_channels.clear()
+
+            # Fetch all channels concurrently; poll latency is the slowest
+            # channel rather than the sum of all of them
+            channel_ids = list(self._last_message_ts)
+            for channel_id, messages in zip(
+                channel_ids, self._pool.map(self._get_channel_messages, channel_ids)
+            ):
+                # Queue messages in reverse order (oldest first)
+                self._pending_messages.extend(
+                    (channel_id, message) for message in reversed(messages)
                 )
-                if source_file:
-                    return source_file
+            self._prefetch_users(message.get("user") for _, message in self._pending_messages)
+
+        # Messages beyond the returned one stay queued for the next poll.
+        # Queued messages arrive grouped by channel, so the name is only
+        # looked up when the channel changes.
+        channel_name_for = None
+        channel_name = None
+        source_file = None
+        while self._pending_messages and source_file is None:
+            channel_id, message = self._pending_messages.popleft()
+            if channel_id != channel_name_for:
+                channel_name = self._get_channel_name(channel_id)
+                channel_name_for = channel_id
+            source_file = self._message_to_file(
+                message,
+                channel_id,
+                channel_name
+            )
+            # Only messages handed out (or filtered) move the channel on, so
+            # a stop with messages still queued refetches them next run
+            self._advance_ts(channel_id, message, self._last_write if source_file else None)
+            self._last_write = None
 
-        return None
+        if self._state_dirty:
+            self._save_state()
+
+        return source_file
+
+    def _advance_ts(
+        self, channel_id: str, message: dict, write: "Optional[Future[None]]" = None
+    ) -> None:
+        """Record a queued message as handled for its channel.
+
+        Args:
+            channel_id: Channel the message came from
+            message: Message just converted or filtered out
+            write: Pending write of the message's file, if one was queued
+        """
+        ts = message.get("ts")
+        if ts is not None:
+            self._unconfirmed.append((channel_id, ts, write))
+            self._confirm_progress()
+
+    def _confirm_progress(self) -> None:
+        """Advance channel timestamps over handled messages, in order.
+
+        Stops at the first message whose file is still being written. A
+        failed write stalls its channel, so neither that message nor any
+        later one in the channel is marked as seen until the next fetch.
+        """
+        while self._unconfirmed:
+            channel_id, ts, write = self._unconfirmed[0]
+            if write is not None and not write.done():
+                break
+            self._unconfirmed.popleft()
+            if write is not None and write.exception() is not None:
+                self._stalled_channels.add(channel_id)
+            if channel_id not in self._stalled_channels:
+                self._last_message_ts[channel_id] = ts
+                self._state_dirty = True
 
     def _get_channel_name(self, channel_id: str) -> str:
         """Get channel name from cache or API.
@@ -307,11 +819,9 @@ class SlackSource(InputSource):
         Returns:
             str: Channel name (without #)
         """
-        if not hasattr(self, "_channel_cache"):
-            self._channel_cache = {}
-
-        if channel_id in self._channel_cache:
-            return self._channel_cache[channel_id]
+        name = self._channel_cache.get(channel_id)
+        if name is not None:
+            return name
 
         try:
             response = self.client.conversations_info(channel=channel_id)
@@ -325,17 +835,31 @@ class SlackSource(InputSource):
         return channel_id
 
     def start(self) -> None:
-        """Start the Slack polling loop.
+        """Start the Slack listening loop.
 
-        Polls for new messages at configured interval.
+        Uses Socket Mode when an app token is configured, so messages
+        arrive as events instead of being polled for; otherwise polls for
+        new messages at the configured interval.
         """
         self._running = True
         logger.info("Starting Slack source")
 
         try:
-            while self._running:
-                self.poll()
-                time.sleep(self.config.poll_interval)
+            if self.config.app_token:
+                self._start_socket_mode()
+                while self._running:
+                    self._message_ready.wait(self.config.poll_interval)
+                    self._message_ready.clear()
+                    while self.poll():
+                        pass
+            else:
+                while self._running:
+                    # Hand out everything one fetch queued before sleeping;
+                    # an empty queue ends the drain so each interval makes
+                    # one round of API calls
+                    while self.poll() and self._pending_messages:
+                        pass
+                    time.sleep(self.config.poll_interval)
         except KeyboardInterrupt:
             logger.info("Slack source interrupted")
             self.stop()
@@ -343,9 +867,60 @@ class SlackSource(InputSource):
             logger.error(f"Slack source error: {e}")
             self._running = False
 
+    def _start_socket_mode(self) -> None:
+        """Connect to Slack over Socket Mode and start receiving events."""
+        self.refresh_channels()
+
+        self._socket_client = SocketModeClient(
+            app_token=self.config.app_token,
+            web_client=self.client,
+        )
+        self._socket_client.socket_mode_request_listeners.append(
+            self._handle_socket_request
+        )
+        self._socket_client.connect()
+        logger.info("Connected to Slack via Socket Mode")
+
+    def _handle_socket_request(
+        self, client: SocketModeClient, req: SocketModeRequest
+    ) -> None:
+        """Queue message events from monitored channels.
+
+        Args:
+            client: Socket Mode client that received the request
+            req: Incoming Socket Mode request
+        """
+        if req.type != "events_api":
+            return
+
+        # Acknowledge promptly so Slack does not redeliver the event
+        client.send_socket_mode_response(SocketModeResponse(envelope_id=req.envelope_id))
+
+        event = req.payload.get("event", {})
+        if event.get("type") != "message" or event.get("subtype"):
+            return
+
+        channel_id = event.get("channel")
+        if channel_id not in self._last_message_ts:
+            return
+
+        self._pending_messages.append((channel_id, event))
+        self._message_ready.set()
+
     def stop(self) -> None:
         """Stop the Slack source."""
         self._running = False
+        self._message_ready.set()
+        if self._socket_client is not None:
+            self._socket_client.close()
+            self._socket_client = None
+        self._write_queue.join()
+        self._confirm_progress()
+        if self._state_dirty:
+            self._save_state()
+        # Swap in an idle pool so the source can be started again
+        pool, self._pool = self._pool, self._make_pool()
+        pool.shutdown(wait=True)
         logger.info("Stopped Slack source")
 
     @property
@@ -354,8 +929,12 @@ class SlackSource(InputSource):
         return "slack"
 
     @property
+    @cache_success(AVAILABILITY_TTL)
     def is_available(self) -> bool:
-        """Check if the Slack source is available and authenticated."""
+        """Check if the Slack source is available and authenticated.
+
+        A successful result is reused for AVAILABILITY_TTL seconds.
+        """
         try:
             response = self.client.auth_test()
             return response["ok"]
@@ -371,6 +950,7 @@ def create_slack_source_from_env(inbox_dir: Path) -> Optional[SlackSource]:
     - SLACK_CHANNELS: Comma-separated list of channel IDs or names
     - SLACK_AUTHORIZED_USERS: Comma-separated list of authorized user IDs
     - SLACK_POLL_INTERVAL: Optional polling interval (default 30 seconds)
+    - SLACK_APP_TOKEN: Optional app-level token; enables Socket Mode instead of polling
 
     Args:
         inbox_dir: Path to inbox directory
@@ -384,14 +964,14 @@ def create_slack_source_from_env(inbox_dir: Path) -> Optional[SlackSource]:
         return None
 
     channels_str = os.getenv("SLACK_CHANNELS", "")
-    channels = [c.strip() for c in channels_str.split(",") if c.strip()]
+    channels = tuple(c.strip() for c in channels_str.split(",") if c.strip())
 
     if not channels:
         logger.warning("SLACK_CHANNELS not configured, skipping Slack source")
         return None
 
     authorized_users_str = os.getenv("SLACK_AUTHORIZED_USERS", "")
-    authorized_users = set(u.strip() for u in authorized_users_str.split(",") if u.strip())
+    authorized_users = frozenset(u.strip() for u in authorized_users_str.split(",") if u.strip())
 
     if not authorized_users:
         logger.warning("SLACK_AUTHORIZED_USERS not configured, skipping Slack source")
@@ -404,6 +984,7 @@ def create_slack_source_from_env(inbox_dir: Path) -> Optional[SlackSource]:
         channels=channels,
         authorized_user_ids=authorized_users,
         poll_interval=poll_interval,
+        app_token=os.getenv("SLACK_APP_TOKEN") or None,
     )
 
     return SlackSource(config, inbox_dir)
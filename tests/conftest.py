@@ -2,8 +2,17 @@
 
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 from pigeon.config import Config
+from pigeon.processors import ProcessingPipeline
+
+
+def pytest_collection_modifyitems(config, items):
+    """Pin tests marked serial to a single xdist worker."""
+    for item in items:
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group("serial"))
 
 
 @pytest.fixture
@@ -22,7 +31,7 @@ def tmp_config(tmp_path):
 
 
 @pytest.fixture
-def mock_drive_client(mocker):
+def mock_drive_client():
     """Create a mock Google Drive client."""
     mock = MagicMock()
     mock.list_files = MagicMock(return_value=[])
@@ -31,8 +40,44 @@ def mock_drive_client(mocker):
 
 
 @pytest.fixture
-def mock_mellona_provider(mocker):
+def mock_mellona_provider():
     """Create a mock Mellona provider."""
     mock = MagicMock()
-    mock.call = MagicMock(return_value=MagicMock(text="Test response"))
+    mock.call = MagicMock(return_value=SimpleNamespace(text="Test response"))
     return mock
+
+
+# Pipelines are built once per module and reset before each test
+@pytest.fixture(scope="module")
+def _pipeline_full():
+    return ProcessingPipeline(enable_stt=True, enable_professionalize=True)
+
+
+@pytest.fixture(scope="module")
+def _pipeline_stt_only():
+    return ProcessingPipeline(enable_stt=True, enable_professionalize=False)
+
+
+@pytest.fixture(scope="module")
+def _pipeline_empty():
+    return ProcessingPipeline(enable_stt=False, enable_professionalize=False)
+
+
+@pytest.fixture
+def pipeline_full(_pipeline_full):
+    """Pipeline with STT and professionalization, with empty history."""
+    _pipeline_full.reset_history()
+    return _pipeline_full
+
+
+@pytest.fixture
+def pipeline_stt_only(_pipeline_stt_only):
+    """Pipeline with only STT enabled, with empty history."""
+    _pipeline_stt_only.reset_history()
+    return _pipeline_stt_only
+
+
+@pytest.fixture
+def pipeline_empty(_pipeline_empty):
+    """Pipeline with every stage disabled."""
+    return _pipeline_empty
@@ -0,0 +1,240 @@
+"""Unit tests for shared filesystem helpers."""
+
+import errno
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from pigeon import fileutils
+from pigeon.fileutils import (
+    MAX_COUNTER_ATTEMPTS,
+    fast_copy,
+    link_or_copy,
+    move_file,
+    read_first_line,
+    unique_path,
+)
+
+
+class TestUniquePath:
+    """Test exclusive filename reservation."""
+
+    def test_reserves_plain_name(self, tmp_path):
+        """Test that a free name is created empty and returned as is."""
+        path = unique_path(tmp_path, "note", ".md")
+
+        assert path == tmp_path / "note.md"
+        assert path.read_bytes() == b""
+
+    def test_collisions_get_counter_suffixes(self, tmp_path):
+        """Test that taken names get _1, _2, ... suffixes."""
+        paths = [unique_path(tmp_path, "note", ".md") for _ in range(3)]
+
+        assert [p.name for p in paths] == ["note.md", "note_1.md", "note_2.md"]
+
+    def test_skips_names_already_listed(self, tmp_path):
+        """Test that names found in the directory listing are not retried."""
+        for name in ("note.md", "note_1.md", "note_3.md"):
+            (tmp_path / name).touch()
+
+        with patch("pigeon.fileutils.os.open", wraps=os.open) as mock_open:
+            path = unique_path(tmp_path, "note", ".md")
+
+        assert path.name == "note_2.md"
+        # One failed attempt for note.md, then note_1.md is skipped
+        assert mock_open.call_count == 2
+
+    def test_falls_back_to_random_name(self, tmp_path):
+        """Test that mkstemp is used once every counter suffix is taken."""
+        (tmp_path / "note.md").touch()
+        for counter in range(1, MAX_COUNTER_ATTEMPTS):
+            (tmp_path / f"note_{counter}.md").touch()
+
+        path = unique_path(tmp_path, "note", ".md")
+
+        assert path.parent == tmp_path
+        assert path.name.startswith("note_") and path.suffix == ".md"
+        assert path.exists()
+        assert len(list(tmp_path.iterdir())) == MAX_COUNTER_ATTEMPTS + 1
+
+    def test_concurrent_callers_get_distinct_paths(self, tmp_path):
+        """Test that threads reserving the same name never share a path."""
+        barrier = threading.Barrier(8)
+        paths = []
+
+        def reserve():
+            barrier.wait()
+            paths.append(unique_path(tmp_path, "note", ".md"))
+
+        threads = [threading.Thread(target=reserve) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(paths)) == 8
+
+
+class TestLinkOrCopy:
+    """Test hardlinking with a copy fallback."""
+
+    def test_hardlinks_when_possible(self, tmp_path):
+        """Test that the destination shares the source's inode."""
+        src = tmp_path / "src.m4a"
+        src.write_bytes(b"audio")
+        dst = tmp_path / "dst.m4a"
+
+        link_or_copy(src, dst)
+
+        assert dst.read_bytes() == b"audio"
+        assert os.path.samefile(src, dst)
+
+    def test_replaces_existing_destination(self, tmp_path):
+        """Test that a reserved destination is replaced, not appended to."""
+        src = tmp_path / "src.m4a"
+        src.write_bytes(b"audio")
+        dst = unique_path(tmp_path, "dst", ".m4a")
+
+        link_or_copy(src, dst)
+
+        assert dst.read_bytes() == b"audio"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["dst.m4a", "src.m4a"]
+
+    def test_copies_across_devices(self, tmp_path):
+        """Test that a cross-device link falls back to a copy."""
+        src = tmp_path / "src.m4a"
+        src.write_bytes(b"audio")
+        dst = tmp_path / "dst.m4a"
+        dst.write_bytes(b"reserved")
+
+        with patch("pigeon.fileutils.os.link", side_effect=OSError(errno.EXDEV, "EXDEV")):
+            link_or_copy(src, dst)
+
+        assert dst.read_bytes() == b"audio"
+        assert not os.path.samefile(src, dst)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["dst.m4a", "src.m4a"]
+
+
+class TestFastCopy:
+    """Test in-kernel copying and its fallbacks."""
+
+    @pytest.fixture
+    def src(self, tmp_path):
+        """Create a source file larger than one copy call might move."""
+        src = tmp_path / "src.bin"
+        src.write_bytes(os.urandom(3 * 1024 * 1024))
+        os.utime(src, (1_700_000_000, 1_700_000_000))
+        return src
+
+    def test_copies_contents_and_metadata(self, src, tmp_path):
+        """Test that contents and modification time are copied."""
+        dst = tmp_path / "dst.bin"
+
+        fast_copy(src, dst)
+
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime == src.stat().st_mtime
+
+    def test_falls_back_to_sendfile(self, src, tmp_path):
+        """Test that sendfile is used when copy_file_range is unsupported."""
+        dst = tmp_path / "dst.bin"
+
+        with patch.object(
+            fileutils.os, "copy_file_range", side_effect=OSError(errno.EXDEV, "EXDEV"), create=True
+        ), patch.object(fileutils.os, "sendfile", wraps=os.sendfile) as mock_sendfile:
+            fast_copy(src, dst)
+
+        assert mock_sendfile.called
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_falls_back_to_buffered_copy(self, src, tmp_path):
+        """Test that a plain copy is used when neither syscall is available."""
+        dst = tmp_path / "dst.bin"
+
+        with patch.object(
+            fileutils.os, "copy_file_range", side_effect=AttributeError, create=True
+        ), patch.object(
+            fileutils.os, "sendfile", side_effect=OSError(errno.EINVAL, "EINVAL")
+        ), patch.object(
+            fileutils.shutil, "copyfileobj", wraps=fileutils.shutil.copyfileobj
+        ) as mock_copy:
+            fast_copy(src, dst)
+
+        mock_copy.assert_called_once()
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_copies_empty_file(self, tmp_path):
+        """Test that an empty source yields an empty destination."""
+        src = tmp_path / "empty.bin"
+        src.touch()
+        dst = tmp_path / "dst.bin"
+        dst.write_bytes(b"stale")
+
+        fast_copy(src, dst)
+
+        assert dst.read_bytes() == b""
+
+
+class TestMoveFile:
+    """Test renaming with a cross-device fallback."""
+
+    def test_renames_on_same_filesystem(self, tmp_path):
+        """Test that a move replaces the destination."""
+        src = tmp_path / "src.md"
+        src.write_text("note")
+        dst = tmp_path / "dst.md"
+        dst.write_text("old")
+
+        move_file(src, dst)
+
+        assert not src.exists()
+        assert dst.read_text() == "note"
+
+    def test_moves_across_devices(self, tmp_path):
+        """Test that EXDEV falls back to shutil.move."""
+        src = tmp_path / "src.md"
+        src.write_text("note")
+        dst = tmp_path / "dst.md"
+
+        with patch("pigeon.fileutils.os.rename", side_effect=OSError(errno.EXDEV, "EXDEV")):
+            move_file(src, dst)
+
+        assert not src.exists()
+        assert dst.read_text() == "note"
+
+    def test_other_errors_propagate(self, tmp_path):
+        """Test that errors other than EXDEV are raised."""
+        with pytest.raises(FileNotFoundError):
+            move_file(tmp_path / "missing.md", tmp_path / "dst.md")
+
+
+class TestReadFirstLine:
+    """Test bounded first-line reads."""
+
+    def test_returns_stripped_first_line(self, tmp_path):
+        """Test that only the first line is returned, without whitespace."""
+        path = tmp_path / "note.md"
+        path.write_text("  # Title  \nbody\n")
+
+        assert read_first_line(path) == "# Title"
+
+    def test_reads_at_most_limit_bytes(self, tmp_path):
+        """Test that a long first line is cut at the byte limit."""
+        path = tmp_path / "note.md"
+        path.write_text("x" * 1000)
+
+        assert read_first_line(path, limit=10) == "x" * 10
+
+    def test_replaces_invalid_utf8(self, tmp_path):
+        """Test that undecodable bytes do not raise."""
+        path = tmp_path / "note.md"
+        path.write_bytes(b"caf\xe9\nrest")
+
+        assert read_first_line(path) == "caf\ufffd"
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test that an unreadable file raises OSError."""
+        with pytest.raises(OSError):
+            read_first_line(tmp_path / "missing.md")
@@ -1,34 +1,59 @@
 """Unit tests for Google Drive source."""
 
+import threading
+from dataclasses import dataclass, replace
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch, Mock
 from datetime import datetime
 from pigeon.sources import GoogleDriveSource
+from pigeon.sources.gdrive import MAX_POLL_BACKOFF
 from pigeon.sources.base import SourceFile
-from pigeon.config import Config
+from pigeon.drive_client import CHANGES_PAGE_SIZE, DriveClient, sanitize_filename
+
+
+@dataclass(frozen=True, slots=True)
+class FakeConfig:
+    """Plain stand-in for Config with the settings Drive code reads."""
+
+    root: Path
+    drive_folder: str = "/Voice Recordings"
+    poll_interval: int = 30
+    max_parallel_downloads: int = 2
+    drive_cache_max_mb: int = 16
+
+    def get_profile_dir(self) -> Path:
+        return self.root / "profile"
+
+    def get_drive_cache_dir(self) -> Path:
+        return self.root / "cache"
+
+    def get_folder_cache_file(self) -> Path:
+        return self.root / "pigeon-folder-cache.json"
 
 
 @pytest.fixture
 def mock_config(tmp_path):
-    """Create a mock config for testing."""
-    config = MagicMock(spec=Config)
-    config.drive_folder = "/Voice Recordings"
-    config.poll_interval = 30
-    return config
+    """Create a config for testing."""
+    return FakeConfig(tmp_path)
 
 
 @pytest.fixture
 def mock_drive_client():
     """Create a mock Google Drive client."""
-    client = MagicMock()
+    client = MagicMock(spec=DriveClient)
     client.service = MagicMock()
-    client.list_folder_files = MagicMock(return_value=[])
-    client.download_file = MagicMock()
-    client.get_file_metadata = MagicMock()
+    client.batch_list_folders.return_value = {}
     return client
 
 
+@pytest.fixture
+def drive_client(mock_drive_client):
+    """Patch DriveClient so GoogleDriveSource is built around the mock client."""
+    with patch("pigeon.sources.gdrive.DriveClient", return_value=mock_drive_client):
+        yield mock_drive_client
+
+
 @pytest.fixture
 def inbox_dir(tmp_path):
     """Create a temporary inbox directory."""
@@ -40,12 +65,8 @@ def inbox_dir(tmp_path):
 class TestGoogleDriveSourceInit:
     """Test GoogleDriveSource initialization."""
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_init_success(self, mock_drive_client_class, mock_config, inbox_dir):
+    def test_init_success(self, drive_client, mock_config, inbox_dir):
         """Test successful initialization."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_drive_client_class.return_value = mock_client
 
         source = GoogleDriveSource(mock_config, inbox_dir)
 
@@ -55,18 +76,37 @@ class TestGoogleDriveSourceInit:
         assert not source._running
         assert len(source._processed_files) == 0
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_init_with_custom_folders(self, mock_drive_client_class, mock_config, inbox_dir):
+    def test_init_with_custom_folders(self, drive_client, mock_config, inbox_dir):
         """Test initialization with custom folder list."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_drive_client_class.return_value = mock_client
 
         custom_folders = ["/Voice Recordings", "/Text Input"]
         source = GoogleDriveSource(mock_config, inbox_dir, folders=custom_folders)
 
         assert source.folders == custom_folders
 
+    def test_init_resolves_folder_ids(self, drive_client, mock_config, inbox_dir):
+        """Test that folder paths are resolved to IDs once at startup."""
+        drive_client.get_folder_id.side_effect = lambda path: {"/A": "id-a"}.get(path)
+
+        source = GoogleDriveSource(mock_config, inbox_dir, folders=["/A", "/Missing"])
+
+        assert source._folder_ids == {"/A": "id-a"}
+        assert drive_client.get_folder_id.call_count == 2
+
+    def test_init_resolves_folder_ids_once(self, drive_client, mock_config, inbox_dir):
+        """Test that steady-state polls reuse the folder IDs resolved at startup."""
+        drive_client.get_folder_id.return_value = "folder-id"
+        drive_client.batch_list_folders.return_value = {}
+        source = GoogleDriveSource(mock_config, inbox_dir)
+        source._running = True
+        drive_client.get_folder_id.reset_mock()
+
+        for _ in range(3):
+            source.poll()
+
+        drive_client.get_folder_id.assert_not_called()
+        assert drive_client.batch_list_folders.call_count == 3
+
     @patch("pigeon.sources.gdrive.DriveClient")
     def test_init_auth_failure(self, mock_drive_client_class, mock_config, inbox_dir):
         """Test initialization when authentication fails."""
@@ -79,13 +119,9 @@ class TestGoogleDriveSourceInit:
 class TestGoogleDriveSourcePolling:
     """Test Google Drive polling functionality."""
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_poll_no_files(self, mock_drive_client_class, mock_config, inbox_dir):
+    def test_poll_no_files(self, drive_client, mock_config, inbox_dir):
         """Test polling when no files are available."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_client.list_folder_files = MagicMock(return_value=[])
-        mock_drive_client_class.return_value = mock_client
+        drive_client.batch_list_folders.return_value = {"/Voice Recordings": []}
 
         source = GoogleDriveSource(mock_config, inbox_dir)
         source._running = True
@@ -93,15 +129,12 @@ class TestGoogleDriveSourcePolling:
         result = source.poll()
 
         assert result is None
-        mock_client.list_folder_files.assert_called_once_with("/Voice Recordings")
+        drive_client.batch_list_folders.assert_called_once_with(["/Voice Recordings"], since={})
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_poll_single_file(self, mock_drive_client_class, mock_config, inbox_dir):
+    def test_poll_single_file(self, drive_client, mock_config, inbox_dir):
         """Test polling with one available file."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_client.list_folder_files = MagicMock(
-            return_value=[
+        drive_client.batch_list_folders.return_value = {
+            "/Voice Recordings": [
                 {
                     "id": "file-123",
                     "name": "test recording.m4a",
@@ -110,13 +143,12 @@ class TestGoogleDriveSourcePolling:
                     "size": "5242880",
                 }
             ]
-        )
+        }
         # Mock download_file to actually create the file
         def mock_download(file_id, destination):
             Path(destination).write_text("fake audio data")
 
-        mock_client.download_file = MagicMock(side_effect=mock_download)
-        mock_drive_client_class.return_value = mock_client
+        drive_client.download_file.side_effect = mock_download
 
         source = GoogleDriveSource(mock_config, inbox_dir)
         source._running = True
@@ -131,13 +163,10 @@ class TestGoogleDriveSourcePolling:
         assert result.metadata["file_id"] == "file-123"
         assert "file-123" in source._processed_files
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_poll_skips_processed_files(self, mock_drive_client_class, mock_config, inbox_dir):
+    def test_poll_skips_processed_files(self, drive_client, mock_config, inbox_dir):
         """Test that polling skips already processed files."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_client.list_folder_files = MagicMock(
-            return_value=[
+        drive_client.batch_list_folders.return_value = {
+            "/Voice Recordings": [
                 {
                     "id": "file-123",
                     "name": "old file.m4a",
@@ -151,13 +180,11 @@ class TestGoogleDriveSourcePolling:
                     "modifiedTime": "2026-02-20T11:00:00Z",
                 },
             ]
-        )
-        mock_client.download_file = MagicMock()
-        mock_drive_client_class.return_value = mock_client
+        }
 
         source = GoogleDriveSource(mock_config, inbox_dir)
         source._running = True
-        source._processed_files.add("file-123")  # Mark first file as processed
+        source._mark_processed("file-123")  # Mark first file as processed
 
         result = source.poll()
 
@@ -165,13 +192,63 @@ class TestGoogleDriveSourcePolling:
         assert result is not None
         assert result.metadata["file_id"] == "file-456"
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_poll_skips_folders(self, mock_drive_client_class, mock_config, inbox_dir):
+    def test_poll_uses_modified_watermark(self, drive_client, mock_config, inbox_dir):
+        """Test that later listings only ask for files at or after the watermark."""
+        drive_client.batch_list_folders.return_value = {
+            "/Voice Recordings": [
+                {
+                    "id": "file-123",
+                    "name": "note.m4a",
+                    "mimeType": "audio/mp4",
+                    "modifiedTime": "2026-02-20T10:00:00.000Z",
+                }
+            ]
+        }
+
+        source = GoogleDriveSource(mock_config, inbox_dir)
+        source._running = True
+
+        assert source.poll() is not None
+        assert source.poll() is None
+
+        watermarks = {"/Voice Recordings": "2026-02-20T10:00:00.000Z"}
+        assert drive_client.batch_list_folders.call_args_list[0].kwargs["since"] == {}
+        assert drive_client.batch_list_folders.call_args_list[1].kwargs["since"] == watermarks
+
+        # The watermark survives a restart
+        assert GoogleDriveSource(mock_config, inbox_dir)._watermarks == watermarks
+
+    def test_restart_skips_files_at_watermark(self, drive_client, mock_config, inbox_dir):
+        """Test that files at the saved watermark time are not downloaded again."""
+        drive_client.batch_list_folders.return_value = {
+            "/Voice Recordings": [
+                {"id": "old", "name": "n0.txt", "modifiedTime": "2026-02-20T09:00:00.000Z"},
+                {"id": "new", "name": "n1.txt", "modifiedTime": "2026-02-20T10:00:00.000Z"},
+            ]
+        }
+        source = GoogleDriveSource(mock_config, inbox_dir)
+        source._running = True
+        assert len(source.poll_many()) == 2
+        # Stopped straight after the listing's last batch: nothing polls again
+
+        restarted = GoogleDriveSource(mock_config, inbox_dir)
+        restarted._running = True
+        drive_client.batch_list_folders.return_value = {
+            "/Voice Recordings": [
+                {"id": "new", "name": "n1.txt", "modifiedTime": "2026-02-20T10:00:00.000Z"},
+            ]
+        }
+
+        assert restarted.poll() is None
+        assert drive_client.batch_list_folders.call_args.kwargs["since"] == {
+            "/Voice Recordings": "2026-02-20T10:00:00.000Z"
+        }
+        assert drive_client.download_file.call_count == 2
+
+    def test_poll_skips_folders(self, drive_client, mock_config, inbox_dir):
         """Test that polling skips folder entries."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_client.list_folder_files = MagicMock(
-            return_value=[
+        drive_client.batch_list_folders.return_value = {
+            "/Voice Recordings": [
                 {
                     "id": "folder-123",
                     "name": "Subfolder",
@@ -184,9 +261,7 @@ class TestGoogleDriveSourcePolling:
                     "modifiedTime": "2026-02-20T11:00:00Z",
                 },
             ]
-        )
-        mock_client.download_file = MagicMock()
-        mock_drive_client_class.return_value = mock_client
+        }
 
         source = GoogleDriveSource(mock_config, inbox_dir)
         source._running = True
@@ -197,12 +272,96 @@ class TestGoogleDriveSourcePolling:
         assert result is not None
         assert result.metadata["file_id"] == "file-456"
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_poll_when_not_running(self, mock_drive_client_class, mock_config, inbox_dir):
+    def test_poll_downloads_batch_in_parallel(self, drive_client, mock_config, inbox_dir):
+        """Test that one listing downloads every new file and later polls drain them."""
+        drive_client.batch_list_folders.return_value = {
+            "/Voice Recordings": [
+                {"id": f"file-{i}", "name": "same name.m4a", "mimeType": "audio/mp4"}
+                for i in range(3)
+            ]
+        }
+
+        def mock_download(file_id, destination):
+            Path(destination).write_text(file_id)
+
+        drive_client.download_file.side_effect = mock_download
+
+        source = GoogleDriveSource(mock_config, inbox_dir)
+        source._running = True
+
+        results = [source.poll() for _ in range(3)]
+
+        drive_client.batch_list_folders.assert_called_once()
+        assert [r.metadata["file_id"] for r in results] == ["file-0", "file-1", "file-2"]
+        # Same-named files get distinct destinations
+        assert len({r.path for r in results}) == 3
+        assert [r.path.read_text() for r in results] == ["file-0", "file-1", "file-2"]
+
+    def test_poll_many_downloads_concurrently(self, drive_client, mock_config, inbox_dir):
+        """Test that poll_many runs up to max_parallel_downloads downloads at once."""
+        drive_client.batch_list_folders.return_value = {
+            "/Voice Recordings": [
+                {"id": f"file-{i}", "name": f"note {i}.m4a", "mimeType": "audio/mp4"}
+                for i in range(2)
+            ]
+        }
+        # Only passes if both downloads are in flight together
+        barrier = threading.Barrier(2, timeout=5)
+        drive_client.download_file.side_effect = lambda file_id, destination: barrier.wait()
+
+        source = GoogleDriveSource(mock_config, inbox_dir)
+        source._running = True
+
+        results = source.poll_many()
+
+        assert [r.metadata["file_id"] for r in results] == ["file-0", "file-1"]
+        assert source.poll_many() == []
+
+    @pytest.mark.asyncio
+    async def test_poll_many_async_downloads_concurrently(
+        self, drive_client, mock_config, inbox_dir
+    ):
+        """Test that poll_many_async overlaps downloads off the event loop."""
+        drive_client.batch_list_folders.return_value = {
+            "/Voice Recordings": [
+                {"id": f"file-{i}", "name": f"note {i}.m4a", "mimeType": "audio/mp4"}
+                for i in range(2)
+            ]
+        }
+        barrier = threading.Barrier(2, timeout=5)
+        drive_client.download_file.side_effect = lambda file_id, destination: barrier.wait()
+
+        source = GoogleDriveSource(mock_config, inbox_dir)
+        source._running = True
+
+        results = await source.poll_many_async()
+
+        assert [r.metadata["file_id"] for r in results] == ["file-0", "file-1"]
+
+    @patch("pigeon.sources.gdrive.DOWNLOAD_BATCH_SIZE", 2)
+    def test_poll_reuses_listing_across_batches(self, drive_client, mock_config, inbox_dir):
+        """Test that later batches come from the same listing until it is used up."""
+        drive_client.batch_list_folders.return_value = {
+            "/Voice Recordings": [
+                {"id": f"file-{i}", "name": f"note {i}.m4a", "mimeType": "audio/mp4"}
+                for i in range(5)
+            ]
+        }
+
+        source = GoogleDriveSource(mock_config, inbox_dir)
+        source._running = True
+
+        results = [source.poll() for _ in range(5)]
+
+        drive_client.batch_list_folders.assert_called_once()
+        assert [r.metadata["file_id"] for r in results] == [f"file-{i}" for i in range(5)]
+
+        # An exhausted listing triggers a fresh one
+        assert source.poll() is None
+        assert drive_client.batch_list_folders.call_count == 2
+
+    def test_poll_when_not_running(self, drive_client, mock_config, inbox_dir):
         """Test polling returns None when source is not running."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_drive_client_class.return_value = mock_client
 
         source = GoogleDriveSource(mock_config, inbox_dir)
         source._running = False
@@ -210,15 +369,21 @@ class TestGoogleDriveSourcePolling:
         result = source.poll()
 
         assert result is None
-        mock_client.list_folder_files.assert_not_called()
+        drive_client.batch_list_folders.assert_not_called()
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_poll_multiple_folders(self, mock_drive_client_class, mock_config, inbox_dir):
+    def test_poll_multiple_folders(self, drive_client, mock_config, inbox_dir):
         """Test polling multiple folders in order."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_client.list_folder_files = MagicMock(return_value=[])
-        mock_drive_client_class.return_value = mock_client
+        drive_client.batch_list_folders.return_value = {
+            "/Voice Recordings": [],
+            "/Text Input": [
+                {
+                    "id": "file-789",
+                    "name": "note.txt",
+                    "mimeType": "text/plain",
+                    "modifiedTime": "2026-02-20T12:00:00Z",
+                }
+            ],
+        }
 
         custom_folders = ["/Voice Recordings", "/Text Input"]
         source = GoogleDriveSource(mock_config, inbox_dir, folders=custom_folders)
@@ -226,24 +391,17 @@ class TestGoogleDriveSourcePolling:
 
         result = source.poll()
 
-        assert result is None
-        # Should call list_folder_files for each folder
-        assert mock_client.list_folder_files.call_count == 2
-        mock_client.list_folder_files.assert_any_call("/Voice Recordings")
-        mock_client.list_folder_files.assert_any_call("/Text Input")
+        # Both folders are listed in one batched call
+        drive_client.batch_list_folders.assert_called_once_with(custom_folders, since={})
+        assert result is not None
+        assert result.metadata["folder"] == "/Text Input"
 
 
 class TestGoogleDriveSourceDownload:
     """Test file download functionality."""
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_download_creates_file(self, mock_drive_client_class, mock_config, inbox_dir):
+    def test_download_creates_file(self, drive_client, mock_config, inbox_dir):
         """Test that download creates a file in inbox."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_client.download_file = MagicMock()
-        mock_drive_client_class.return_value = mock_client
-
         source = GoogleDriveSource(mock_config, inbox_dir)
 
         file_info = {
@@ -259,16 +417,70 @@ class TestGoogleDriveSourceDownload:
         assert result is not None
         assert result.path.parent == inbox_dir
         assert "test-recording.m4a" in result.path.name
-        mock_client.download_file.assert_called_once()
+        drive_client.download_file.assert_called_once()
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_download_sanitizes_filename(self, mock_drive_client_class, mock_config, inbox_dir):
-        """Test that download sanitizes filenames."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_client.download_file = MagicMock()
-        mock_drive_client_class.return_value = mock_client
+    def test_download_cache_hit_skips_network(self, drive_client, mock_config, inbox_dir, tmp_path):
+        """Test that a cached file with the same checksum is not downloaded again."""
+
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "file-123_abc123").write_text("cached audio")
 
+        source = GoogleDriveSource(mock_config, inbox_dir)
+        file_info = {
+            "id": "file-123",
+            "name": "test recording.m4a",
+            "mimeType": "audio/mp4",
+            "md5Checksum": "abc123",
+        }
+
+        result = source._download_and_track(file_info, "/Voice Recordings")
+
+        drive_client.download_file.assert_not_called()
+        assert result.path.read_text() == "cached audio"
+        assert list(inbox_dir.iterdir()) == [result.path]
+
+    def test_download_cache_link_failure_downloads(
+        self, drive_client, mock_config, inbox_dir, tmp_path
+    ):
+        """Test that a failed cache hit leaves no stub and downloads instead."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "file-123_abc123").write_text("cached audio")
+        drive_client.download_file.side_effect = (
+            lambda file_id, destination: Path(destination).write_text("fresh audio")
+        )
+
+        source = GoogleDriveSource(mock_config, inbox_dir)
+        file_info = {"id": "file-123", "name": "memo.m4a", "md5Checksum": "abc123"}
+        with patch("pigeon.sources.gdrive.link_or_copy", side_effect=OSError("EIO")):
+            result = source._download_and_track(file_info, "/Voice Recordings")
+
+        drive_client.download_file.assert_called_once()
+        assert result.path.read_text() == "fresh audio"
+        assert list(inbox_dir.iterdir()) == [result.path]
+        assert "file-123" in source._processed_files
+
+    def test_download_cache_touch_failure_still_serves(
+        self, drive_client, mock_config, inbox_dir, tmp_path
+    ):
+        """Test that a cache entry evicted after linking still counts as served."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "file-123_abc123").write_text("cached audio")
+
+        source = GoogleDriveSource(mock_config, inbox_dir)
+        file_info = {"id": "file-123", "name": "memo.m4a", "md5Checksum": "abc123"}
+        with patch("pigeon.sources.gdrive.os.utime", side_effect=FileNotFoundError):
+            result = source._download_and_track(file_info, "/Voice Recordings")
+
+        drive_client.download_file.assert_not_called()
+        assert result.path.read_text() == "cached audio"
+        assert list(inbox_dir.iterdir()) == [result.path]
+        assert "file-123" in source._processed_files
+
+    def test_download_sanitizes_filename(self, drive_client, mock_config, inbox_dir):
+        """Test that download sanitizes filenames."""
         source = GoogleDriveSource(mock_config, inbox_dir)
 
         file_info = {
@@ -286,13 +498,9 @@ class TestGoogleDriveSourceDownload:
         assert "(" not in result.path.name
         assert "<" not in result.path.name
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_download_failure_returns_none(self, mock_drive_client_class, mock_config, inbox_dir):
+    def test_download_failure_returns_none(self, drive_client, mock_config, inbox_dir):
         """Test that download failure returns None."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_client.download_file = MagicMock(side_effect=Exception("Download failed"))
-        mock_drive_client_class.return_value = mock_client
+        drive_client.download_file.side_effect = Exception("Download failed")
 
         source = GoogleDriveSource(mock_config, inbox_dir)
 
@@ -309,14 +517,8 @@ class TestGoogleDriveSourceDownload:
         # File should not be marked as processed on failure
         assert "file-123" not in source._processed_files
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_download_tracks_file_id(self, mock_drive_client_class, mock_config, inbox_dir):
+    def test_download_tracks_file_id(self, drive_client, mock_config, inbox_dir):
         """Test that downloaded files are tracked."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_client.download_file = MagicMock()
-        mock_drive_client_class.return_value = mock_client
-
         source = GoogleDriveSource(mock_config, inbox_dir)
 
         file_info = {
@@ -330,34 +532,106 @@ class TestGoogleDriveSourceDownload:
 
         assert "file-123" in source._processed_files
 
+    @patch("pigeon.sources.gdrive.MAX_PROCESSED_FILES", 2)
+    def test_processed_files_bounded(self, drive_client, mock_config, inbox_dir):
+        """Test that the oldest tracked file IDs are evicted past the cap."""
+
+        source = GoogleDriveSource(mock_config, inbox_dir)
+        for file_id in ["file-1", "file-2", "file-1", "file-3"]:
+            source._mark_processed(file_id)
+
+        assert list(source._processed_files) == ["file-1", "file-3"]
+
 
 class TestGoogleDriveSourceStartStop:
     """Test source start and stop."""
 
-    @patch("time.sleep")
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_start_sets_running(self, mock_drive_client_class, mock_sleep, mock_config, inbox_dir):
+    def test_start_sets_running(self, drive_client, mock_config, inbox_dir):
         """Test that start sets running flag."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_client.list_folder_files = MagicMock(return_value=[])
-        mock_drive_client_class.return_value = mock_client
+        drive_client.batch_list_folders.return_value = {}
 
         source = GoogleDriveSource(mock_config, inbox_dir)
 
         # Mock to break out of loop after one iteration
-        mock_sleep.side_effect = KeyboardInterrupt()
-
-        source.start()
+        with patch.object(source._stop_event, "wait", side_effect=KeyboardInterrupt()):
+            source.start()
 
         assert not source._running  # Should be stopped after interrupt
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_stop_clears_running(self, mock_drive_client_class, mock_config, inbox_dir):
+    def test_start_backs_off_without_changes(self, drive_client, mock_config, inbox_dir):
+        """Test that quiet change checks back off and skip folder listing."""
+        drive_client.batch_list_folders.return_value = {}
+        drive_client.get_start_page_token.return_value = "token-1"
+        drive_client.list_changes.return_value = ([], "token-2")
+
+        source = GoogleDriveSource(mock_config, inbox_dir)
+        with patch.object(
+            source._stop_event, "wait", side_effect=[False, KeyboardInterrupt()]
+        ) as mock_wait:
+            source.start()
+
+        assert [c.args[0] for c in mock_wait.call_args_list] == [30, 60]
+        drive_client.list_changes.assert_called_once_with("token-1")
+        drive_client.batch_list_folders.assert_called_once()  # Initial catch-up only
+        assert source._page_token == "token-2"
+
+    def test_start_lists_folders_on_change(self, drive_client, mock_config, inbox_dir):
+        """Test that a change in a monitored folder triggers a listing."""
+        drive_client.batch_list_folders.return_value = {}
+        drive_client.get_start_page_token.return_value = "token-1"
+        drive_client.get_folder_id.return_value = "folder-1"
+        drive_client.list_changes.side_effect = [
+            ([{"id": "other", "parents": ["folder-2"]}], "token-2"),
+            ([{"id": "file-1", "parents": ["folder-1"]}], "token-3"),
+        ]
+
+        source = GoogleDriveSource(mock_config, inbox_dir)
+        with patch.object(
+            source._stop_event, "wait", side_effect=[False, False, KeyboardInterrupt()]
+        ) as mock_wait:
+            source.start()
+
+        assert [c.args[0] for c in mock_wait.call_args_list] == [30, 60, 30]
+        assert drive_client.batch_list_folders.call_count == 2
+        drive_client.get_folder_id.assert_called_once_with("/Voice Recordings")
+
+    def test_start_retries_failed_downloads_without_changes(
+        self, drive_client, mock_config, inbox_dir
+    ):
+        """Test that a failed download is retried each interval without a Drive change."""
+        file_info = {"id": "file-1", "name": "note.txt", "modifiedTime": "2024-01-01T00:00:00Z"}
+        drive_client.batch_list_folders.return_value = {"/Voice Recordings": [file_info]}
+        drive_client.get_start_page_token.return_value = "token-1"
+        drive_client.list_changes.return_value = ([], "token-1")
+        drive_client.download_file.side_effect = [OSError("transient"), None]
+
+        source = GoogleDriveSource(mock_config, inbox_dir)
+        with patch.object(
+            source._stop_event, "wait", side_effect=[False, False, KeyboardInterrupt()]
+        ) as mock_wait:
+            source.start()
+
+        assert [c.args[0] for c in mock_wait.call_args_list] == [30, 30, 60]
+        assert drive_client.download_file.call_count == 2
+        assert "file-1" in source._processed_files
+
+    def test_stop_wakes_polling_loop(self, drive_client, mock_config, inbox_dir):
+        """Test that stop() ends a long backoff wait immediately."""
+        drive_client.get_start_page_token.return_value = "token-1"
+        drive_client.list_changes.return_value = ([], "token-1")
+        source = GoogleDriveSource(replace(mock_config, poll_interval=MAX_POLL_BACKOFF), inbox_dir)
+
+        thread = threading.Thread(target=source.start)
+        thread.start()
+        while not source._running:
+            pass
+        source.stop()
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+
+    def test_stop_clears_running(self, drive_client, mock_config, inbox_dir):
         """Test that stop clears running flag."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_drive_client_class.return_value = mock_client
 
         source = GoogleDriveSource(mock_config, inbox_dir)
         source._running = True
@@ -366,51 +640,47 @@ class TestGoogleDriveSourceStartStop:
 
         assert not source._running
 
+    def test_stop_shuts_down_download_pool(self, drive_client, mock_config, inbox_dir):
+        """Test that stop shuts the download pool and leaves a usable one."""
+        source = GoogleDriveSource(mock_config, inbox_dir)
+        old_pool = source._pool
+
+        source.stop()
+
+        assert old_pool._shutdown
+        assert source._pool is not old_pool
+        assert source._pool.submit(lambda: 1).result() == 1
+
 
 class TestGoogleDriveSourceProperties:
     """Test source properties."""
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_name_property(self, mock_drive_client_class, mock_config, inbox_dir):
+    def test_name_property(self, drive_client, mock_config, inbox_dir):
         """Test name property."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_drive_client_class.return_value = mock_client
 
         source = GoogleDriveSource(mock_config, inbox_dir)
 
         assert source.name == "gdrive"
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_is_available_when_connected(self, mock_drive_client_class, mock_config, inbox_dir):
+    def test_is_available_when_connected(self, drive_client, mock_config, inbox_dir):
         """Test is_available returns True when connected."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_client.service.files().get().execute.return_value = {"id": "root"}
-        mock_drive_client_class.return_value = mock_client
+        drive_client.service.files().get().execute.return_value = {"id": "root"}
 
         source = GoogleDriveSource(mock_config, inbox_dir)
 
         assert source.is_available
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_is_available_when_disconnected(self, mock_drive_client_class, mock_config, inbox_dir):
+    def test_is_available_when_disconnected(self, drive_client, mock_config, inbox_dir):
         """Test is_available returns False when disconnected."""
-        mock_client = MagicMock()
-        mock_client.service = None
-        mock_drive_client_class.return_value = mock_client
+        drive_client.service = None
 
         source = GoogleDriveSource(mock_config, inbox_dir)
 
         assert not source.is_available
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_is_available_on_api_error(self, mock_drive_client_class, mock_config, inbox_dir):
+    def test_is_available_on_api_error(self, drive_client, mock_config, inbox_dir):
         """Test is_available returns False on API error."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_client.service.files().get().execute.side_effect = Exception("API error")
-        mock_drive_client_class.return_value = mock_client
+        drive_client.service.files().get().execute.side_effect = Exception("API error")
 
         source = GoogleDriveSource(mock_config, inbox_dir)
 
@@ -420,14 +690,8 @@ class TestGoogleDriveSourceProperties:
 class TestGoogleDriveSourceMetadata:
     """Test source file metadata."""
 
-    @patch("pigeon.sources.gdrive.DriveClient")
-    def test_source_file_metadata(self, mock_drive_client_class, mock_config, inbox_dir):
+    def test_source_file_metadata(self, drive_client, mock_config, inbox_dir):
         """Test that metadata is correctly set."""
-        mock_client = MagicMock()
-        mock_client.service = MagicMock()
-        mock_client.download_file = MagicMock()
-        mock_drive_client_class.return_value = mock_client
-
         source = GoogleDriveSource(mock_config, inbox_dir)
 
         file_info = {
@@ -446,3 +710,163 @@ class TestGoogleDriveSourceMetadata:
         assert result.metadata["mime_type"] == "audio/mp4"
         assert result.metadata["folder"] == "/Voice Recordings"
         assert result.metadata["size"] == "5242880"
+        assert result.timestamp == "2026-02-20T10:00:00+00:00"
+        assert datetime.fromisoformat(result.timestamp).tzinfo is not None
+
+    def test_missing_modified_time_uses_local_now(self, drive_client, mock_config, inbox_dir):
+        """Test that files without modifiedTime are stamped with the local time."""
+        source = GoogleDriveSource(mock_config, inbox_dir)
+        file_info = {"id": "file-123", "name": "test.m4a"}
+
+        result = source._download_and_track(file_info, "/Voice Recordings")
+
+        stamped = datetime.fromisoformat(result.timestamp)
+        assert stamped.tzinfo is None and stamped.microsecond == 0
+        assert abs((datetime.now() - stamped).total_seconds()) < 5
+
+
+class TestDriveClient:
+    """Tests for DriveClient listing, metadata, and downloads."""
+
+    def test_sanitize_filename(self):
+        """Test that spaces become hyphens and unsafe characters are dropped."""
+        assert sanitize_filename('my (draft) <v2>: a/b\\c|d?*".m4a') == "my-draft-v2-abcd.m4a"
+
+    def test_batch_list_folders_single_query(self, mock_config):
+        """Test that all folders are listed in one query and bucketed by parent."""
+        with patch.object(DriveClient, "_authenticate"), patch.object(
+            DriveClient, "_load_folder_cache", return_value={"/A": "id-a", "/B": "id-b"}
+        ):
+            client = DriveClient(mock_config)
+        client.service = MagicMock()
+        files_api = client.service.files.return_value
+        files_api.list.return_value.execute.return_value = {
+            "files": [
+                {"id": "f1", "name": "one.m4a", "parents": ["id-a"]},
+                {"id": "f2", "name": "two.m4a", "parents": ["id-b"]},
+            ]
+        }
+
+        results = client.batch_list_folders(["/A", "/B"])
+
+        files_api.list.assert_called_once()
+        query = files_api.list.call_args.kwargs["q"]
+        assert "'id-a' in parents or 'id-b' in parents" in query
+        assert [f["id"] for f in results["/A"]] == ["f1"]
+        assert [f["id"] for f in results["/B"]] == ["f2"]
+
+    def test_list_changes_pages_until_new_start_token(self, mock_config):
+        """Test that changes are read in small pages up to the new start token."""
+        with patch.object(DriveClient, "_authenticate"), patch.object(
+            DriveClient, "_load_folder_cache", return_value={}
+        ):
+            client = DriveClient(mock_config)
+        client.service = MagicMock()
+        changes_api = client.service.changes.return_value
+        changes_api.list.return_value.execute.side_effect = [
+            {"nextPageToken": "p2", "changes": [{"fileId": "f1", "file": {"id": "f1"}}]},
+            {"newStartPageToken": "t2", "changes": [{"fileId": "f2", "removed": True}]},
+        ]
+
+        files, token = client.list_changes("t1")
+
+        assert [f["id"] for f in files] == ["f1"]
+        assert token == "t2"
+        page_calls = changes_api.list.call_args_list
+        assert [c.kwargs["pageToken"] for c in page_calls] == ["t1", "p2"]
+        assert all(c.kwargs["pageSize"] == CHANGES_PAGE_SIZE for c in page_calls)
+
+    def test_metadata_cache_hits_within_ttl(self, mock_config):
+        """Test that repeated metadata lookups reuse one files.get call."""
+        with patch.object(DriveClient, "_authenticate"), patch.object(
+            DriveClient, "_load_folder_cache", return_value={}
+        ):
+            client = DriveClient(mock_config)
+        client.service = MagicMock()
+        client._thread_http = MagicMock()
+        files_api = client.service.files.return_value
+        files_api.get.return_value.execute.return_value = {"id": "f1", "name": "one.m4a"}
+
+        assert client.get_file_metadata("f1") == client.get_file_metadata("f1")
+        files_api.get.assert_called_once()
+
+        client.invalidate_file_metadata("f1")
+        client.get_file_metadata("f1")
+        assert files_api.get.call_count == 2
+
+    @patch("pigeon.drive_client.PARALLEL_DOWNLOAD_PARTS", 3)
+    @patch("pigeon.drive_client.PARALLEL_DOWNLOAD_THRESHOLD", 4)
+    def test_download_uses_parallel_ranges_for_large_files(self, mock_config, tmp_path):
+        """Test that a large file is fetched as a first range plus parallel ranges."""
+        with patch.object(DriveClient, "_authenticate"), patch.object(
+            DriveClient, "_load_folder_cache", return_value={}
+        ):
+            client = DriveClient(mock_config)
+        client.service = MagicMock()
+        data = b"0123456789abcdef"
+
+        def fake_get(url, params, headers, stream):
+            start, end = map(int, headers["Range"][len("bytes="):].split("-"))
+            response = MagicMock(status_code=206)
+            response.headers = {"Content-Range": f"bytes {start}-{end}/{len(data)}"}
+            response.iter_content.return_value = [data[start:end + 1]]
+            response.__enter__.return_value = response
+            return response
+
+        client._session = MagicMock()
+        client._session.get.side_effect = fake_get
+        destination = tmp_path / "big.m4a"
+
+        client.download_file("f1", str(destination))
+
+        assert destination.read_bytes() == data
+        ranges = sorted(c.kwargs["headers"]["Range"] for c in client._session.get.call_args_list)
+        assert ranges == ["bytes=0-3", "bytes=12-15", "bytes=4-7", "bytes=8-11"]
+
+    def test_download_empty_file(self, mock_config, tmp_path):
+        """Test that an unsatisfiable first range (416) yields an empty file."""
+        with patch.object(DriveClient, "_authenticate"), patch.object(
+            DriveClient, "_load_folder_cache", return_value={}
+        ):
+            client = DriveClient(mock_config)
+        client.service = MagicMock()
+        response = MagicMock(status_code=416)
+        response.__enter__.return_value = response
+        client._session = MagicMock()
+        client._session.get.return_value = response
+        destination = tmp_path / "empty.txt"
+        destination.write_bytes(b"stale")
+
+        client.download_file("f1", str(destination))
+
+        assert destination.read_bytes() == b""
+        response.raise_for_status.assert_not_called()
+
+    def test_download_unknown_total_streams_whole_file(self, mock_config, tmp_path):
+        """Test that a range reply without a total falls back to one full GET."""
+        with patch.object(DriveClient, "_authenticate"), patch.object(
+            DriveClient, "_load_folder_cache", return_value={}
+        ):
+            client = DriveClient(mock_config)
+        client.service = MagicMock()
+        data = b"0123456789"
+
+        def fake_get(url, params, stream, headers=None):
+            if headers:
+                response = MagicMock(status_code=206)
+                response.headers = {"Content-Range": "bytes 0-3/*"}
+                response.iter_content.return_value = [data[:4]]
+            else:
+                response = MagicMock(status_code=200, headers={})
+                response.iter_content.return_value = [data]
+            response.__enter__.return_value = response
+            return response
+
+        client._session = MagicMock()
+        client._session.get.side_effect = fake_get
+        destination = tmp_path / "unknown.m4a"
+
+        client.download_file("f1", str(destination))
+
+        assert destination.read_bytes() == data
+        assert client._session.get.call_count == 2
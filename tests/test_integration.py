@@ -1,19 +1,36 @@
 """Integration tests for Pigeon end-to-end workflow."""
 
+import os
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
-from pigeon.processors import ProcessingPipeline
 from pigeon.routing import ProjectRouter, BeadCreator
 
 
+@pytest.fixture
+def fake_root(fs):
+    """Create a working directory on pyfakefs's in-memory filesystem.
+
+    Use ``tmp_path`` instead for tests that need real file semantics
+    (permissions, ownership).
+    """
+    root = Path("/work")
+    fs.create_dir(root)
+    return root
+
+
+@pytest.mark.integration
 class TestEndToEndWorkflow:
     """Test complete Pigeon workflow."""
 
-    def test_complete_workflow_google_drive_to_inbox(self, tmp_path):
+    @pytest.mark.skipif(
+        bool(os.environ.get("PIGEON_SKIP_HEAVY")), reason="PIGEON_SKIP_HEAVY is set"
+    )
+    def test_complete_workflow_google_drive_to_inbox(self, pipeline_full, fake_root):
         """Test full workflow: download -> process -> route -> archive."""
         # Setup project structure
-        modules_dir = tmp_path / "modules"
+        modules_dir = fake_root / "modules"
         modules_dir.mkdir()
 
         test_proj_dir = modules_dir / "test-project"
@@ -26,18 +43,12 @@ class TestEndToEndWorkflow:
         archive_dir = test_proj_dir / "dev_notes" / "inbox-archive"
         archive_dir.mkdir(parents=True)
 
-        # Create processor pipeline
-        pipeline = ProcessingPipeline(
-            enable_stt=True,
-            enable_professionalize=True,
-        )
-
         # Create mock audio file
         audio_file = inbox_dir / "2026-01-01_12-00-00_test-recording.m4a"
         audio_file.write_text("fake audio data")
 
         # Process through pipeline
-        result = pipeline.process(audio_file)
+        result = pipeline_full.process(audio_file)
 
         # Verify processing succeeded
         assert result is not None
@@ -48,10 +59,10 @@ class TestEndToEndWorkflow:
         content = result.read_text()
         assert len(content) > 0
 
-    def test_workflow_with_routing(self, tmp_path):
+    def test_workflow_with_routing(self, fake_root):
         """Test workflow including routing to projects."""
         # Setup
-        modules_dir = tmp_path / "modules"
+        modules_dir = fake_root / "modules"
         modules_dir.mkdir()
 
         for proj_name in ["first-project", "second-project"]:
@@ -61,7 +72,7 @@ class TestEndToEndWorkflow:
             (proj_dir / "dev_notes" / "inbox").mkdir(parents=True)
 
         # Initialize router
-        router = ProjectRouter(tmp_path)
+        router = ProjectRouter(fake_root)
         projects = router.list_projects()
         assert len(projects) >= 1
 
@@ -73,10 +84,10 @@ class TestEndToEndWorkflow:
             archive = router.get_archive_path(proj)
             assert archive.exists()
 
-    def test_workflow_with_project_detection(self, tmp_path):
+    def test_workflow_with_project_detection(self, fake_root):
         """Test workflow with automatic project detection."""
         # Setup
-        modules_dir = tmp_path / "modules"
+        modules_dir = fake_root / "modules"
         modules_dir.mkdir()
 
         target_proj = modules_dir / "target-project"
@@ -85,10 +96,10 @@ class TestEndToEndWorkflow:
         (target_proj / "dev_notes" / "inbox").mkdir(parents=True)
 
         # Create router
-        router = ProjectRouter(tmp_path)
+        router = ProjectRouter(fake_root)
 
         # Create spec with project marker
-        spec_dir = tmp_path / "dev_notes" / "inbox"
+        spec_dir = fake_root / "dev_notes" / "inbox"
         spec_dir.mkdir(parents=True)
         spec_file = spec_dir / "spec.md"
         spec_file.write_text("Project: target-project\n\nTest specification")
@@ -100,20 +111,16 @@ class TestEndToEndWorkflow:
         if detected:
             assert detected == "target-project"
 
-    def test_error_handling_missing_file(self):
+    def test_error_handling_missing_file(self, pipeline_full):
         """Test error handling when file doesn't exist."""
-        pipeline = ProcessingPipeline()
-
         # Try to process non-existent file
-        result = pipeline.process(Path("/nonexistent/file.m4a"))
+        result = pipeline_full.process(Path("/nonexistent/file.m4a"))
 
         # Should return None gracefully
         assert result is None
 
-    def test_error_handling_permission_denied(self, tmp_path):
+    def test_error_handling_permission_denied(self, pipeline_full, tmp_path):
         """Test error handling when file is not readable."""
-        pipeline = ProcessingPipeline()
-
         # Create unreadable file (Unix only)
         test_file = tmp_path / "restricted.txt"
         test_file.write_text("test content")
@@ -123,7 +130,7 @@ class TestEndToEndWorkflow:
             os.chmod(test_file, 0o000)
 
             # Try to process
-            result = pipeline.process(test_file)
+            result = pipeline_full.process(test_file)
 
             # Should handle gracefully
             assert result is None or isinstance(result, Path)
@@ -133,23 +140,21 @@ class TestEndToEndWorkflow:
             import os
             os.chmod(test_file, 0o644)
 
-    def test_pipeline_history_on_error(self, tmp_path):
+    def test_pipeline_history_on_error(self, pipeline_full, fake_root):
         """Test that pipeline tracks errors in history."""
-        pipeline = ProcessingPipeline()
-
         # Create a file but make it fail processing by unsupported format
-        bad_file = tmp_path / "test.xyz"
+        bad_file = fake_root / "test.xyz"
         bad_file.write_text("test")
 
         # Try to process unsupported file
-        result = pipeline.process(bad_file)
+        result = pipeline_full.process(bad_file)
 
         # Check history (file may not be added to history on early failure)
         # The important thing is that the pipeline doesn't crash
         assert result is None or isinstance(result, Path)
 
     @patch("subprocess.run")
-    def test_bead_creation_failure_handling(self, mock_run, tmp_path):
+    def test_bead_creation_failure_handling(self, mock_run, fake_root):
         """Test graceful handling of bead creation failure."""
         # Mock subprocess to simulate beads command failure
         mock_run.return_value = MagicMock(
@@ -158,19 +163,19 @@ class TestEndToEndWorkflow:
             stderr="Beads error",
         )
 
-        creator = BeadCreator(tmp_path)
+        creator = BeadCreator(fake_root)
 
         # Create .beads directory
-        beads_dir = tmp_path / ".beads"
+        beads_dir = fake_root / ".beads"
         beads_dir.mkdir()
 
         # Create spec file
-        spec_file = tmp_path / "spec.md"
+        spec_file = fake_root / "spec.md"
         spec_file.write_text("test")
 
         # Try to create (should handle failure gracefully)
         result = creator.create(
-            project_path=tmp_path,
+            project_path=fake_root,
             spec_file=spec_file,
             title="Test",
         )
@@ -178,26 +183,22 @@ class TestEndToEndWorkflow:
         # Should handle failure gracefully
         assert result is None or isinstance(result, str)
 
-    def test_concurrent_processing(self, tmp_path):
+    def test_concurrent_processing(self, pipeline_stt_only, fake_root):
         """Test processing multiple files."""
-        pipeline = ProcessingPipeline(enable_stt=True, enable_professionalize=False)
-
         # Create multiple audio files
         files = []
         for i in range(3):
-            audio_file = tmp_path / f"test_{i}.m4a"
+            audio_file = fake_root / f"test_{i}.m4a"
             audio_file.write_text(f"fake audio {i}")
             files.append(audio_file)
 
-        # Process all files
-        results = []
-        for audio_file in files:
-            result = pipeline.process(audio_file)
-            results.append(result)
+        # Process all files concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(pipeline_stt_only.process, files))
 
         # All should process successfully
         assert all(r is not None for r in results)
 
         # Verify history tracks all processing
-        history = pipeline.get_history()
+        history = pipeline_stt_only.get_history()
         assert len(history) >= 3
@@ -0,0 +1,449 @@
+"""Unit tests for the Drive poller."""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+
+from pigeon.drive_client import DriveClient
+from pigeon.poller import PAGE_TOKEN_KEY, WATERMARK_KEY, Poller
+
+
+@dataclass(frozen=True, slots=True)
+class FakeConfig:
+    """Plain stand-in for Config with the settings the poller reads."""
+
+    root: Path
+    drive_folder: str = "/Voice Recordings"
+    poll_interval: int = 30
+    state_save_interval: int = 10
+
+    def get_inbox_dir(self) -> Path:
+        return self.root / "inbox"
+
+    def get_state_file(self) -> Path:
+        return self.root / "tmp" / "pigeon-state.jsonl"
+
+
+@pytest.fixture
+def poller_config(tmp_path):
+    """Create a config whose inbox and state live under tmp_path."""
+    config = FakeConfig(tmp_path)
+    config.get_inbox_dir().mkdir()
+    return config
+
+
+@pytest.fixture
+def drive_client():
+    """Create a mock Google Drive client."""
+    return MagicMock(spec=DriveClient)
+
+
+@pytest.fixture
+def make_poller(poller_config, drive_client):
+    """Build pollers without replacing the test runner's signal handlers."""
+    with patch("pigeon.poller.signal.signal"):
+        yield lambda: Poller(poller_config, drive_client)
+
+
+@pytest.fixture
+def poller(make_poller):
+    """Create a poller with download workers, as start() would."""
+    poller = make_poller()
+    poller._executor = ThreadPoolExecutor(max_workers=2)
+    yield poller
+    poller._executor.shutdown(wait=True)
+
+
+def drive_file(file_id: str, modified: str = "2024-01-15T10:00:00Z") -> dict:
+    """Build Drive file metadata as the changes feed returns it."""
+    return {
+        "id": file_id,
+        "name": f"{file_id}.m4a",
+        "mimeType": "audio/mp4",
+        "modifiedTime": modified,
+    }
+
+
+def read_records(state_file: Path) -> list:
+    """Parse every line of a state log."""
+    return [json.loads(line) for line in state_file.read_text().splitlines()]
+
+
+class TestPollerStateLog:
+    """Test the append-only JSONL state log."""
+
+    def test_load_missing_state(self, make_poller):
+        """Test that a missing state log starts empty."""
+        poller = make_poller()
+
+        assert poller.state == {}
+        assert poller._state_lines == 0
+
+    def test_append_round_trip(self, make_poller, poller_config):
+        """Test that appended records are loaded by a new poller."""
+        poller = make_poller()
+        with poller._state_lock:
+            poller.state["file-1"] = {"original_name": "a.m4a"}
+            poller._append_state("file-1", {"original_name": "a.m4a"})
+            poller.state[PAGE_TOKEN_KEY] = "token-1"
+            poller._append_state(PAGE_TOKEN_KEY, "token-1")
+
+        assert read_records(poller_config.get_state_file()) == [
+            {"file-1": {"original_name": "a.m4a"}},
+            {PAGE_TOKEN_KEY: "token-1"},
+        ]
+        reloaded = make_poller()
+        assert reloaded.state == {
+            "file-1": {"original_name": "a.m4a"},
+            PAGE_TOKEN_KEY: "token-1",
+        }
+        assert reloaded._state_lines == 2
+
+    def test_later_records_win(self, make_poller, poller_config):
+        """Test that a key appended twice loads with its last value."""
+        state_file = poller_config.get_state_file()
+        state_file.parent.mkdir()
+        state_file.write_text(
+            '{"_page_token": "token-1"}\n{"file-1": {}}\n{"_page_token": "token-2"}\n'
+        )
+
+        poller = make_poller()
+
+        assert poller.state == {PAGE_TOKEN_KEY: "token-2", "file-1": {}}
+        assert poller._state_lines == 3
+
+    def test_corrupt_final_line_is_skipped(self, make_poller, poller_config):
+        """Test that a torn final line keeps every complete record."""
+        state_file = poller_config.get_state_file()
+        state_file.parent.mkdir()
+        state_file.write_text('{"file-1": {"original_name": "a.m4a"}}\n{"file-2": {"orig')
+
+        poller = make_poller()
+
+        assert poller.state == {"file-1": {"original_name": "a.m4a"}}
+
+    def test_append_after_corrupt_line_reloads(self, make_poller, poller_config):
+        """Test that a record appended after a torn line is not merged into it."""
+        state_file = poller_config.get_state_file()
+        state_file.parent.mkdir()
+        state_file.write_text('{"file-1": {}}\n{"file-2": {"orig')
+
+        poller = make_poller()
+        with poller._state_lock:
+            poller.state["file-3"] = {}
+            poller._append_state("file-3", {})
+
+        assert make_poller().state == {"file-1": {}, "file-3": {}}
+
+    def test_compacts_when_superseded_records_dominate(self, make_poller, poller_config):
+        """Test that the log is rewritten once it exceeds twice the live keys."""
+        poller = make_poller()
+        with poller._state_lock:
+            poller.state["file-1"] = {}
+            poller._append_state("file-1", {})
+            for i in range(4):
+                poller.state[PAGE_TOKEN_KEY] = f"token-{i}"
+                poller._append_state(PAGE_TOKEN_KEY, f"token-{i}")
+
+        # Two live keys: the fifth line exceeded 2x, so the log was compacted
+        assert read_records(poller_config.get_state_file()) == [
+            {"file-1": {}},
+            {PAGE_TOKEN_KEY: "token-3"},
+        ]
+        assert poller._state_lines == 2
+
+    def test_save_state_replaces_log_and_syncs_directory(self, make_poller, poller_config):
+        """Test that compaction renames a temp file and fsyncs its directory."""
+        poller = make_poller()
+        poller.state = {"file-1": {}, "file-2": {}}
+        state_file = poller_config.get_state_file()
+
+        with patch("pigeon.poller.os.fsync", wraps=os.fsync) as mock_fsync:
+            assert poller._save_state()
+
+        # Once for the temp file, once for the directory entry
+        assert mock_fsync.call_count == 2
+        assert read_records(state_file) == [{"file-1": {}}, {"file-2": {}}]
+        assert not state_file.with_suffix(".jsonl.tmp").exists()
+
+    def test_save_state_failure_removes_temp_file(self, make_poller, poller_config):
+        """Test that a failed compaction leaves the old log in place."""
+        poller = make_poller()
+        with poller._state_lock:
+            poller.state["file-1"] = {}
+            poller._append_state("file-1", {})
+        state_file = poller_config.get_state_file()
+
+        with patch.object(Path, "replace", side_effect=OSError("disk full")):
+            assert not poller._save_state()
+
+        assert read_records(state_file) == [{"file-1": {}}]
+        assert not state_file.with_suffix(".jsonl.tmp").exists()
+
+
+class TestPollerLegacyState:
+    """Test migration from the single-document JSON state file."""
+
+    def test_migrates_legacy_json(self, make_poller, poller_config):
+        """Test that a legacy state file is converted and removed."""
+        state_file = poller_config.get_state_file()
+        legacy_file = state_file.with_suffix(".json")
+        legacy_file.parent.mkdir()
+        legacy_file.write_text(
+            json.dumps({"file-1": {"original_name": "a.m4a"}, PAGE_TOKEN_KEY: "token-1"})
+        )
+
+        poller = make_poller()
+
+        assert poller.state == {
+            "file-1": {"original_name": "a.m4a"},
+            PAGE_TOKEN_KEY: "token-1",
+        }
+        assert not legacy_file.exists()
+        assert read_records(state_file) == [
+            {"file-1": {"original_name": "a.m4a"}},
+            {PAGE_TOKEN_KEY: "token-1"},
+        ]
+        assert make_poller().state == poller.state
+
+    def test_corrupt_legacy_json_starts_fresh(self, make_poller, poller_config):
+        """Test that an unreadable legacy file is kept and ignored."""
+        legacy_file = poller_config.get_state_file().with_suffix(".json")
+        legacy_file.parent.mkdir()
+        legacy_file.write_text("{not json")
+
+        poller = make_poller()
+
+        assert poller.state == {}
+        assert legacy_file.exists()
+
+    def test_state_log_takes_precedence_over_legacy(self, make_poller, poller_config):
+        """Test that an existing state log is loaded instead of the legacy file."""
+        state_file = poller_config.get_state_file()
+        state_file.parent.mkdir()
+        state_file.write_text('{"file-2": {}}\n')
+        state_file.with_suffix(".json").write_text('{"file-1": {}}')
+
+        assert make_poller().state == {"file-2": {}}
+
+
+class TestPollerChangesFeed:
+    """Test polling through the Drive changes feed."""
+
+    def test_downloads_changes_and_advances_token(self, poller, drive_client):
+        """Test that new files are downloaded and the next token is saved."""
+        poller.state[PAGE_TOKEN_KEY] = "token-1"
+        drive_client.list_folder_changes.return_value = ([drive_file("file-1")], "token-2")
+
+        poller._poll_once()
+
+        drive_client.list_folder_changes.assert_called_once_with("/Voice Recordings", "token-1")
+        assert drive_client.download_file.call_args.args[0] == "file-1"
+        assert poller.state["file-1"]["original_name"] == "file-1.m4a"
+        assert poller.state[PAGE_TOKEN_KEY] == "token-2"
+        drive_client.list_folder_file_ids.assert_not_called()
+
+    def test_failed_download_keeps_token(self, poller, drive_client, poller_config):
+        """Test that the token is not advanced past a file that failed."""
+        poller.state[PAGE_TOKEN_KEY] = "token-1"
+        drive_client.list_folder_changes.return_value = (
+            [drive_file("file-1"), drive_file("file-2")],
+            "token-2",
+        )
+
+        def download(file_id, destination):
+            if file_id == "file-2":
+                raise OSError("connection reset")
+
+        drive_client.download_file.side_effect = download
+
+        poller._poll_once()
+
+        assert "file-1" in poller.state
+        assert "file-2" not in poller.state
+        assert poller.state[PAGE_TOKEN_KEY] == "token-1"
+        # The failed file's reserved name is released
+        assert len(list(poller_config.get_inbox_dir().iterdir())) == 1
+
+    def test_skips_tracked_files_and_folders(self, poller, drive_client):
+        """Test that tracked files and subfolders are not downloaded."""
+        poller.state[PAGE_TOKEN_KEY] = "token-1"
+        poller.state["file-1"] = {"original_name": "file-1.m4a"}
+        folder = {**drive_file("folder-1"), "mimeType": "application/vnd.google-apps.folder"}
+        drive_client.list_folder_changes.return_value = (
+            [drive_file("file-1"), folder],
+            "token-2",
+        )
+
+        poller._poll_once()
+
+        drive_client.download_file.assert_not_called()
+        assert "folder-1" not in poller.state
+        assert poller.state[PAGE_TOKEN_KEY] == "token-2"
+
+    def test_rejected_token_falls_back_to_listing(self, poller, drive_client):
+        """Test that an expired token triggers a full folder listing."""
+        poller.state[PAGE_TOKEN_KEY] = "token-1"
+        drive_client.list_folder_changes.return_value = None
+        drive_client.get_start_page_token.return_value = "token-5"
+        drive_client.list_folder_file_ids.return_value = ["file-1"]
+        drive_client.get_file_metadata.return_value = drive_file("file-1")
+
+        poller._poll_once()
+
+        drive_client.get_file_metadata.assert_called_once_with("file-1")
+        assert "file-1" in poller.state
+        assert poller.state[PAGE_TOKEN_KEY] == "token-5"
+
+    def test_first_poll_takes_start_token_before_listing(self, poller, drive_client):
+        """Test that the start token predates the listing it follows."""
+        drive_client.get_start_page_token.return_value = "token-1"
+        drive_client.list_folder_file_ids.return_value = []
+
+        poller._poll_once()
+
+        drive_client.list_folder_changes.assert_not_called()
+        assert [c[0] for c in drive_client.method_calls] == [
+            "get_start_page_token",
+            "list_folder_file_ids",
+        ]
+        assert drive_client.list_folder_file_ids.call_args == call(
+            "/Voice Recordings", since=None
+        )
+        assert poller.state[PAGE_TOKEN_KEY] == "token-1"
+
+    def test_missing_metadata_keeps_token(self, poller, drive_client):
+        """Test that a file whose metadata lookup fails is retried."""
+        drive_client.get_start_page_token.return_value = "token-1"
+        drive_client.list_folder_file_ids.return_value = ["file-1"]
+        drive_client.get_file_metadata.return_value = None
+
+        poller._poll_once()
+
+        assert PAGE_TOKEN_KEY not in poller.state
+        drive_client.download_file.assert_not_called()
+
+    def test_poll_errors_are_contained(self, poller, drive_client):
+        """Test that an unexpected error ends the cycle without raising."""
+        poller.state[PAGE_TOKEN_KEY] = "token-1"
+        drive_client.list_folder_changes.side_effect = RuntimeError("boom")
+
+        poller._poll_once()
+
+        assert poller.state[PAGE_TOKEN_KEY] == "token-1"
+
+
+class TestPollerWatermark:
+    """Test the modifiedTime watermark bounding full listings."""
+
+    @pytest.fixture
+    def folder(self, drive_client):
+        """Serve a folder listing that honours the since bound."""
+        files = {
+            "file-a": drive_file("file-a", "2024-01-15T10:00:00Z"),
+            "file-b": drive_file("file-b", "2024-01-15T11:00:00Z"),
+        }
+        drive_client.get_start_page_token.return_value = "token-1"
+        drive_client.list_folder_file_ids.side_effect = lambda folder, since=None: [
+            fid for fid, f in files.items() if not since or f["modifiedTime"] >= since
+        ]
+        drive_client.get_file_metadata.side_effect = files.get
+        return files
+
+    def test_failed_older_file_is_listed_again(self, poller, drive_client, folder):
+        """Test that a newer success does not hide an older failed file."""
+        drive_client.download_file.side_effect = [OSError("reset"), None]
+        with patch.object(poller._executor, "map", lambda fn, ids: map(fn, ids)):
+            poller._poll_once()
+
+        assert "file-a" not in poller.state
+        assert "file-b" in poller.state
+        assert PAGE_TOKEN_KEY not in poller.state
+        assert WATERMARK_KEY not in poller.state
+
+        drive_client.download_file.side_effect = None
+        poller._poll_once()
+
+        assert drive_client.list_folder_file_ids.call_args_list[1].kwargs["since"] is None
+        assert "file-a" in poller.state
+        assert poller.state[PAGE_TOKEN_KEY] == "token-1"
+        assert poller.state[WATERMARK_KEY] == "2024-01-15T10:00:00Z"
+
+    def test_watermark_bounds_next_listing(self, poller, drive_client, folder):
+        """Test that a clean listing bounds the next one by its newest file."""
+        poller._poll_once()
+        assert poller.state[WATERMARK_KEY] == "2024-01-15T11:00:00Z"
+
+        # The saved token expired, so the poller lists the folder again
+        drive_client.list_folder_changes.return_value = None
+        poller._poll_once()
+
+        since = drive_client.list_folder_file_ids.call_args_list[1].kwargs["since"]
+        assert since == "2024-01-15T11:00:00Z"
+        assert drive_client.download_file.call_count == 2
+
+    def test_changes_feed_advances_watermark(self, poller, drive_client):
+        """Test that a clean changes poll moves the watermark forward."""
+        poller.state[PAGE_TOKEN_KEY] = "token-1"
+        poller.state[WATERMARK_KEY] = "2024-01-15T10:00:00Z"
+        drive_client.list_folder_changes.return_value = (
+            [drive_file("file-1", "2024-01-16T09:00:00Z")],
+            "token-2",
+        )
+
+        poller._poll_once()
+
+        assert poller.state[WATERMARK_KEY] == "2024-01-16T09:00:00Z"
+
+    def test_watermark_persists_across_restart(self, poller, folder, make_poller):
+        """Test that the watermark is reloaded from the state log."""
+        poller._poll_once()
+
+        assert make_poller().state[WATERMARK_KEY] == "2024-01-15T11:00:00Z"
+
+
+class TestPollerStartStop:
+    """Test the polling loop lifecycle."""
+
+    def test_start_runs_until_stopped(self, make_poller, drive_client, poller_config):
+        """Test that start polls, and stop shuts down workers and saves state."""
+        poller = make_poller()
+        drive_client.get_start_page_token.return_value = "token-1"
+        drive_client.list_folder_file_ids.return_value = []
+
+        with patch.object(poller._stop_event, "wait", side_effect=lambda _: poller.stop()):
+            poller.start()
+
+        assert not poller.running
+        assert poller._executor is None
+        assert read_records(poller_config.get_state_file()) == [{PAGE_TOKEN_KEY: "token-1"}]
+
+    def test_restart_after_stop(self, make_poller, drive_client):
+        """Test that a stopped poller can be started again."""
+        poller = make_poller()
+        drive_client.get_start_page_token.return_value = "token-1"
+        drive_client.list_folder_file_ids.return_value = ["file-1"]
+        drive_client.get_file_metadata.return_value = drive_file("file-1")
+        drive_client.download_file.side_effect = [OSError("reset"), None]
+
+        for _ in range(2):
+            with patch.object(poller._stop_event, "wait", side_effect=lambda _: poller.stop()):
+                poller.start()
+
+        assert drive_client.download_file.call_count == 2
+        assert "file-1" in poller.state
+
+    def test_signal_only_sets_stop_event(self, make_poller):
+        """Test that the signal handler leaves stopping to the polling loop."""
+        poller = make_poller()
+        poller.running = True
+
+        poller._handle_signal(15, None)
+
+        assert poller._stop_event.is_set()
+        assert poller.running
@@ -1,7 +1,9 @@
 """Tests for Pigeon processors."""
 
+import sys
 import pytest
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 from pigeon.processors import STTProcessor, ProfessionalizerProcessor, ProcessingPipeline
 
 
@@ -92,60 +94,237 @@ class TestProfessionalizerProcessor:
         content = result.read_text()
         assert "Specification" in content or "test" in content
 
+    def test_process_batch_uses_single_llm_call(self, tmp_path, mock_mellona_provider):
+        """Test that a batch is sent to Mellona in one call_batch request."""
+        mellona = MagicMock(get_provider=MagicMock(return_value=mock_mellona_provider))
+        with patch.dict(sys.modules, {"mellona": mellona}):
+            processor = ProfessionalizerProcessor()
+        mock_mellona_provider.call_batch = MagicMock(
+            return_value=[MagicMock(text="Spec one"), MagicMock(text="Spec two")]
+        )
+
+        first = tmp_path / "first.txt"
+        first.write_text("first note")
+        empty = tmp_path / "empty.txt"
+        empty.write_text("")
+        second = tmp_path / "second.txt"
+        second.write_text("second note")
+
+        results = processor.process_batch([first, empty, second])
+
+        mock_mellona_provider.call_batch.assert_called_once()
+        assert mock_mellona_provider.call_batch.call_args.kwargs["user_inputs"] == [
+            "first note",
+            "second note",
+        ]
+        mock_mellona_provider.call.assert_not_called()
+        assert results[1] is None
+        assert results[0].read_text() == "Spec one"
+        assert results[2].read_text() == "Spec two"
+
+    @pytest.mark.parametrize(
+        "call_batch",
+        [
+            MagicMock(side_effect=RuntimeError("one bad item")),
+            MagicMock(return_value=[MagicMock(text="Only one")]),
+        ],
+    )
+    def test_failed_batch_falls_back_to_per_text_calls(
+        self, tmp_path, mock_mellona_provider, call_batch
+    ):
+        """Test that a failed or short batch result retries each text with the LLM."""
+        mellona = MagicMock(get_provider=MagicMock(return_value=mock_mellona_provider))
+        with patch.dict(sys.modules, {"mellona": mellona}):
+            processor = ProfessionalizerProcessor()
+        mock_mellona_provider.call_batch = call_batch
+
+        files = []
+        for name in ("first", "second"):
+            text_file = tmp_path / f"{name}.txt"
+            text_file.write_text(f"{name} note")
+            files.append(text_file)
+
+        results = processor.process_batch(files)
+
+        assert mock_mellona_provider.call.call_count == 2
+        assert [r.read_text() for r in results] == ["Test response", "Test response"]
+
+    def test_provider_created_once(self, tmp_path, mock_mellona_provider):
+        """Test that the Mellona provider is created at init and reused."""
+        mellona = MagicMock(get_provider=MagicMock(return_value=mock_mellona_provider))
+        with patch.dict(sys.modules, {"mellona": mellona}):
+            processor = ProfessionalizerProcessor()
+        del mock_mellona_provider.call_batch
+
+        for i in range(2):
+            text_file = tmp_path / f"note_{i}.txt"
+            text_file.write_text(f"note {i}")
+            assert processor.process(text_file).read_text() == "Test response"
+
+        mellona.get_provider.assert_called_once_with("worker")
+        assert mock_mellona_provider.call.call_count == 2
+
+    def test_process_with_meta(self, tmp_path):
+        """Test that process_with_meta returns the spec path and first line."""
+        processor = ProfessionalizerProcessor()
+        text_file = tmp_path / "note.txt"
+        text_file.write_text("some note")
+
+        spec = processor.process_with_meta(text_file)
+        assert spec.path.exists()
+        assert spec.first_line == spec.path.read_text().split("\n", 1)[0]
+
+    def test_professionalize_basic_format(self):
+        """Test the basic formatter's exact layout and placeholder filtering."""
+        processor = ProfessionalizerProcessor()
+        result = processor._professionalize_basic("  first  \n\n[skip me]\n\nsecond\nline\n\n\n")
+
+        header, body = result.split("## Content\n", 1)
+        assert header.startswith("# Specification\n**Date:** ")
+        assert body == "\nfirst\n\nsecond\nline\n"
+
 
 class TestProcessingPipeline:
     """Test processing pipeline."""
 
-    def test_init_with_default_processors(self):
+    def test_init_with_default_processors(self, pipeline_full):
         """Test pipeline initialization."""
-        pipeline = ProcessingPipeline()
-        assert len(pipeline.processors) >= 1
+        assert len(pipeline_full.processors) >= 1
 
-    def test_init_with_disabled_stages(self):
+    def test_init_with_disabled_stages(self, pipeline_empty):
         """Test pipeline with disabled stages."""
-        pipeline = ProcessingPipeline(enable_stt=False, enable_professionalize=False)
-        assert len(pipeline.processors) == 0
+        assert len(pipeline_empty.processors) == 0
 
-    def test_init_with_stt_only(self):
+    def test_init_with_stt_only(self, pipeline_stt_only):
         """Test pipeline with only STT enabled."""
-        pipeline = ProcessingPipeline(enable_stt=True, enable_professionalize=False)
-        assert len(pipeline.processors) == 1
-        assert pipeline.processors[0].name == "stt"
+        assert len(pipeline_stt_only.processors) == 1
+        assert pipeline_stt_only.processors[0].name == "stt"
 
-    def test_process_missing_file(self):
+    def test_process_missing_file(self, pipeline_full):
         """Test processing non-existent file."""
-        pipeline = ProcessingPipeline()
-        result = pipeline.process(Path("/nonexistent/file.m4a"))
+        result = pipeline_full.process(Path("/nonexistent/file.m4a"))
         assert result is None
 
-    def test_process_full_pipeline(self, tmp_path):
+    def test_process_full_pipeline(self, pipeline_stt_only, tmp_path):
         """Test full pipeline with mocked processors."""
-        pipeline = ProcessingPipeline(enable_stt=True, enable_professionalize=False)
-
         # Create a test audio file
         audio_file = tmp_path / "test.m4a"
         audio_file.write_text("fake audio")
 
         # Process
-        result = pipeline.process(audio_file)
+        result = pipeline_stt_only.process(audio_file)
 
         # Verify result
         assert result is not None
         assert result.exists()
 
-    def test_history_tracking(self, tmp_path):
+    def test_history_tracking(self, pipeline_stt_only, tmp_path):
         """Test that pipeline tracks processing history."""
-        pipeline = ProcessingPipeline(enable_stt=True, enable_professionalize=False)
-
         # Create and process a file
         audio_file = tmp_path / "test.m4a"
         audio_file.write_text("fake audio")
 
-        result = pipeline.process(audio_file)
+        result = pipeline_stt_only.process(audio_file)
 
         # Check history
-        assert len(pipeline.get_history()) > 0
-        entry = pipeline.get_history()[0]
+        assert len(pipeline_stt_only.get_history()) > 0
+        entry = pipeline_stt_only.get_history()[0]
         assert entry["status"] == "success"
         assert entry["input"] == str(audio_file)
         assert entry["output"] == str(result)
+
+    def test_history_is_bounded(self, tmp_path):
+        """Test that history keeps only the most recent records."""
+        pipeline = ProcessingPipeline(
+            enable_stt=True, enable_professionalize=False, history_limit=2
+        )
+
+        for i in range(3):
+            audio_file = tmp_path / f"test_{i}.m4a"
+            audio_file.write_text(f"fake audio {i}")
+            pipeline.process(audio_file)
+
+        history = pipeline.get_history()
+        assert len(history) == 2
+        assert history[0]["input"] == str(tmp_path / "test_1.m4a")
+
+    def test_process_batch(self, pipeline_full, tmp_path):
+        """Test that a batch is processed stage by stage in input order."""
+        files = []
+        for i in range(3):
+            audio_file = tmp_path / f"test_{i}.m4a"
+            audio_file.write_text(f"fake audio {i}")
+            files.append(audio_file)
+        files.insert(1, tmp_path / "missing.m4a")
+
+        results = pipeline_full.process_batch(files)
+
+        assert len(results) == 4
+        assert results[1] is None
+        assert all(r is not None and r.exists() for i, r in enumerate(results) if i != 1)
+        assert results[0].name.startswith("test_0")
+        assert len(pipeline_full.get_history()) == 3
+
+    def test_unchanged_content_skips_processing(self, pipeline_stt_only, tmp_path):
+        """Test that re-processing identical content reuses the earlier output."""
+        audio_file = tmp_path / "test.m4a"
+        audio_file.write_text("fake audio")
+        first = pipeline_stt_only.process(audio_file)
+
+        with patch.object(pipeline_stt_only.processors[0], "process") as mock_process:
+            second = pipeline_stt_only.process(audio_file)
+
+        mock_process.assert_not_called()
+        assert second == first
+        assert pipeline_stt_only.get_history()[-1]["status"] == "cached"
+
+        # Changed content is processed again
+        audio_file.write_text("different audio")
+        with patch.object(
+            pipeline_stt_only.processors[0], "process", return_value=first
+        ) as mock_process:
+            pipeline_stt_only.process(audio_file)
+
+        mock_process.assert_called_once_with(audio_file)
+
+    def test_identical_content_at_another_path_is_processed(self, pipeline_stt_only, tmp_path):
+        """Test that the result cache only short-circuits the same input path."""
+        first = tmp_path / "first.m4a"
+        first.write_text("same audio")
+        second = tmp_path / "second.m4a"
+        second.write_text("same audio")
+        pipeline_stt_only.process(first)
+
+        with patch.object(
+            pipeline_stt_only.processors[0], "process", return_value=first
+        ) as mock_process:
+            pipeline_stt_only.process(second)
+
+        mock_process.assert_called_once_with(second)
+
+    def test_result_cache_is_bounded(self, tmp_path):
+        """Test that the result cache forgets the least recently used entries."""
+        pipeline = ProcessingPipeline(enable_stt=True, enable_professionalize=False)
+        with patch("pigeon.processors.pipeline.RESULT_CACHE_SIZE", 2):
+            for i in range(3):
+                audio_file = tmp_path / f"test_{i}.m4a"
+                audio_file.write_text(f"fake audio {i}")
+                pipeline.process(audio_file)
+
+        assert [key[0] for key in pipeline._result_cache] == [
+            str(tmp_path / "test_1.m4a"),
+            str(tmp_path / "test_2.m4a"),
+        ]
+
+    def test_reset_history(self, tmp_path):
+        """Test that reset_history clears history and reprocesses unchanged files."""
+        pipeline = ProcessingPipeline(enable_stt=True, enable_professionalize=False)
+        audio_file = tmp_path / "test.m4a"
+        audio_file.write_text("fake audio")
+        pipeline.process(audio_file)
+
+        pipeline.reset_history()
+
+        assert pipeline.get_history() == []
+        pipeline.process(audio_file)
+        assert pipeline.get_history()[0]["status"] == "success"
@@ -2,7 +2,10 @@
 
 import pytest
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 from pigeon.routing import ProjectRouter, BeadCreator, SubmoduleDiscoverer
+from pigeon.routing.bead_creator import _beads_cli_available
+from pigeon.routing.router import DETECT_HEAD_BYTES
 
 
 class TestProjectRouter:
@@ -30,6 +33,11 @@ class TestProjectRouter:
         assert len(projects) >= 2
         assert "test-project" in projects or "other-project" in projects
 
+    def test_init_without_modules_dir(self, tmp_path):
+        """Test that a root with no modules/ directory discovers no projects."""
+        router = ProjectRouter(tmp_path)
+        assert router.list_projects() == []
+
     def test_detect_project_from_header(self, mock_projects):
         """Test project detection from 'Project:' header."""
         router = ProjectRouter(mock_projects)
@@ -58,6 +66,82 @@ class TestProjectRouter:
         detected = router.detect_project(spec_file)
         # May be None if regex didn't match, but shouldn't error
 
+    def test_detect_project_searches_head_only(self, mock_projects, tmp_path):
+        """Test that mixed-case tags match and tags past the header are ignored."""
+        router = ProjectRouter(mock_projects)
+        spec_file = tmp_path / "spec.md"
+
+        spec_file.write_text("pRoJeCt: test-project\n")
+        assert router.detect_project(spec_file) == "test-project"
+
+        spec_file.write_text("x" * DETECT_HEAD_BYTES + "\nProject: test-project\n")
+        assert router.detect_project(spec_file) is None
+
+    def test_detect_project_skips_regex_without_markers(self, mock_projects, tmp_path):
+        """Test that content with no ':' or '@' never reaches the regex."""
+        router = ProjectRouter(mock_projects)
+        spec_file = tmp_path / "spec.md"
+        spec_file.write_text("Just some plain notes\nwith no tags\n")
+
+        with patch("pigeon.routing.router._PROJECT_RE") as project_re:
+            assert router.detect_project(spec_file) is None
+
+        project_re.finditer.assert_not_called()
+
+    def test_detect_project_tag_priority(self, mock_projects, tmp_path):
+        """Test that a known Project: tag beats an earlier @mention."""
+        router = ProjectRouter(mock_projects)
+
+        spec_file = tmp_path / "spec.md"
+        spec_file.write_text("cc @other-project\nProject: test-project\n")
+        assert router.detect_project(spec_file) == "test-project"
+
+        # An unknown tag falls through to the first mention
+        spec_file.write_text("Project: unknown\ncc @other-project @test-project\n")
+        assert router.detect_project(spec_file) == "other-project"
+
+    def test_detect_project_from_filename(self, mock_projects, tmp_path):
+        """Test filename fallback with and without the Aho-Corasick matcher."""
+        router = ProjectRouter(mock_projects)
+        spec_file = tmp_path / "notes-for-other-project.md"
+        spec_file.write_text("No tags here")
+
+        assert router.detect_project(spec_file) == "other-project"
+
+        router._name_matcher = None
+        assert router.detect_project(spec_file) == "other-project"
+
+    def test_detect_project_skips_read_when_cached(self, mock_projects, tmp_path):
+        """Test that filename hits and unchanged files are not re-read."""
+        router = ProjectRouter(mock_projects)
+        named = tmp_path / "test-project-notes.md"
+        named.write_text("Project: other-project\n")
+        spec_file = tmp_path / "spec.md"
+        spec_file.write_text("Project: other-project\n")
+
+        assert router.detect_project(spec_file) == "other-project"
+        with patch("builtins.open", side_effect=AssertionError("file was read")):
+            assert router.detect_project(named) == "test-project"
+            assert router.detect_project(spec_file) == "other-project"
+
+    @patch("pigeon.routing.router.DETECT_CACHE_SIZE", 2)
+    def test_detect_cache_evicts_least_recently_used(self, mock_projects, tmp_path):
+        """Test that the detection cache drops the least recently used spec."""
+        router = ProjectRouter(mock_projects)
+        specs = []
+        for i in range(3):
+            spec_file = tmp_path / f"spec{i}.md"
+            spec_file.write_text("Project: test-project\n")
+            specs.append(spec_file)
+
+        router.detect_project(specs[0])
+        router.detect_project(specs[1])
+        router.detect_project(specs[0])
+        router.detect_project(specs[2])
+
+        cached = {key[0] for key in router._detect_cache}
+        assert cached == {str(specs[0]), str(specs[2])}
+
     def test_get_inbox_path(self, mock_projects):
         """Test getting inbox path."""
         router = ProjectRouter(mock_projects)
@@ -85,10 +169,54 @@ class TestProjectRouter:
         assert "archive" in str(archive)
         assert archive.exists()
 
+    def test_paths_prebuilt_at_discovery(self, mock_projects):
+        """Test that lookups return the paths built at discovery time."""
+        router = ProjectRouter(mock_projects)
+
+        assert router.get_inbox_path("test-project") is router.get_inbox_path("test-project")
+        assert router.get_archive_path("unknown") == mock_projects / "dev_notes" / "inbox-archive"
+        assert router.get_inbox_path(None) is router.get_inbox_path("unknown")
+
+    def test_route_resolves_project_and_dirs(self, mock_projects, tmp_path):
+        """Test that route returns the project with its inbox and archive."""
+        router = ProjectRouter(mock_projects)
+        spec_file = tmp_path / "spec.md"
+        spec_file.write_text("Project: test-project\n")
+
+        route = router.route(spec_file)
+        assert route.project_name == "test-project"
+        assert route.project_path == router.cache["test-project"]
+        assert route.inbox_path == router.get_inbox_path("test-project")
+        assert route.archive_path.is_dir()
+
+        spec_file.write_text("No project here\n")
+        route = router.route(spec_file)
+        assert route.project_name is None
+        assert route.project_path == mock_projects
+
+    def test_paths_created_once(self, mock_projects):
+        """Test that repeated path lookups do not call mkdir again."""
+        router = ProjectRouter(mock_projects)
+        router.get_inbox_path("test-project")
+
+        with patch.object(Path, "mkdir") as mkdir:
+            router.get_inbox_path("test-project")
+            router.get_archive_path("test-project")
+            router.get_archive_path("test-project")
+
+        mkdir.assert_called_once_with(parents=True, exist_ok=True)
+
 
 class TestBeadCreator:
     """Test bead creation logic."""
 
+    @pytest.fixture(autouse=True)
+    def reset_cli_probe(self):
+        """Re-probe the beads CLI in every test so patched runs take effect."""
+        _beads_cli_available.cache_clear()
+        yield
+        _beads_cli_available.cache_clear()
+
     def test_init(self, tmp_path):
         """Test bead creator initialization."""
         creator = BeadCreator(tmp_path)
@@ -135,6 +263,68 @@ class TestBeadCreator:
         # Result depends on beads CLI availability
         # Should not raise exception regardless
 
+    def test_create_skips_subprocess_without_cli(self, tmp_path):
+        """Test that no bd process is spawned when the CLI is unavailable."""
+        (tmp_path / ".beads").mkdir()
+        spec_file = tmp_path / "spec.md"
+        spec_file.write_text("Test spec")
+
+        with patch("pigeon.routing.bead_creator.subprocess.run") as mock_run:
+            mock_run.side_effect = FileNotFoundError("bd")
+            creator = BeadCreator(tmp_path)
+            mock_run.reset_mock()
+
+            result = creator.create(
+                project_path=tmp_path,
+                spec_file=spec_file,
+                title="Test Issue",
+            )
+
+        assert creator.beads_available is False
+        assert result is None
+        mock_run.assert_not_called()
+
+    def test_create_parses_bead_id(self, tmp_path):
+        """Test that the bead ID is extracted from bd output."""
+        (tmp_path / ".beads").mkdir()
+        spec_file = tmp_path / "spec.md"
+        spec_file.write_text("Test spec")
+
+        with patch("pigeon.routing.bead_creator.subprocess.run") as mock_run:
+            creator = BeadCreator(tmp_path)
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout="✓ Created issue: pigeon-a1b2\n", stderr=""
+            )
+            result = creator.create(
+                project_path=tmp_path,
+                spec_file=spec_file,
+                title="Test Issue",
+            )
+
+        assert result == "pigeon-a1b2"
+
+    def test_create_from_spec_uses_bounded_header(self, tmp_path):
+        """Test that the description comes from the start of a long first line."""
+        (tmp_path / ".beads").mkdir()
+        spec_file = tmp_path / "long-spec.md"
+        spec_file.write_text("# Title " + "x" * 10000 + "\nsecond line")
+
+        with patch("pigeon.routing.bead_creator.subprocess.run") as mock_run:
+            creator = BeadCreator(tmp_path)
+            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+            creator.create_from_spec(spec_file=spec_file, project_path=tmp_path)
+
+        cmd = mock_run.call_args.args[0]
+        assert f"--description=# Title {'x' * 92}" in cmd
+
+    def test_cli_probed_once(self, tmp_path):
+        """Test that multiple creators share a single bd --version probe."""
+        with patch("pigeon.routing.bead_creator.subprocess.run") as mock_run:
+            BeadCreator(tmp_path)
+            BeadCreator(tmp_path)
+
+        mock_run.assert_called_once()
+
     def test_create_from_spec(self, tmp_path):
         """Test creating bead from spec file."""
         beads_dir = tmp_path / ".beads"
@@ -244,3 +434,62 @@ class TestSubmoduleDiscoverer:
         submodules = discoverer.get_submodules(with_beads=False)
         # Should skip uninitialized submodule
         assert not any(s['name'] == "missing-project" for s in submodules)
+
+    def test_probe_all_scans_parent_once(self, git_repo):
+        """Test that submodule directories are found with one scandir of modules/."""
+        gitmodules = git_repo / ".gitmodules"
+        gitmodules.write_text(gitmodules.read_text() + """
+[submodule "missing-project"]
+\tpath = modules/missing-project
+""")
+        discoverer = SubmoduleDiscoverer(git_repo)
+
+        with patch.object(Path, "is_dir", autospec=True, side_effect=Path.is_dir) as is_dir:
+            names = [s["name"] for s in discoverer.get_submodules(with_beads=True)]
+
+        assert names == ["test-project", "other-project"]
+        checked = {p.name for (p,), _ in is_dir.call_args_list}
+        assert checked.isdisjoint({"test-project", "other-project", "missing-project"})
+
+    def test_get_submodules_memoized(self, git_repo):
+        """Test that repeated listings reuse the first probe of every submodule."""
+        discoverer = SubmoduleDiscoverer(git_repo)
+        first = discoverer.get_submodules(with_beads=True)
+
+        with patch.object(discoverer, "_probe_all") as mock_probe_all:
+            assert discoverer.get_submodules(with_beads=True) == first
+            assert len(discoverer.get_submodules(with_beads=False)) == 2
+
+        mock_probe_all.assert_not_called()
+
+    def test_skips_commented_submodules(self, git_repo):
+        """Test that commented-out entries and non-submodule sections are ignored."""
+        gitmodules = git_repo / ".gitmodules"
+        gitmodules.write_text(gitmodules.read_text() + """
+# [submodule "commented-project"]
+# \tpath = modules/commented-project
+[core]
+\tbare = false
+[submodule "encoded-project"]
+\tpath = modules/encoded-project
+\turl = https://example.com/encoded%20project.git
+""")
+        for proj in ["commented-project", "encoded-project"]:
+            (git_repo / "modules" / proj).mkdir(parents=True)
+
+        discoverer = SubmoduleDiscoverer(git_repo)
+        names = discoverer.list_project_names(with_beads=False)
+
+        assert names == ["encoded-project", "other-project", "test-project"]
+        encoded = discoverer.find_submodule_for_project("encoded-project")
+        assert encoded['url'] == "https://example.com/encoded%20project.git"
+        assert encoded['path'] == "modules/encoded-project"
+
+    def test_probes_submodules_lazily(self, git_repo):
+        """Test that submodule directories are only checked when requested."""
+        discoverer = SubmoduleDiscoverer(git_repo)
+        assert discoverer.cache == {}
+
+        found = discoverer.find_submodule_for_project("test-project")
+        assert found['has_beads'] is True
+        assert list(discoverer.cache) == ["test-project"]
@@ -1,7 +1,10 @@
 """Tests for Pigeon routing processor."""
 
+import os
 import pytest
 from pathlib import Path
+from unittest.mock import patch
+from pigeon.processors import ProcessedSpec
 from pigeon.processors.routing import RoutingProcessor
 
 
@@ -89,6 +92,73 @@ class TestRoutingProcessor:
         archive_dir = mock_projects / "dev_notes" / "inbox-archive"
         assert not spec_file.exists(), "Original spec should be moved to archive"
 
+    def test_routing_links_instead_of_copying(self, mock_projects):
+        """Test that the routed spec and its archive share one inode."""
+        processor = RoutingProcessor(mock_projects)
+        spec_file = mock_projects / "dev_notes" / "inbox" / "link-test.md"
+        spec_file.write_text("Project: test-project\n\nTest content")
+
+        with patch("pigeon.fileutils.fast_copy") as mock_copy:
+            result = processor.process(spec_file, source="test")
+
+        mock_copy.assert_not_called()
+        archived = mock_projects / "dev_notes" / "inbox-archive" / "link-test.md"
+        assert result.stat().st_ino == archived.stat().st_ino
+
+    def test_name_collisions_get_counter_suffix(self, mock_projects):
+        """Test that routing the same filename twice doesn't overwrite."""
+        processor = RoutingProcessor(mock_projects)
+        source_dir = mock_projects / "dev_notes" / "inbox"
+        archive_dir = mock_projects / "dev_notes" / "inbox-archive"
+
+        results = []
+        for content in ["first", "second"]:
+            spec_file = source_dir / "dup-spec.md"
+            spec_file.write_text(f"Project: test-project\n\n{content}")
+            results.append(processor.process(spec_file, source="test"))
+
+        assert [r.name for r in results] == ["dup-spec.md", "dup-spec_1.md"]
+        assert results[0].read_text().endswith("first")
+        assert results[1].read_text().endswith("second")
+        assert (archive_dir / "dup-spec.md").exists()
+        assert (archive_dir / "dup-spec_1.md").exists()
+
+    def test_process_batch_routes_concurrently(self, mock_projects):
+        """Test that a batch of specs is routed in order, with collisions resolved."""
+        processor = RoutingProcessor(mock_projects)
+        source_dir = mock_projects / "dev_notes" / "inbox"
+
+        spec_files = []
+        for i in range(6):
+            sub_dir = source_dir / f"batch-{i}"
+            sub_dir.mkdir()
+            spec_file = sub_dir / "same-name.md"
+            spec_file.write_text(f"Project: test-project\n\nspec {i}")
+            spec_files.append(spec_file)
+        spec_files.append(mock_projects / "missing.md")
+
+        results = processor.process_batch(spec_files, source="test")
+
+        assert results[-1] is None
+        assert len({r.name for r in results[:-1]}) == 6
+        for i, result in enumerate(results[:-1]):
+            assert result.read_text().endswith(f"spec {i}")
+
+    def test_processed_spec_skips_first_line_read(self, mock_projects):
+        """Test that a ProcessedSpec's first line is used for the bead description."""
+        processor = RoutingProcessor(mock_projects)
+        spec_file = mock_projects / "dev_notes" / "inbox" / "meta-spec.md"
+        spec_file.write_text("Project: test-project\n\nBody")
+
+        with patch("pigeon.processors.routing.read_first_line") as mock_read, patch.object(
+            processor.bead_creator, "create", return_value="bd-1"
+        ) as mock_create:
+            result = processor.process(ProcessedSpec(spec_file, "Known first line"), source="test")
+
+        assert result.name == "meta-spec.md"
+        mock_read.assert_not_called()
+        assert mock_create.call_args.kwargs["description"] == "Known first line"
+
     def test_handles_missing_spec_file(self, mock_projects):
         """Test graceful handling of missing spec file."""
         processor = RoutingProcessor(mock_projects)
@@ -139,3 +209,35 @@ class TestRoutingProcessor:
         if result:
             assert result.exists()
             assert result.name != "duplicate.md" or result.read_text() == "Project: test-project\n\nFirst"
+
+    def test_duplicate_filenames_listed_once(self, mock_projects):
+        """Test that many collisions cost one listing, not one open per name."""
+        processor = RoutingProcessor(mock_projects)
+        spec_file = mock_projects / "dev_notes" / "inbox" / "crowded.md"
+        spec_file.write_text("Project: test-project\n\nNew")
+        target_inbox = mock_projects / "modules" / "test-project" / "dev_notes" / "inbox"
+        target_inbox.mkdir(parents=True, exist_ok=True)
+        for name in ["crowded.md"] + [f"crowded_{i}.md" for i in range(1, 6)]:
+            (target_inbox / name).write_text("Existing content")
+
+        with patch("pigeon.fileutils.os.open", wraps=os.open) as mock_open:
+            result = processor.process(spec_file, source="test")
+
+        assert result == target_inbox / "crowded_6.md"
+        opened = [Path(c.args[0]).name for c in mock_open.call_args_list]
+        assert opened.count("crowded.md") == 2  # target inbox and archive
+        assert not any(name.startswith("crowded_") and name != "crowded_6.md" for name in opened)
+
+    def test_cross_device_copy_stays_in_kernel(self, mock_projects):
+        """Test that a spec that cannot be linked is copied with sendfile."""
+        processor = RoutingProcessor(mock_projects)
+        spec_file = mock_projects / "dev_notes" / "inbox" / "xdev.md"
+        spec_file.write_text("Project: test-project\n\n" + "x" * 10000)
+
+        with patch("pigeon.fileutils.os.link", side_effect=OSError("EXDEV")), patch(
+            "pigeon.fileutils.os.copy_file_range", side_effect=OSError("EXDEV")
+        ), patch("pigeon.fileutils.os.sendfile", wraps=os.sendfile) as mock_sendfile:
+            result = processor.process(spec_file, source="test")
+
+        mock_sendfile.assert_called()
+        assert result.read_text() == "Project: test-project\n\n" + "x" * 10000